@@ -3,98 +3,222 @@
 
 from flask import Flask, request
 from sys import path
+import atexit
+import hmac
 import os
-import logging
+import time
 
-from esun_qa import execLoki
-
-# 載入 json 標準函式庫，處理回傳的資料格式
-import json
+from bot_logging import getLogger
+from esun_qa import execLokiBatch, lokiBreaker
+from line_client import parseWebhook
+from loki_quota import lokiQuota
+from reply_sender import ReplySender
+import faq_search
+import metrics
+from tracing import traced
+from webhook_queue import WebhookQueue
+import tracing
 
 # 載入 LINE Message API 相關函式庫
-from linebot import LineBotApi, WebhookHandler
 from linebot.exceptions import InvalidSignatureError
 from linebot.models import MessageEvent, TextMessage, TextSendMessage, ImageSendMessage
 
+# 非同步模式：webhook 只驗證簽章並放入佇列，由背景 worker 執行 Loki 並回覆
+ASYNC_MODE = os.environ.get("async_mode", "false").lower() in ["1", "true", "yes"]
+WEBHOOK_WORKER = int(os.environ.get("webhook_worker", 4))
+WEBHOOK_QUEUE_SIZE = int(os.environ.get("webhook_queue_size", 1000))
+WEBHOOK_DRAIN = float(os.environ.get("webhook_drain", 10))        # 結束時等待 webhook 佇列處理完的秒數
+# Loki 暫停呼叫 (斷路器 open) 且本機找不到答案時的回覆
+DEGRADED_REPLY = "目前系統忙碌中，暫時無法回答您的問題\n請稍後再試一次，或撥打客服專線 (02)2182-1313"
+# 管理端點 (/admin/trace) 的 token，未設定時不開放
+ADMIN_TOKEN = os.environ.get("admin_token", "")
+
 app = Flask(__name__)
+logger = getLogger(__name__)
 
-@app.route("/", methods=['POST'])
+# /metrics (Prometheus text format，各 gunicorn worker 合併後的結果)
+# 回覆種類：greeting / goodbye / non_text / loki / faq_search / degraded / default (沒辦法回答) / error，fallback 比例 = (faq_search + degraded + default) / 全部
+eventCounter = metrics.counter("line_events_total", "收到的 LINE event 數 (依訊息類型)", ["type"])
+replyCounter = metrics.counter("line_replies_total", "回覆的種類", ["kind"])
+inflightGauge = metrics.gauge("inflight_requests", "處理中的 webhook 數", ["stage"], aggregateSTR="sum")
 
-def linebot():
+# 回覆放入佇列由背景 thread 送出 (重試、replyToken 過期時改用 push，見 reply_sender.py)，不佔住 webhook worker
+replySender = ReplySender()
+# atexit 依註冊的相反順序執行：webhook 佇列在結束前才處理完的回覆，最後再等 replySender 送出
+atexit.register(replySender.drain)
+
+def replyMessage(tk, userId, message, receivedTime):
+    # userId 可能不存在 (群組 / 聊天室中未同意的成員)，此時只能以 replyToken 回覆，不會改用 push
+    if tk is None and userId is None:
+        return
+    replySender.send(tk, userId, message, receivedTime)
+
+def getReplyLIST(resultDICT):
+    replyLIST = []
+    if resultDICT != {} and resultDICT['response'] != []:
+        for response in resultDICT['response']:
+            replyLIST.append(TextSendMessage(response))                                                     # 設定回覆字串
+        
+        if 'imgURL' in resultDICT.keys():
+            for img_url in resultDICT['imgURL']:                                                                # 設定回覆圖片
+                replyLIST.append(ImageSendMessage(original_content_url=img_url, preview_image_url=img_url))
+                
+        replyLIST.append(TextSendMessage("希望有解答您的疑問~"))
+    else:
+        reply = "抱歉，我只是個機器人，沒辦法回答喔"                                                       # 回傳沒有答案時的預設回覆字串
+        replyLIST.append(TextSendMessage(reply))
     
-    body = request.get_data(as_text=True)                # 取得收到的訊息內容
+    return replyLIST
+
+def searchFallback(msg, resultDICT):
+    # Loki 比對不到意圖 (或意圖模組沒有回覆) 時，改以 chatbot.json 本機檢索，分數夠高才回覆
+    searchLIST = faq_search.search(msg)
+    if searchLIST:
+        resultDICT['response'] = ["您想問的是不是「{}」呢？\n{}".format(r['Q'], r['A']) for r in searchLIST]
+        replyCounter.inc(kind="faq_search")
+    elif lokiBreaker.isDegraded() or lokiQuota.isCritical():
+        # Loki 斷路器 open 或字數即將用完 (降級模式)，本機也找不到答案時回覆忙碌訊息，而不是「沒辦法回答」
+        resultDICT['response'] = [DEGRADED_REPLY]
+        replyCounter.inc(kind="degraded")
+    else:
+        replyCounter.inc(kind="default")
+    return resultDICT
+
+@traced("handleMessage")
+def handleMessage(json_data, receivedTime):
+    inflightGauge.inc(stage="handler")
     try:
-        json_data = json.loads(body)                         # json 格式化訊息內容
-        access_token = os.environ.get("access_token")        # 輸入 token
-        secret = os.environ.get("channel_secret")            # 輸入 secret
-        line_bot_api = LineBotApi(access_token)              # 確認 token 是否正確
-        handler = WebhookHandler(secret)                     # 確認 secret 是否正確
-        signature = request.headers['X-Line-Signature']      # 加入回傳的 headers
-        handler.handle(body, signature)                      # 綁定訊息回傳的相關資訊
-        tk = json_data['events'][0]['replyToken']            # 取得回傳訊息的 Token
-        type = json_data['events'][0]['message']['type']     # 取得 LINE 收到的訊息類型
-        
-        ############### message handling ###############
-        if type=='text':
-            msg = json_data['events'][0]['message']['text']  # 取得 LINE 收到的文字訊息
-            print(msg)                                       # 印出內容
+        processMessage(json_data, receivedTime)
+    finally:
+        inflightGauge.dec(stage="handler")
+
+def processMessage(json_data, receivedTime):
+    filterLIST = []
+    splitLIST = ["！", "。", "？", "!", ",", "\n", "；", "\u3000", ";"]
+    refDICT = {}
+    
+    lokiEventLIST = []                                   # 需要 Loki 語意判斷的 event，最後合併成一次 execLokiBatch()
+    replyDICT = {}                                       # event 順序 => (replyToken, userId, 回覆訊息)，最後依 event 順序回覆
+    for indexINT, event in enumerate(json_data['events']):
+        try:
+            if event['type'] != 'message':                   # 只處理訊息 event (略過 follow、unfollow 等)
+                eventCounter.inc(type=event['type'])
+                continue
             
-            filterLIST = []
-            splitLIST = ["！", "。", "？", "!", ",", "\n", "；", "\u3000", ";"]
-            refDICT = {}
+            tk = event['replyToken']                         # 取得回傳訊息的 Token
+            userId = event['source'].get('userId')           # 取得使用者 ID (replyToken 過期時使用，群組中未同意的成員沒有 userId)
+            type = event['message']['type']                  # 取得 LINE 收到的訊息類型
+            eventCounter.inc(type=type)
             
-            if msg.lower() in ["哈囉","嗨","你好","您好","hi","hello"]:
-                line_bot_api.reply_message(tk,TextSendMessage(msg + "!\n" + "我是銀行客服機器人\n請問您今天想問什麼呢?"))                                                        # 回傳文字訊息                
-                
-            elif msg.lower() in ["掰掰","掰","88","bye bye","bye","再見", "沒有", "拜拜"]:
-                line_bot_api.reply_message(tk,TextSendMessage("掰掰，謝謝您的使用，期待下次為您服務!"))                                                        # 回傳文字訊息                
+            ############### message handling ###############
+            if type=='text':
+                msg = event['message']['text']               # 取得 LINE 收到的文字訊息
+                logger.debug("message: %s", msg)            # 使用者的訊息內容只在 DEBUG 等級輸出
                 
-            else:
-                try:
-                    resultDICT = execLoki(str(msg), filterLIST=filterLIST, refDICT=refDICT, splitLIST=splitLIST)   # Loki語意判斷
-                    print("loki complete")
-                    print(resultDICT)
+                if msg.lower() in ["哈囉","嗨","你好","您好","hi","hello"]:
+                    replyCounter.inc(kind="greeting")
+                    replyDICT[indexINT] = (tk, userId, TextSendMessage(msg + "!\n" + "我是銀行客服機器人\n請問您今天想問什麼呢?"))   # 回傳文字訊息
                     
-                    if resultDICT != {}:
-                        replyLIST = []                        
-                        if resultDICT['response'] != []:
-                            for response in resultDICT['response']:
-                                replyLIST.append(TextSendMessage(response))                                                     # 設定回覆字串
-                            
-                            if 'imgURL' in resultDICT.keys():
-                                for img_url in resultDICT['imgURL']:                                                                # 設定回覆圖片
-                                    replyLIST.append(ImageSendMessage(original_content_url=img_url, preview_image_url=img_url))
-                                    
-                            replyLIST.append(TextSendMessage("希望有解答您的疑問~"))
-                            line_bot_api.reply_message(tk,replyLIST)                                                        # 回傳文字訊息
-                        else:
-                            reply = "抱歉，我只是個機器人，沒辦法回答喔"                                                       # 回傳沒有答案時的預設回覆字串
-                            line_bot_api.reply_message(tk,TextSendMessage(reply))                                           # 回傳訊息
-                            
-                    else:
-                        reply = "抱歉，我只是個機器人，沒辦法回答喔"    # 回傳沒有答案時的預設回覆字串
-                        line_bot_api.reply_message(tk,TextSendMessage(reply)) # 回傳訊息
-                            
-                except Exception as e:
-                    print("[ERROR] => {}".format(str(e)))
-                    print(body)                                                                        # 如果發生錯誤，印出收到的內容                    
-                    reply = "抱歉發生一些問題\n請再試一次"   # 錯誤時回覆
-                    line_bot_api.reply_message(tk,TextSendMessage(reply)) # 回傳訊息
-                        
-        else:
-            reply = '不是文字，我可是不吃的喔!\n請再試一次~'   # 非文字訊息時回覆
-            line_bot_api.reply_message(tk,TextSendMessage(reply)) # 回傳訊息
-            
+                elif msg.lower() in ["掰掰","掰","88","bye bye","bye","再見", "沒有", "拜拜"]:
+                    replyCounter.inc(kind="goodbye")
+                    replyDICT[indexINT] = (tk, userId, TextSendMessage("掰掰，謝謝您的使用，期待下次為您服務!"))                  # 回傳文字訊息
+                    
+                else:
+                    lokiEventLIST.append((indexINT, event))
+                    
+            else:
+                reply = '不是文字，我可是不吃的喔!\n請再試一次~'   # 非文字訊息時回覆
+                replyCounter.inc(kind="non_text")
+                replyDICT[indexINT] = (tk, userId, TextSendMessage(reply)) # 回傳訊息
+                
+        except Exception as e:
+            logger.error("[ERROR] => %s", str(e))
+            logger.debug("event: %s", event)                                                   # 如果發生錯誤，印出收到的內容 (DEBUG)
+            reply = "抱歉發生一些問題~\n請再試一次"   # 錯誤時回覆
+            replyCounter.inc(kind="error")
+            replyDICT[indexINT] = (event.get('replyToken'), event.get('source', {}).get('userId'), TextSendMessage(reply)) # 回傳訊息 (replyToken 已使用過時自動改用 push)
+    
+    if lokiEventLIST:
+        try:
+            msgLIST = [str(event['message']['text']) for indexINT, event in lokiEventLIST]
+            resultLIST = execLokiBatch(msgLIST, filterLIST=filterLIST, refDICT=refDICT, splitLIST=splitLIST)   # Loki語意判斷 (整批只呼叫 ceil(句數/INPUT_LIMIT) 次)
+            logger.debug("loki complete: %s", resultLIST)
+        except Exception as e:
+            logger.error("[ERROR] => %s", str(e))
+            logger.debug("json_data: %s", json_data)                                           # 如果發生錯誤，印出收到的內容 (DEBUG)
+            resultLIST = [None] * len(lokiEventLIST)
+        
+        # 每個 event 使用各自的 replyToken 回覆
+        for (indexINT, event), resultDICT in zip(lokiEventLIST, resultLIST):
+            tk = event['replyToken']
+            userId = event['source'].get('userId')
+            try:
+                if resultDICT is None:
+                    raise Exception("execLokiBatch failed")
+                if not resultDICT.get('response'):
+                    resultDICT = searchFallback(str(event['message']['text']), resultDICT)
+                else:
+                    replyCounter.inc(kind="loki")
+                replyDICT[indexINT] = (tk, userId, getReplyLIST(resultDICT))                    # 回傳文字訊息
+            except Exception as e:
+                logger.error("[ERROR] => %s", str(e))
+                reply = "抱歉發生一些問題\n請再試一次"   # 錯誤時回覆
+                replyCounter.inc(kind="error")
+                replyDICT[indexINT] = (tk, userId, TextSendMessage(reply)) # 回傳訊息
+    
+    # 依 event 在 webhook 中的順序回覆 (打招呼、非文字訊息不會搶在前面的問題之前送出)
+    for indexINT in sorted(replyDICT):
+        tk, userId, message = replyDICT[indexINT]
+        replyMessage(tk, userId, message, receivedTime)
+
+webhookQueue = WebhookQueue(handleMessage, workerINT=WEBHOOK_WORKER, queueSizeINT=WEBHOOK_QUEUE_SIZE, drainFLOAT=WEBHOOK_DRAIN)
+
+@app.route("/", methods=['POST'])
+@traced("linebot")
+def linebot():
+    metrics.startExporter()                              # 每個 worker 定期寫出 metrics snapshot (只會啟動一次)
+    inflightGauge.inc(stage="webhook")
+    try:
+        return receiveWebhook()
+    finally:
+        inflightGauge.dec(stage="webhook")
+
+def receiveWebhook():
+    receivedTime = time.time()                           # 記錄收到 webhook 的時間
+    body = request.get_data()                            # 取得收到的訊息內容 (bytes，驗證簽章不需要先 decode)
+    try:
+        signature = request.headers['X-Line-Signature']      # 加入回傳的 headers
+        json_data = parseWebhook(body, signature)            # 驗證簽章後只 json 格式化一次
+        
     except Exception as e:
-        print("[ERROR] => {}".format(str(e)))
-        print(body)                                                                        # 如果發生錯誤，印出收到的內容
-        json_data = json.loads(body)                                                       # json 格式化訊息內容
-        reply = "抱歉發生一些問題~\n請再試一次"   # 錯誤時回覆
-        if json_data['events'] != []:
-            line_bot_api.push_message(json_data['events'][0]['source']['userId'],TextSendMessage(reply)) # 回傳訊息
+        logger.error("[ERROR] => %s", str(e))
+        logger.debug("body: %s", body)                                                     # 如果發生錯誤，印出收到的內容 (DEBUG)
+        return 'OK'
+    
+    if json_data['events'] != []:
+        if ASYNC_MODE:
+            webhookQueue.put(json_data, receivedTime)        # 放入佇列後立即回傳，由背景 worker 回覆
+        else:
+            handleMessage(json_data, receivedTime)
         
     return 'OK'                                                                       # 驗證 Webhook 使用，不能省略   
 
+@app.route("/metrics", methods=['GET'])
+def metricsExposition():
+    metrics.startExporter()
+    return metrics.render(metrics.collect()), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+@app.route("/admin/trace", methods=['GET'])
+def adminTrace():
+    # 各階段耗時的 p50 / p95 / p99 (毫秒，所有 worker 合併) 與最近的 span，?limit=N 指定 span 數，?trace=ID 只看單一 trace
+    # span 只存在處理這個請求的 worker 的記憶體中，以 pid 標示
+    if not ADMIN_TOKEN or not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), ADMIN_TOKEN):
+        return 'Not Found', 404
+    limitINT = request.args.get('limit', 100, type=int)
+    traceID = request.args.get('trace', None, type=int)
+    metrics.startExporter()
+    return {"stages": tracing.getStageStats(), "pid": os.getpid(), "spans": tracing.getRecentSpanLIST(limitINT, traceID)}
+
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port)
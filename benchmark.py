@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+效能測試工具
+
+所有測試都在本機進行，Loki API 以 stubServer 模擬，不會消耗 word_count_balance。
+
+範例：
+    python3 benchmark.py session --count 500 --delay 0.005
+    python3 benchmark.py dispatch
+    python3 benchmark.py startup
+    python3 benchmark.py merge --size 1000 10000
+    python3 benchmark.py batch --thread 50 --count 20 --delay 0.05
+    python3 benchmark.py search
+    python3 benchmark.py hedge --count 1000 --slow-rate 0.03 --slow-delay 0.5
+    python3 benchmark.py async --delay 0.05
+    python3 benchmark.py log --count 100000
+    python3 benchmark.py metrics --count 100000 --worker 8
+    python3 benchmark.py line --count 2000 --events 3
+    python3 benchmark.py reply --count 200 --delay 0.1
+"""
+
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import json
+import math
+import socket
+import time
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    模擬 Loki BulkAPI：依 input_list 回傳相同數量的 "No matching Intent."
+    """
+    protocol_version = "HTTP/1.1"      # 支援 keep-alive
+    delay = 0.0
+
+    def setup(self):
+        super().setup()
+        # 關閉 Nagle，避免 keep-alive 時 header / body 分開送出遇到 delayed ACK
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        bodySTR = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            inputLIST = json.loads(bodySTR).get("input_list", [])
+        except Exception:
+            inputLIST = []
+        if self.delay:
+            time.sleep(self.delay)
+
+        resultBYTES = json.dumps({
+            "status": True,
+            "msg": "Success!",
+            "version": "stub",
+            "word_count_balance": 10000,
+            "result_list": [{"status": False, "msg": "No matching Intent."} for i in inputLIST]
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(resultBYTES)))
+        self.end_headers()
+        self.wfile.write(resultBYTES)
+
+    def log_message(self, *args):
+        pass
+
+def startStubServer(delay=0.0, handlerCLASS=StubHandler):
+    handler = type("Handler", (handlerCLASS,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:{}/Loki/BulkAPI/".format(server.server_address[1])
+
+def getPercentile(valueLIST, percentile):
+    if not valueLIST:
+        return math.nan
+    sortedLIST = sorted(valueLIST)
+    return sortedLIST[min(len(sortedLIST) - 1, int(math.ceil(percentile / 100 * len(sortedLIST))) - 1)]
+
+def printLatency(nameSTR, latencyLIST):
+    print("{:<24} n={:<6} p50={:8.3f}ms  p99={:8.3f}ms  mean={:8.3f}ms".format(
+        nameSTR, len(latencyLIST),
+        getPercentile(latencyLIST, 50) * 1000,
+        getPercentile(latencyLIST, 99) * 1000,
+        sum(latencyLIST) / len(latencyLIST) * 1000))
+
+def benchSession(args):
+    """
+    比較 requests.post() (每次新連線) 與 loki_session.post() (共用連線池) 的延遲
+    """
+    import requests
+    import loki_session
+
+    server, url = startStubServer(args.delay)
+    payload = {"username": "bench", "loki_key": "bench", "input_list": ["如何開卡"], "filter_list": []}
+    for nameSTR, postFUNC in [("requests.post", requests.post), ("loki_session.post", loki_session.post)]:
+        latencyLIST = []
+        for i in range(args.count):
+            startTime = time.perf_counter()
+            postFUNC(url, json=payload).json()
+            latencyLIST.append(time.perf_counter() - startTime)
+        printLatency(nameSTR, latencyLIST)
+    server.shutdown()
+
+def benchDispatch(args):
+    """
+    比較意圖模組的 utterance 查表 (utteranceDICT) 與原本逐一 if utterance == 比對的耗時
+    測試句取自 esun_qa.TEST_INPUT_DICT，utterance / 參數由 local_matcher 在本機取得
+    """
+    import esun_qa
+    import local_matcher
+
+    caseLIST = []
+    for intentSTR, inputLIST in esun_qa.TEST_INPUT_DICT.items():
+        module = esun_qa.lokiIntentDICT[intentSTR]
+        module.DEBUG = False
+        for inputSTR in inputLIST:
+            matchDICT = local_matcher.localMatcher.match(inputSTR, [intentSTR])
+            if matchDICT:
+                for resultDICT in matchDICT["results"]:
+                    # 需要連線的 handler (例如 deposit 呼叫 Articut) 不列入測試
+                    try:
+                        startTime = time.perf_counter()
+                        module.utteranceDICT[resultDICT["utterance"]](inputSTR, resultDICT["utterance"], list(resultDICT["argument"]), {"response": []}, {}, "")
+                        if time.perf_counter() - startTime > 0.01:
+                            continue
+                    except Exception:
+                        continue
+                    caseLIST.append((module, inputSTR, resultDICT["utterance"], resultDICT["argument"]))
+    print("{} cases from {} sentences".format(len(caseLIST), sum(len(v) for v in esun_qa.TEST_INPUT_DICT.values())))
+
+    def linearDispatch(module, inputSTR, utteranceSTR, argLIST, callBOOL):
+        # 原本的寫法：每個 if 都會比對，即使前面已經比對成功
+        for key, handlerFUNC in module.utteranceDICT.items():
+            if utteranceSTR == key and callBOOL:
+                handlerFUNC(inputSTR, utteranceSTR, list(argLIST), {"response": []}, {}, "")
+
+    def dictDispatch(module, inputSTR, utteranceSTR, argLIST, callBOOL):
+        handlerFUNC = module.utteranceDICT.get(utteranceSTR)
+        if handlerFUNC is not None and callBOOL:
+            handlerFUNC(inputSTR, utteranceSTR, list(argLIST), {"response": []}, {}, "")
+
+    for callBOOL in [False, True]:
+        for nameSTR, dispatchFUNC in [("if-chain", linearDispatch), ("dict", dictDispatch)]:
+            startTime = time.perf_counter()
+            for i in range(args.repeat):
+                for module, inputSTR, utteranceSTR, argLIST in caseLIST:
+                    dispatchFUNC(module, inputSTR, utteranceSTR, argLIST, callBOOL)
+            elapsedFLOAT = time.perf_counter() - startTime
+            print("{:<24} {:8.3f}us / call".format(
+                "{} ({})".format(nameSTR, "with handler" if callBOOL else "lookup only"),
+                elapsedFLOAT / (args.repeat * len(caseLIST)) * 1e6))
+
+def benchStartup(args):
+    """
+    在新的 python 行程中量測 import esun_qa 的時間與 RSS，
+    並與載入全部意圖模組 (舊版啟動時的行為) 比較
+    """
+    import os
+    import subprocess
+    import sys
+
+    codeSTR = """
+import json, resource, time
+startTime = time.perf_counter()
+import esun_qa
+importFLOAT = time.perf_counter() - startTime
+importRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+startTime = time.perf_counter()
+for intentSTR in list(esun_qa.lokiIntentDICT.keys()):
+    esun_qa.lokiIntentDICT[intentSTR]
+allFLOAT = time.perf_counter() - startTime
+allRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([importFLOAT, importRSS, allFLOAT, allRSS]))
+"""
+    resultLIST = []
+    for i in range(args.repeat):
+        outputSTR = subprocess.check_output([sys.executable, "-c", codeSTR], cwd=os.path.dirname(os.path.abspath(__file__)))
+        resultLIST.append(json.loads(outputSTR.decode("utf-8").strip().split("\n")[-1]))
+
+    importLIST = [r[0] for r in resultLIST]
+    eagerLIST = [r[0] + r[2] for r in resultLIST]
+    print("{:<24} import={:8.1f}ms  maxrss={:8.1f}MB".format("lazy (import only)", getPercentile(importLIST, 50) * 1000, resultLIST[-1][1] / 1024))
+    print("{:<24} import={:8.1f}ms  maxrss={:8.1f}MB".format("eager (all intents)", getPercentile(eagerLIST, 50) * 1000, resultLIST[-1][3] / 1024))
+
+def benchMerge(args):
+    """
+    比較舊版 execLoki() (每批 deepcopy 累積中的 resultDICT) 與 ResultMerger 單次合併的耗時
+    LokiResult 以 stub 取代，每句都比對到同一個假意圖並回覆一段約 200 字的文字
+    """
+    from copy import deepcopy
+    import esun_qa
+    import types
+
+    responseSTR = "若您當月符合有至少其中一項條件，即可享有優惠。" * 8
+    stubIntent = types.SimpleNamespace(getResult=lambda inputSTR, utterance, args, resultDICT, refDICT, pattern="": (resultDICT["response"].append(responseSTR) or resultDICT))
+    esun_qa.lokiIntentDICT.modulePathDICT["bench"] = "bench"
+    esun_qa.lokiIntentDICT.moduleDICT["bench"] = stubIntent
+
+    class StubLokiResult(esun_qa.LokiResult):
+        def __init__(self, inputLIST, filterLIST):
+            self.status = True
+            self.message = "Success!"
+            self.version = "stub"
+            self.balance = -1
+            self.lokiResultLIST = [{"status": True, "msg": "Success!", "results": [{"intent": "bench", "pattern": "", "utterance": inputSTR, "argument": []}]} for inputSTR in inputLIST]
+
+    esun_qa.LokiResult = StubLokiResult
+    esun_qa.LOKI_CONCURRENCY = 1                # 只量測合併，不含平行呼叫
+
+    def legacyMergeResult(resultDICT, lokiResultDICT):
+        for k in lokiResultDICT:
+            if k not in resultDICT:
+                resultDICT[k] = []
+            if type(resultDICT[k]) != list:
+                resultDICT[k] = [resultDICT[k]] if resultDICT[k] else []
+            if type(lokiResultDICT[k]) == list:
+                resultDICT[k].extend(lokiResultDICT[k])
+            else:
+                resultDICT[k].append(lokiResultDICT[k])
+        return resultDICT
+
+    def legacyRunLoki(inputLIST, filterLIST=[], refDICT={}):
+        resultDICT = deepcopy(refDICT)
+        lokiRst = StubLokiResult(inputLIST, filterLIST)
+        for index, key in enumerate(inputLIST):
+            legacyMergeResult(resultDICT, esun_qa.runIntent(lokiRst, index, key, refDICT))
+        return resultDICT
+
+    def legacyExecLoki(inputLIST, refDICT):
+        resultDICT = deepcopy(refDICT)
+        for i in range(0, math.ceil(len(inputLIST) / esun_qa.INPUT_LIMIT)):
+            resultDICT = legacyRunLoki(inputLIST[i*esun_qa.INPUT_LIMIT:(i+1)*esun_qa.INPUT_LIMIT], refDICT=resultDICT)
+        return resultDICT
+
+    for sizeINT in args.size:
+        inputLIST = ["測試句{}".format(i) for i in range(sizeINT)]
+        for nameSTR, execFUNC in [("deepcopy", legacyExecLoki), ("ResultMerger", esun_qa.execLoki)]:
+            latencyLIST = []
+            for i in range(args.repeat):
+                startTime = time.perf_counter()
+                resultDICT = execFUNC(inputLIST, refDICT={"response": []})
+                latencyLIST.append(time.perf_counter() - startTime)
+            assert len(resultDICT["response"]) == sizeINT
+            printLatency("{} ({})".format(nameSTR, sizeINT), latencyLIST)
+
+def benchBatch(args):
+    """
+    多個 thread 同時各送一句，比較開啟 / 關閉 loki_batcher 微批次時的吞吐量與 BulkAPI 呼叫次數
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import esun_qa
+    import local_matcher
+
+    countLIST = []
+
+    class CountingHandler(StubHandler):
+        def do_POST(self):
+            countLIST.append(1)
+            super().do_POST()
+
+    server, url = startStubServer(args.delay, CountingHandler)
+    esun_qa.LOKI_URL = url
+    esun_qa.lokiCache.maxSizeINT = 0            # 每句都要送到 Loki
+    local_matcher.LOCAL_MATCHER = False
+
+    for nameSTR, windowFLOAT in [("no batching", 0), ("batch {}ms".format(args.window), args.window / 1000)]:
+        esun_qa.lokiBatcher.windowFLOAT = windowFLOAT
+        countLIST.clear()
+        latencyLIST = []
+
+        def send(i):
+            startTime = time.perf_counter()
+            esun_qa.requestLoki(["測試句{}".format(i)], [])
+            latencyLIST.append(time.perf_counter() - startTime)
+
+        startTime = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.thread) as executor:
+            list(executor.map(send, range(args.thread * args.count)))
+        elapsedFLOAT = time.perf_counter() - startTime
+        printLatency(nameSTR, latencyLIST)
+        print("{:<24} {:8.1f} sentences/s  {} BulkAPI calls".format("", len(latencyLIST) / elapsedFLOAT, len(countLIST)))
+    server.shutdown()
+
+def benchSearch(args):
+    """
+    量測 faq_search 在整個 chatbot.json 上的 build 時間與查詢延遲 (numpy 向量化 vs 純 Python)
+    查詢句為所有 document 的 Q 加上 esun_qa.TEST_INPUT_DICT 的測試句
+    """
+    import esun_qa
+    import faq_search
+
+    startTime = time.perf_counter()
+    indexDICT = faq_search.build()
+    print("{:<24} {:8.1f}ms  {} documents, {} terms, {} postings".format(
+        "build", (time.perf_counter() - startTime) * 1000, len(indexDICT["documents"]), len(indexDICT["terms"]), len(indexDICT["indices"])))
+
+    queryLIST = [documentLIST[1] for documentLIST in indexDICT["documents"]]
+    for inputLIST in esun_qa.TEST_INPUT_DICT.values():
+        queryLIST.extend(inputLIST)
+
+    numpyModule = faq_search.np
+    for nameSTR, module in [("numpy", numpyModule), ("pure python", None)]:
+        if nameSTR == "numpy" and module is None:
+            print("{:<24} numpy is not installed".format(nameSTR))
+            continue
+        faq_search.np = module
+        faqSearch = faq_search.FaqSearch()
+        faqSearch.getDocumentLIST()
+        latencyLIST = []
+        for i in range(args.repeat):
+            for inputSTR in queryLIST:
+                startTime = time.perf_counter()
+                faqSearch.search(inputSTR)
+                latencyLIST.append(time.perf_counter() - startTime)
+        printLatency(nameSTR, latencyLIST)
+    faq_search.np = numpyModule
+
+def benchHedge(args):
+    """
+    stub server 以 --slow-rate 的機率延遲 --slow-delay 秒 (其餘為 --delay 秒)，
+    比較開啟 / 關閉 loki_hedge 對沖請求時 callLoki 的延遲分布與額外送出的字數
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import random
+    import esun_qa
+    import loki_hedge
+
+    randomGen = random.Random(args.seed)
+
+    class SlowHandler(StubHandler):
+        def do_POST(self):
+            time.sleep(args.slow_delay if randomGen.random() < args.slow_rate else args.delay)
+            super().do_POST()
+
+    server, url = startStubServer(0.0, SlowHandler)
+    esun_qa.LOKI_URL = url
+    esun_qa.lokiBreaker.enableBOOL = False
+    inputLIST = ["如何開卡", "信用卡遺失怎麼辦"]
+
+    for nameSTR, enableBOOL in [("no hedge", False), ("hedge p{:g}".format(args.percentile), True)]:
+        hedger = loki_hedge.Hedger(esun_qa.callLoki, percentileFLOAT=args.percentile, budgetFLOAT=args.budget, minBalanceINT=0, enableBOOL=enableBOOL)
+        latencyLIST = []
+
+        def send(i):
+            startTime = time.perf_counter()
+            hedger.call(inputLIST, [])
+            latencyLIST.append(time.perf_counter() - startTime)
+
+        wordINT = loki_hedge.hedgeWordCounter.getValue()
+        with ThreadPoolExecutor(max_workers=args.thread) as executor:
+            list(executor.map(send, range(args.count)))
+        printLatency(nameSTR, latencyLIST)
+        statDICT = hedger.getStats()
+        print("{:<24} hedge={} / {} calls ({:.1%})  extra words={}".format(
+            "", statDICT["hedge"], statDICT["call"], statDICT["hedge"] / max(1, statDICT["call"]),
+            int(loki_hedge.hedgeWordCounter.getValue() - wordINT)))
+    server.shutdown()
+
+def benchAsync(args):
+    """
+    以 esun_qa.TEST_INPUT_DICT (testIntent() 的測試句) 比較 execLoki() 與 execLoki_async()：
+    同步版本依序處理每個意圖，asyncio 版本以 asyncio.gather 同時處理，並確認兩者的 resultDICT 完全相同
+    stub server 以 local_matcher 回傳實際的意圖比對結果，所有快取都關閉，每句都送到 stub
+    """
+    import asyncio
+    import esun_qa
+    import faq_index
+    import local_matcher
+    import loki_session
+
+    class MatchHandler(StubHandler):
+        def do_POST(self):
+            payloadDICT = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if self.delay:
+                time.sleep(self.delay)
+            resultLIST = []
+            for inputSTR in payloadDICT["input_list"]:
+                resultDICT = local_matcher.localMatcher.match(inputSTR, payloadDICT.get("filter_list", []))
+                resultLIST.append(resultDICT or {"status": False, "msg": "No matching Intent."})
+            resultBYTES = json.dumps({"status": True, "msg": "Success!", "version": "stub", "result_list": resultLIST}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(resultBYTES)))
+            self.end_headers()
+            self.wfile.write(resultBYTES)
+
+    server, url = startStubServer(args.delay, MatchHandler)
+    esun_qa.LOKI_URL = url
+    esun_qa.lokiCache.maxSizeINT = 0
+    esun_qa.lokiDiskCache.enableBOOL = False
+    esun_qa.lokiNegativeCache.capacityINT = 0
+    esun_qa.lokiQuota.enableBOOL = False
+    esun_qa.lokiBatcher.windowFLOAT = 0
+    faq_index.FAQ_INDEX = False
+    local_matcher.LOCAL_MATCHER = False
+    for intentSTR in esun_qa.TEST_INPUT_DICT:
+        module = esun_qa.lokiIntentDICT[intentSTR]
+        module.DEBUG = False
+        # 意圖模組以 random.sample 隨機挑選回覆，比較結果時固定取第一個
+        module.sample = lambda populationLIST, k: list(populationLIST[:k])
+
+    # deposit 的 handler 會呼叫 Articut (需要連線與帳號)，不列入測試
+    testInputDICT = {intentSTR: inputLIST for intentSTR, inputLIST in esun_qa.TEST_INPUT_DICT.items() if intentSTR != "deposit"}
+
+    def runSync():
+        return {intentSTR: esun_qa.execLoki(inputLIST, [intentSTR], refDICT={"response": []})
+                for intentSTR, inputLIST in testInputDICT.items()}
+
+    async def runAsync():
+        try:
+            resultLIST = await asyncio.gather(*[esun_qa.execLoki_async(inputLIST, [intentSTR], refDICT={"response": []})
+                                                for intentSTR, inputLIST in testInputDICT.items()])
+        finally:
+            await loki_session.closeAsyncSession()
+        return dict(zip(testInputDICT, resultLIST))
+
+    sentenceINT = sum(len(inputLIST) for inputLIST in testInputDICT.values())
+    resultDICT = {}
+    for nameSTR, runFUNC in [("execLoki", runSync), ("execLoki_async", lambda: asyncio.run(runAsync()))]:
+        latencyLIST = []
+        for i in range(args.repeat):
+            startTime = time.perf_counter()
+            resultDICT[nameSTR] = runFUNC()
+            latencyLIST.append(time.perf_counter() - startTime)
+        printLatency("{} ({})".format(nameSTR, sentenceINT), latencyLIST)
+
+    diffLIST = [intentSTR for intentSTR in testInputDICT if resultDICT["execLoki"][intentSTR] != resultDICT["execLoki_async"][intentSTR]]
+    responseINT = sum(len(r["response"]) for r in resultDICT["execLoki"].values())
+    print("{:<24} {} intents, {} responses, {} different {}".format("", len(testInputDICT), responseINT, len(diffLIST), diffLIST))
+    server.shutdown()
+
+def benchLog(args):
+    """
+    比較意圖模組 debugInfo() 原本的 print() 與 bot_logging (等級關閉 / 開啟並經由佇列寫出) 每次呼叫的耗時
+    輸出都寫到 os.devnull，print() 以 flush=True 模擬 container 中未緩衝的 stdout
+    """
+    import logging
+    import os
+    import bot_logging
+
+    devnull = open(os.devnull, "w")
+    handler = bot_logging.setup()
+    handler.outputHandler.setStream(devnull)
+    logger = bot_logging.getLogger("intent.Loki_bench")
+    inputSTR = "信用卡遺失怎麼辦"
+    utteranceSTR = "信用卡遺失怎麼辦"
+
+    def printInfo():
+        print("[bench] {} ===> {}".format(inputSTR, utteranceSTR), file=devnull, flush=True)
+
+    def logInfo():
+        logger.debug("[bench] %s ===> %s", inputSTR, utteranceSTR)
+
+    for nameSTR, levelINT, debugFUNC in [("print", logging.WARNING, printInfo),
+                                         ("logger (WARNING)", logging.WARNING, logInfo),
+                                         ("logger (DEBUG, queued)", logging.DEBUG, logInfo)]:
+        logger.setLevel(levelINT)
+        startTime = time.perf_counter()
+        for i in range(args.count):
+            debugFUNC()
+        elapsedFLOAT = time.perf_counter() - startTime
+        bot_logging.flush(timeoutFLOAT=10)
+        print("{:<24} {:8.3f}us/call".format(nameSTR, elapsedFLOAT / args.count * 1e6))
+    logger.setLevel(logging.NOTSET)
+
+def benchMetrics(args):
+    """
+    hot path 上記錄一次 metric 的耗時，以及 /metrics 合併 --worker 個 worker 的 snapshot 檔並格式化的耗時
+    (worker 的 snapshot 以目前行程的數值複製，每個 metric 都有資料)
+    """
+    import os
+    import shutil
+    import tempfile
+    import esun_qa
+    import metrics
+
+    counter = metrics.counter("bench_total", "benchmark", ["result"])
+    histogram = metrics.histogram("bench_seconds", "benchmark")
+    gauge = metrics.gauge("bench_inflight", "benchmark", aggregateSTR="sum")
+    for nameSTR, recordFUNC in [("counter.inc", lambda: counter.inc(result="ok")),
+                                ("histogram.observe", lambda: histogram.observe(0.12)),
+                                ("gauge.inc + dec", lambda: (gauge.inc(), gauge.dec()))]:
+        startTime = time.perf_counter()
+        for i in range(args.count):
+            recordFUNC()
+        print("{:<24} {:8.3f}us/call".format(nameSTR, (time.perf_counter() - startTime) / args.count * 1e6))
+
+    # 每個 metric 都放一些資料，模擬執行一段時間後的 snapshot
+    for intentSTR in esun_qa.lokiIntentDICT.keys():
+        esun_qa.intentCounter.inc(intent=intentSTR)
+        metrics.histogram("pipeline_stage_seconds", "").observe(0.001, stage="intent." + intentSTR)
+    esun_qa.lokiLatencyHistogram.observe(0.3)
+
+    dirSTR = tempfile.mkdtemp()
+    try:
+        exporter = metrics.Exporter(dirSTR=dirSTR)
+        # 模擬的 worker 檔案都視為還在執行，不合併進 retired.json
+        exporter.isRetired = lambda fileDICT, workerDICT: False
+        for i in range(args.worker):
+            snapshotSTR = json.dumps({"pid": 1000000 + i, "start": time.time(), "time": time.time(), "metrics": metrics.getSnapshot()})
+            with open(os.path.join(dirSTR, "{}-0.json".format(1000000 + i)), "w") as f:
+                f.write(snapshotSTR)
+
+        startTime = time.perf_counter()
+        exporter.write()
+        print("{:<24} {:8.3f}ms ({} bytes)".format("write snapshot", (time.perf_counter() - startTime) * 1000, len(snapshotSTR)))
+        latencyLIST = []
+        for i in range(20):
+            startTime = time.perf_counter()
+            textSTR = metrics.render(exporter.collect())
+            latencyLIST.append(time.perf_counter() - startTime)
+        printLatency("collect + render ({} workers)".format(args.worker + 1), latencyLIST)
+        print("{:<24} {} lines".format("", textSTR.count("\n")))
+    finally:
+        shutil.rmtree(dirSTR)
+
+def benchLine(args):
+    """
+    webhook 每個請求的固定成本：原本的 json.loads() + WebhookHandler(secret).handle() + LineBotApi(access_token)
+    vs line_client.parseWebhook() + getLineBotApi()；以及 reply_message() 經由 SDK 預設的 RequestsHttpClient
+    (每次新連線) vs PooledHttpClient (共用連線池)，回覆送到本機的 stub server
+    """
+    import base64
+    import hashlib
+    import hmac
+    import tracemalloc
+    from linebot import LineBotApi, WebhookHandler
+    from linebot.models import TextSendMessage
+    import line_client
+
+    secretSTR = "bench_secret"
+    eventLIST = [{
+        "type": "message", "mode": "active", "timestamp": 1700000000000, "webhookEventId": "bench{}".format(i),
+        "deliveryContext": {"isRedelivery": False}, "replyToken": "token{}".format(i),
+        "source": {"type": "user", "userId": "U" + "0" * 32},
+        "message": {"id": str(i), "type": "text", "quoteToken": "q", "text": "信用卡遺失怎麼辦"}
+    } for i in range(args.events)]
+    bodySTR = json.dumps({"destination": "U" + "1" * 32, "events": eventLIST}, ensure_ascii=False)
+    bodyBYTES = bodySTR.encode("utf-8")
+    signatureSTR = base64.b64encode(hmac.new(secretSTR.encode("utf-8"), bodyBYTES, hashlib.sha256).digest()).decode("utf-8")
+
+    def oldWebhook():
+        body = bodyBYTES.decode("utf-8")
+        json_data = json.loads(body)
+        WebhookHandler(secretSTR).handle(body, signatureSTR)
+        LineBotApi("bench_token")
+        return json_data
+
+    def newWebhook():
+        json_data = line_client.parseWebhook(bodyBYTES, signatureSTR, secretSTR.encode("utf-8"))
+        line_client.getLineBotApi("bench_token")
+        return json_data
+
+    for nameSTR, webhookFUNC in [("per-request client", oldWebhook), ("line_client", newWebhook)]:
+        webhookFUNC()
+        tracemalloc.start()
+        webhookFUNC()
+        sizeINT, peakINT = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        startTime = time.perf_counter()
+        for i in range(args.count):
+            webhookFUNC()
+        print("{:<24} {:8.1f}us/request  peak {:6d} bytes".format(nameSTR, (time.perf_counter() - startTime) / args.count * 1e6, peakINT))
+
+    server, url = startStubServer()
+    endpointSTR = url.split("/Loki/")[0]
+    for nameSTR, httpClientCLASS in [("reply (RequestsHttpClient)", None), ("reply (PooledHttpClient)", line_client.PooledHttpClient)]:
+        if httpClientCLASS is None:
+            lineBotApi = LineBotApi("bench_token", endpoint=endpointSTR)
+        else:
+            lineBotApi = LineBotApi("bench_token", endpoint=endpointSTR, http_client=httpClientCLASS)
+        latencyLIST = []
+        for i in range(min(args.count, 500)):
+            startTime = time.perf_counter()
+            lineBotApi.reply_message("token", TextSendMessage("希望有解答您的疑問~"))
+            latencyLIST.append(time.perf_counter() - startTime)
+        printLatency(nameSTR, latencyLIST)
+    server.shutdown()
+
+def benchReply(args):
+    """
+    webhook 被回覆佔住的時間：直接呼叫 reply_message() vs ReplySender.send() (放入佇列由 sender thread 送出)
+    stub server 以 --delay 模擬變慢的 LINE API，另外列出 ReplySender 從收到到送達的延遲
+    """
+    from linebot import LineBotApi
+    from linebot.models import TextSendMessage
+    import line_client
+    import reply_sender
+
+    server, url = startStubServer(args.delay)
+    lineBotApi = LineBotApi("bench_token", endpoint=url.split("/Loki/")[0], http_client=line_client.PooledHttpClient)
+    message = TextSendMessage("希望有解答您的疑問~")
+    sender = reply_sender.ReplySender(lambda: lineBotApi)
+
+    latencyLIST = []
+    for i in range(args.count):
+        startTime = time.perf_counter()
+        lineBotApi.reply_message("token", message)
+        latencyLIST.append(time.perf_counter() - startTime)
+    printLatency("reply_message()", latencyLIST)
+
+    latencyLIST = []
+    startTime = time.perf_counter()
+    for i in range(args.count):
+        sendTime = time.perf_counter()
+        sender.send("token", "U0", message)
+        latencyLIST.append(time.perf_counter() - sendTime)
+    printLatency("ReplySender.send()", latencyLIST)
+    sender.drain(timeoutFLOAT=600)
+    elapsedFLOAT = time.perf_counter() - startTime
+    deliveryDICT = reply_sender.deliveryHistogram.getValue(method="reply")
+    print("{:<24} {} delivered in {:.2f}s, p50={:8.3f}ms  p99={:8.3f}ms".format(
+        "", deliveryDICT["count"], elapsedFLOAT,
+        reply_sender.deliveryHistogram.getQuantile(0.5, method="reply") * 1000,
+        reply_sender.deliveryHistogram.getQuantile(0.99, method="reply") * 1000))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="BankServiceBot benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sessionParser = subparsers.add_parser("session", help="Loki HTTP 連線池 vs 每次新連線")
+    sessionParser.add_argument("--count", type=int, default=500)
+    sessionParser.add_argument("--delay", type=float, default=0.0, help="stub server 每次回應的延遲秒數")
+    sessionParser.set_defaults(func=benchSession)
+
+    dispatchParser = subparsers.add_parser("dispatch", help="意圖模組 utterance 查表 vs if 逐一比對")
+    dispatchParser.add_argument("--repeat", type=int, default=200)
+    dispatchParser.set_defaults(func=benchDispatch)
+
+    startupParser = subparsers.add_parser("startup", help="import esun_qa 的時間與記憶體 (lazy vs 載入全部意圖)")
+    startupParser.add_argument("--repeat", type=int, default=5)
+    startupParser.set_defaults(func=benchStartup)
+
+    mergeParser = subparsers.add_parser("merge", help="execLoki() 結果合併：每批 deepcopy vs ResultMerger")
+    mergeParser.add_argument("--size", type=int, nargs="+", default=[1000, 10000], help="輸入句數")
+    mergeParser.add_argument("--repeat", type=int, default=5)
+    mergeParser.set_defaults(func=benchMerge)
+
+    batchParser = subparsers.add_parser("batch", help="跨請求微批次 vs 每個請求各自呼叫 BulkAPI")
+    batchParser.add_argument("--thread", type=int, default=50, help="同時送出的請求數")
+    batchParser.add_argument("--count", type=int, default=20, help="每個 thread 送出的句數")
+    batchParser.add_argument("--delay", type=float, default=0.05, help="stub server 每次回應的延遲秒數")
+    batchParser.add_argument("--window", type=float, default=5, help="微批次等待毫秒數")
+    batchParser.set_defaults(func=benchBatch)
+
+    searchParser = subparsers.add_parser("search", help="chatbot.json BM25 檢索的 build 時間與查詢延遲")
+    searchParser.add_argument("--repeat", type=int, default=3)
+    searchParser.set_defaults(func=benchSearch)
+
+    hedgeParser = subparsers.add_parser("hedge", help="Loki 對沖請求 vs 單一請求 (stub 隨機注入慢回應)")
+    hedgeParser.add_argument("--count", type=int, default=1000)
+    hedgeParser.add_argument("--thread", type=int, default=8)
+    hedgeParser.add_argument("--delay", type=float, default=0.01, help="一般回應的延遲秒數")
+    hedgeParser.add_argument("--slow-rate", type=float, default=0.03, help="慢回應的機率")
+    hedgeParser.add_argument("--slow-delay", type=float, default=0.5, help="慢回應的延遲秒數")
+    hedgeParser.add_argument("--percentile", type=float, default=95)
+    hedgeParser.add_argument("--budget", type=float, default=0.1)
+    hedgeParser.add_argument("--seed", type=int, default=0)
+    hedgeParser.set_defaults(func=benchHedge)
+
+    asyncParser = subparsers.add_parser("async", help="testIntent() 測試句：execLoki() vs execLoki_async() (結果需完全相同)")
+    asyncParser.add_argument("--delay", type=float, default=0.05, help="stub server 每次回應的延遲秒數")
+    asyncParser.add_argument("--repeat", type=int, default=3)
+    asyncParser.set_defaults(func=benchAsync)
+
+    logParser = subparsers.add_parser("log", help="debugInfo()：print() vs bot_logging (關閉 / 佇列寫出)")
+    logParser.add_argument("--count", type=int, default=100000)
+    logParser.set_defaults(func=benchLog)
+
+    metricsParser = subparsers.add_parser("metrics", help="記錄 metric 的耗時，與 /metrics 合併多個 worker 的耗時")
+    metricsParser.add_argument("--count", type=int, default=100000)
+    metricsParser.add_argument("--worker", type=int, default=8)
+    metricsParser.set_defaults(func=benchMetrics)
+
+    lineParser = subparsers.add_parser("line", help="webhook 每個請求建立 LINE client / 驗證 / parse 的成本，與 reply 連線池")
+    lineParser.add_argument("--count", type=int, default=2000)
+    lineParser.add_argument("--events", type=int, default=3)
+    lineParser.set_defaults(func=benchLine)
+
+    replyParser = subparsers.add_parser("reply", help="webhook 被回覆佔住的時間：同步 reply_message() vs ReplySender 佇列")
+    replyParser.add_argument("--count", type=int, default=200)
+    replyParser.add_argument("--delay", type=float, default=0.1)
+    replyParser.set_defaults(func=benchReply)
+
+    args = parser.parse_args()
+    args.func(args)
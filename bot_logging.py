@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    非阻塞的結構化 log
+
+    原本每次比對與每個請求都直接 print() 到 stdout，流量大時同步寫入 stdout 會拖慢處理，
+    也會把使用者的訊息內容寫進 container log。改用 logging：
+
+    * QueueHandler：呼叫端只把 LogRecord 放進有上限的佇列 (不等待 I/O)，
+      由背景 thread (QueueListener) 寫到 stderr；佇列已滿時直接丟棄並計數，不會卡住呼叫端
+    * 等級：預設 WARNING，使用者訊息內容只在 DEBUG 等級輸出 (正式環境預設不會寫出)，
+      log_levels 可以針對模組 (logger 名稱，含子 logger) 個別設定，例如 "intent=DEBUG,esun_qa=INFO"
+    * 取樣：WARNING 以下的紀錄只保留 log_sample 的比例，WARNING 以上一律保留
+    * 格式：每筆一行 JSON (time / level / logger / msg，以及 extra 傳入的欄位)，或 log_format=text 時為純文字
+
+    設定 (環境變數):
+        log_level           預設等級 (預設 WARNING)
+        log_levels          各模組的等級，以逗號分隔的 name=LEVEL (預設空字串)
+        log_sample          WARNING 以下紀錄的取樣比例 (預設 1.0)
+        log_queue_size      佇列上限 (預設 10000)
+        log_format          json / text (預設 json)
+        log_stop_timeout    結束時等待背景 thread 寫出佇列中紀錄的秒數上限 (預設 5)
+
+    metrics:
+        log_records_total{result}       沒有寫出的紀錄數，sampled：取樣略過；dropped：佇列已滿而丟棄
+
+    e.g.
+        from bot_logging import getLogger
+        logger = getLogger(__name__)
+        logger.debug("[credit_card] %s ===> %s", inputSTR, utterance)
+        logger.error("[ERROR] execLokiBatch => %s", str(e), extra={"event": 3})
+"""
+
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from threading import Lock
+import atexit
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+import metrics
+
+LOG_LEVEL = os.environ.get("log_level", "WARNING").upper()
+LOG_LEVELS = os.environ.get("log_levels", "")
+LOG_SAMPLE = float(os.environ.get("log_sample", 1.0))
+LOG_QUEUE_SIZE = int(os.environ.get("log_queue_size", 10000))
+LOG_FORMAT = os.environ.get("log_format", "json").lower()
+LOG_STOP_TIMEOUT = float(os.environ.get("log_stop_timeout", 5))
+
+# LogRecord 本身的屬性，其餘的屬性視為 extra 傳入的欄位
+RECORD_KEY_SET = set(vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()) | {"message", "asctime"}
+
+recordCounter = metrics.counter("log_records_total", "沒有寫出的 log 紀錄數", ["result"])
+exceptionFormatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        logDICT = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + ".{:03d}".format(int(record.msecs)),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for k, v in vars(record).items():
+            if k not in RECORD_KEY_SET:
+                logDICT[k] = v
+        if record.exc_text:
+            logDICT["exc"] = record.exc_text
+        return json.dumps(logDICT, ensure_ascii=False, default=str)
+
+
+class SampleFilter(logging.Filter):
+    def __init__(self, sampleFLOAT):
+        super().__init__()
+        self.sampleFLOAT = sampleFLOAT
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.sampleFLOAT >= 1.0 or random.random() < self.sampleFLOAT:
+            return True
+        recordCounter.inc(result="sampled")
+        return False
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    stop() 最多等待 LOG_STOP_TIMEOUT 秒：QueueListener 預設以 put_nowait() 放入結束標記 (佇列已滿時丟出 Full，剩下的紀錄沒有寫出)，
+    並一直等到背景 thread 寫完 (輸出卡住時行程無法結束)
+    """
+    def stop(self):
+        deadline = time.time() + LOG_STOP_TIMEOUT
+        try:
+            self.queue.put(self._sentinel, timeout=LOG_STOP_TIMEOUT)
+            self._thread.join(max(0, deadline - time.time()))
+        except Full:
+            pass
+        if self._thread.is_alive():
+            # 輸出卡住，放棄佇列中剩下的紀錄 (背景 thread 是 daemon，不會擋住結束)
+            recordCounter.inc(self.queue.qsize(), result="dropped")
+        self._thread = None
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    佇列已滿時丟棄紀錄；第一次使用 (或 fork 後) 才啟動寫出的背景 thread
+    """
+    def __init__(self, queueSizeINT, outputHandler):
+        super().__init__(Queue(maxsize=queueSizeINT))
+        self.outputHandler = outputHandler
+        self.listener = None
+        self.listenerPID = None
+        self.startLock = Lock()
+
+    def start(self):
+        # gunicorn --preload 時 fork 前建立的 thread 不會被帶到子行程，因此以 pid 判斷是否需要重新啟動
+        with self.startLock:
+            if self.listenerPID == os.getpid():
+                return
+            self.listenerPID = os.getpid()
+            self.listener = FlushingQueueListener(self.queue, self.outputHandler, respect_handler_level=True)
+            self.listener.start()
+
+    def prepare(self, record):
+        # 呼叫端只合併 msg 與 args、exception 轉成文字 (args / traceback 不一定能跨 thread 保留)，
+        # 不複製 record 也不格式化，JSON 格式化在背景 thread 進行
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = exceptionFormatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if self.listenerPID != os.getpid():
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            recordCounter.inc(result="dropped")
+
+    def stop(self):
+        # 寫出佇列中剩下的紀錄並停止背景 thread
+        if self.listener is not None and self.listenerPID == os.getpid():
+            self.listener.stop()
+            self.listenerPID = None
+
+
+def parseLevels(levelsSTR):
+    """
+    "intent=DEBUG,esun_qa=INFO" => {"intent": "DEBUG", "esun_qa": "INFO"}
+    """
+    levelDICT = {}
+    for itemSTR in levelsSTR.split(","):
+        if "=" in itemSTR:
+            nameSTR, levelSTR = itemSTR.split("=", 1)
+            levelDICT[nameSTR.strip()] = levelSTR.strip().upper()
+    return levelDICT
+
+setupLock = Lock()
+queueHandler = None
+
+def setup(levelSTR=LOG_LEVEL, levelsSTR=LOG_LEVELS, sampleFLOAT=LOG_SAMPLE, queueSizeINT=LOG_QUEUE_SIZE, formatSTR=LOG_FORMAT):
+    """
+    設定 root logger (只會執行一次)，getLogger() 會自動呼叫
+    """
+    global queueHandler
+    with setupLock:
+        if queueHandler is not None:
+            return queueHandler
+
+        outputHandler = logging.StreamHandler(sys.stderr)
+        if formatSTR == "json":
+            outputHandler.setFormatter(JsonFormatter())
+        else:
+            outputHandler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+
+        handler = NonBlockingQueueHandler(queueSizeINT, outputHandler)
+        handler.addFilter(SampleFilter(sampleFLOAT))
+        rootLogger = logging.getLogger()
+        rootLogger.addHandler(handler)
+        rootLogger.setLevel(levelSTR)
+        for nameSTR, moduleLevelSTR in parseLevels(levelsSTR).items():
+            logging.getLogger(nameSTR).setLevel(moduleLevelSTR)
+        queueHandler = handler
+    atexit.register(handler.stop)
+    return queueHandler
+
+def getLogger(name):
+    setup()
+    return logging.getLogger(name)
+
+def flush(timeoutFLOAT=1.0):
+    """
+    等待佇列中的紀錄寫出 (測試或結束前使用)
+    """
+    if queueHandler is None:
+        return
+    deadline = time.time() + timeoutFLOAT
+    while not queueHandler.queue.empty() and time.time() < deadline:
+        time.sleep(0.005)
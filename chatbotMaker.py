@@ -4,16 +4,18 @@
 Loki 4.0 Chatbot AI 回應產生器
 """
 
+from intent import reply_store
+from loki_session import post, LOKI_CONNECT_TIMEOUT
 from random import sample
-from requests import post
 import re
 import os
 import json
 
 LOKI_CALL_URL = "https://api.droidtown.co/Loki/Call/"
+LOKI_CALL_TIMEOUT = (LOKI_CONNECT_TIMEOUT, 120)      # run_alias 需等待 GPT 生成，讀取 timeout 放寬
 
 BASE_PATH = os.path.dirname(__file__)
-UTTERANCE_PAT = re.compile("^ *if utterance == \"([^\"]+)\":", re.M)
+UTTERANCE_PAT = re.compile("^(?:@utteranceHandler\\(| *if utterance == )\"([^\"]+)\"", re.M)
 CHAT_GPT_ORDER_PAT = re.compile("^\d+\. *")
 CHAT_GPT_MARK_PAT = re.compile("^[\"「]|[\"」]$")
 MESSAGE_LIMIT = 3500
@@ -43,7 +45,7 @@ def getResponse(intent, system, assistant, user):
         if assistant:
             for assistant_l in assistant:
                 payload["data"]["messages"] = system + assistant_l + user
-                result = post(LOKI_CALL_URL, json=payload).json()
+                result = post(LOKI_CALL_URL, json=payload, timeout=LOKI_CALL_TIMEOUT).json()
                 if result["status"]:
                     contentLIST = result["result_list"][0]["message"]["content"].split("\n")
                     for content in contentLIST:
@@ -61,7 +63,7 @@ def getResponse(intent, system, assistant, user):
                 resultLIST = sample(resultLIST, int(len(resultLIST)/len(assistant)))
         else:
             payload["data"]["messages"] = system + user
-            result = post(LOKI_CALL_URL, json=payload).json()
+            result = post(LOKI_CALL_URL, json=payload, timeout=LOKI_CALL_TIMEOUT).json()
             if result["status"]:
                 contentLIST = result["result_list"][0]["message"]["content"].split("\n")
                 for content in contentLIST:
@@ -155,5 +157,9 @@ if __name__ == "__main__":
         
                 else:
                     print("[ERROR] {} is not found".format(intentSTR))
+
+        # 重新編譯 reply.bin
+        keyINT = reply_store.build(replyPATH, os.path.join(replyPATH, "reply.bin"))
+        print("[Success] reply.bin ({} utterances)".format(keyINT))
     else:
         print("[Error] Invalid Chatbot Config")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    chatbot.json FAQ 完全比對
+
+    chatbot.json 的每個意圖都有一組標準問答 (document[].content.Q / .A)，使用者常直接貼上問題標題。
+    啟動後第一次使用時把 Q 與 title 正規化後建成 dict，requestLoki() 在查快取與呼叫 Loki 之前先查表，
+    完全相同的問題直接以 FAQ 的答案回覆，不需要任何網路 I/O。
+
+    比對成功時回傳 BulkAPI result_list 格式的結果，意圖為 FAQ_INTENT ("faq")，
+    utterance 為 FAQ 的 Q、argument 為原本的意圖名稱；
+    esun_qa 把本模組登記為 "faq" 意圖，由 getResult() 填入答案，因此 execLoki() / execLokiBatch() 不需要另外處理。
+
+    設定 (環境變數):
+        faq_index       是否啟用 FAQ 完全比對 (預設 true)
+
+    metrics:
+        faq_requests_total{result}      hit / miss，hit / (hit + miss) 即為 FAQ 分擔的流量比例
+"""
+
+from threading import Lock
+import json
+import os
+
+from bot_logging import getLogger
+from loki_cache import normalizeInput
+import metrics
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+CHATBOT_PATH = os.path.join(BASE_PATH, "chatbot.json")
+
+FAQ_INDEX = os.environ.get("faq_index", "true").lower() in ["1", "true", "yes"]
+FAQ_INTENT = "faq"
+STRIP_STR = " \t?？!！。.~～"
+
+logger = getLogger(__name__)
+
+faqCounter = metrics.counter("faq_requests_total", "FAQ 完全比對查詢次數", ["result"])
+
+
+def normalizeQuestion(inputSTR):
+    return normalizeInput(inputSTR).strip(STRIP_STR)
+
+
+class FaqIndex():
+    def __init__(self, chatbotPath=CHATBOT_PATH):
+        self.chatbotPath = chatbotPath
+        self.indexDICT = None           # 正規化後的問題 => [(intent, Q), ...]
+        self.answerDICT = {}            # (intent, Q) => A
+        self.hitINT = 0
+        self.missINT = 0
+        self.lock = Lock()
+
+    def build(self):
+        indexDICT = {}
+        answerDICT = {}
+        try:
+            with open(self.chatbotPath, encoding="utf-8") as f:
+                chatbotDICT = json.load(f)
+        except Exception as e:
+            logger.error("[ERROR] FaqIndex => %s", str(e))
+            chatbotDICT = {}
+
+        for intentSTR, intentDICT in chatbotDICT.items():
+            for documentDICT in intentDICT.get("document", []):
+                contentDICT = documentDICT.get("content", {})
+                if not contentDICT.get("Q") or not contentDICT.get("A"):
+                    continue
+                questionSTR = contentDICT["Q"]
+                # 文件中的 \u000b (垂直定位字元) 在 LINE 上會顯示成亂碼
+                answerDICT[(intentSTR, questionSTR)] = contentDICT["A"].replace("\u000b", "")
+                for keySTR in set([questionSTR, documentDICT.get("title", "")]):
+                    key = normalizeQuestion(keySTR)
+                    if key and (intentSTR, questionSTR) not in indexDICT.get(key, []):
+                        indexDICT.setdefault(key, []).append((intentSTR, questionSTR))
+
+        self.answerDICT = answerDICT
+        self.indexDICT = indexDICT
+
+    def getIndex(self):
+        if self.indexDICT is None:
+            with self.lock:
+                if self.indexDICT is None:
+                    self.build()
+        return self.indexDICT
+
+    def match(self, inputSTR, filterLIST=[]):
+        """
+        回傳 BulkAPI result_list 格式的結果，不是 FAQ 的問題時回傳 None
+        """
+        matchLIST = self.getIndex().get(normalizeQuestion(inputSTR), [])
+        if filterLIST:
+            matchLIST = [m for m in matchLIST if m[0] in filterLIST]
+
+        # 計數不加鎖，只作為統計用途
+        if matchLIST:
+            self.hitINT += 1
+        else:
+            self.missINT += 1
+        faqCounter.inc(result="hit" if matchLIST else "miss")
+        if not matchLIST:
+            return None
+
+        # 同一個問題出現在多個意圖時只取第一個，避免重複回覆
+        intentSTR, questionSTR = matchLIST[0]
+        return {
+            "status": True,
+            "msg": "Success!",
+            "results": [{"intent": FAQ_INTENT, "pattern": "", "utterance": questionSTR, "argument": [intentSTR]}]
+        }
+
+    def getAnswer(self, intentSTR, questionSTR):
+        self.getIndex()
+        return self.answerDICT.get((intentSTR, questionSTR), "")
+
+    def getStats(self):
+        totalINT = self.hitINT + self.missINT
+        return {
+            "size": len(self.getIndex()),
+            "hit": self.hitINT,
+            "miss": self.missINT,
+            "hitRate": self.hitINT / totalINT if totalINT else 0.0
+        }
+
+
+faqIndex = FaqIndex()
+
+def match(inputSTR, filterLIST=[]):
+    if not FAQ_INDEX:
+        return None
+    return faqIndex.match(inputSTR, filterLIST)
+
+def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
+    """
+    與 intent/Loki_*.py 相同的介面：utterance 為 FAQ 的 Q，args[0] 為原本的意圖
+    """
+    answerSTR = faqIndex.getAnswer(args[0], utterance)
+    if answerSTR:
+        resultDICT["response"] = answerSTR
+    return resultDICT
+
+
+if __name__ == "__main__":
+    faqIndex.getIndex()
+    print("[FaqIndex] {} questions".format(len(faqIndex.indexDICT)))
+    while True:
+        inputSTR = input("Test input: ")
+        if inputSTR == 'q':
+            break
+        resultDICT = match(inputSTR)
+        print(json.dumps(resultDICT, ensure_ascii=False, indent=4))
+        if resultDICT:
+            print(faqIndex.getAnswer(resultDICT["results"][0]["argument"][0], resultDICT["results"][0]["utterance"]))
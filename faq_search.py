@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    chatbot.json 本機檢索 (BM25)
+
+    Loki 比對不到意圖、或意圖模組沒有產生回覆時，改以 chatbot.json 的 document 做全文檢索，
+    分數超過門檻的 FAQ 答案直接回覆，不需要再呼叫任何 API。
+
+    * 斷詞：繁體中文沒有空白分隔，以正規化後的字元 bigram + trigram 作為 term
+    * 每份文件只索引 title + Q (A 的內容較長，容易因為常見的字詞誤判)，
+      BM25 的 term 權重 (idf * tf 飽和值) 在 build 時就算好，
+      以 CSR 格式 (indptr / indices / weights) 存放，查詢時只需把各 term 的 posting 權重加總
+    * 有安裝 numpy 時以 np.bincount 向量化加總，否則使用 dict 逐筆加總 (結果相同)
+    * BM25 分數會隨查詢句的長度增加 (長句只要有幾個常見的 bigram 相符就能得到高分)，
+      因此除以查詢句本身可能得到的最高分 (每個 term 的 idf * (k1 + 1) 加總，index 中沒有的 term 以最大的 idf 計算)，
+      分數為 0 ~ 1 之間「查詢句中有多少資訊量在文件中出現」的比例，門檻與查詢句長度無關
+
+    範例：
+        python3 faq_search.py build          # 預先建立 faq_search.json (Dockerfile 中執行)
+        python3 faq_search.py                # 互動測試
+
+    index 檔不存在或比 chatbot.json 舊時，第一次查詢會在記憶體中重新建立 (約 0.15 秒)。
+
+    設定 (環境變數):
+        faq_search              是否啟用檢索 (預設 true)
+        faq_search_top_k        回覆的答案數 (預設 1)
+        faq_search_threshold    最低分數 (正規化後，預設 0.3)
+                                以問句改寫 / 非問句的測試集 (tests/test_faq_search.py) 決定：
+                                改寫的問句大多在 0.3 以上，領域外或只有「信用卡」等常見詞相符的句子在 0.3 以下
+"""
+
+from threading import Lock
+import json
+import math
+import os
+import re
+import sys
+import time
+
+from bot_logging import getLogger
+from loki_cache import normalizeInput
+import metrics
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+CHATBOT_PATH = os.path.join(BASE_PATH, "chatbot.json")
+INDEX_PATH = os.path.join(BASE_PATH, "faq_search.json")
+
+FAQ_SEARCH = os.environ.get("faq_search", "true").lower() in ["1", "true", "yes"]
+FAQ_SEARCH_TOP_K = int(os.environ.get("faq_search_top_k", 1))
+FAQ_SEARCH_THRESHOLD = float(os.environ.get("faq_search_threshold", 0.3))
+
+NGRAM_LIST = [2, 3]
+BM25_K1 = 1.2
+BM25_B = 0.75
+INDEX_VERSION = 2
+
+# 去除標點符號與空白，只保留文字
+punctuationPAT = re.compile(r"[\W_]+")
+
+logger = getLogger(__name__)
+
+searchCounter = metrics.counter("faq_search_requests_total", "chatbot.json 本機檢索次數", ["result"])
+searchHistogram = metrics.histogram("faq_search_seconds", "chatbot.json 本機檢索時間", bucketLIST=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1))
+
+
+def tokenize(inputSTR):
+    """
+    回傳字元 bigram / trigram 列表 (可重複)
+    """
+    textSTR = punctuationPAT.sub("", normalizeInput(inputSTR))
+    termLIST = []
+    for n in NGRAM_LIST:
+        termLIST.extend(textSTR[i:i+n] for i in range(len(textSTR) - n + 1))
+    if not termLIST and textSTR:
+        termLIST.append(textSTR)
+    return termLIST
+
+def build(chatbotPath=CHATBOT_PATH):
+    """
+    讀取 chatbot.json，回傳 index dict (可直接 json.dump)
+    """
+    with open(chatbotPath, encoding="utf-8") as f:
+        chatbotDICT = json.load(f)
+
+    documentLIST = []
+    tfLIST = []
+    for intentSTR, intentDICT in chatbotDICT.items():
+        for documentDICT in intentDICT.get("document", []):
+            contentDICT = documentDICT.get("content", {})
+            if not contentDICT.get("Q") or not contentDICT.get("A"):
+                continue
+            tfDICT = {}
+            for term in tokenize(" ".join([documentDICT.get("title", ""), contentDICT["Q"]])):
+                tfDICT[term] = tfDICT.get(term, 0) + 1
+            documentLIST.append([intentSTR, contentDICT["Q"], contentDICT["A"].replace("\u000b", "")])
+            tfLIST.append(tfDICT)
+
+    lengthLIST = [sum(tfDICT.values()) for tfDICT in tfLIST]
+    avgLengthFLOAT = sum(lengthLIST) / max(1, len(lengthLIST))
+
+    # term => [(docID, tf), ...]
+    postingDICT = {}
+    for docID, tfDICT in enumerate(tfLIST):
+        for term, tfINT in tfDICT.items():
+            postingDICT.setdefault(term, []).append((docID, tfINT))
+
+    termDICT = {}
+    indptrLIST = [0]
+    indexLIST = []
+    weightLIST = []
+    idfLIST = []
+    docINT = len(documentLIST)
+    for term in sorted(postingDICT):
+        postingLIST = postingDICT[term]
+        idfFLOAT = getIdf(docINT, len(postingLIST))
+        idfLIST.append(round(idfFLOAT, 6))
+        for docID, tfINT in postingLIST:
+            normFLOAT = BM25_K1 * (1 - BM25_B + BM25_B * lengthLIST[docID] / avgLengthFLOAT)
+            indexLIST.append(docID)
+            weightLIST.append(round(idfFLOAT * tfINT * (BM25_K1 + 1) / (tfINT + normFLOAT), 6))
+        termDICT[term] = len(indptrLIST) - 1
+        indptrLIST.append(len(indexLIST))
+
+    return {
+        "version": INDEX_VERSION,
+        "documents": documentLIST,
+        "terms": termDICT,
+        "indptr": indptrLIST,
+        "indices": indexLIST,
+        "weights": weightLIST,
+        "idf": idfLIST,
+        # index 中沒有的 term (df = 0) 的 idf
+        "maxIdf": round(getIdf(docINT, 0), 6)
+    }
+
+def getIdf(docINT, dfINT):
+    return math.log(1 + (docINT - dfINT + 0.5) / (dfINT + 0.5))
+
+
+class FaqSearch():
+    def __init__(self, indexPath=INDEX_PATH, chatbotPath=CHATBOT_PATH):
+        self.indexPath = indexPath
+        self.chatbotPath = chatbotPath
+        self.documentLIST = None
+        self.lock = Lock()
+
+    def load(self):
+        indexDICT = None
+        try:
+            if os.path.exists(self.indexPath) and os.path.getmtime(self.indexPath) >= os.path.getmtime(self.chatbotPath):
+                with open(self.indexPath, encoding="utf-8") as f:
+                    indexDICT = json.load(f)
+                if indexDICT.get("version") != INDEX_VERSION:
+                    indexDICT = None
+        except Exception as e:
+            logger.error("[ERROR] FaqSearch => %s", str(e))
+            indexDICT = None
+        if indexDICT is None:
+            # 沒有預先建立的 index (或已過期)，直接在記憶體中建立
+            indexDICT = build(self.chatbotPath)
+
+        self.termDICT = indexDICT["terms"]
+        self.idfLIST = indexDICT["idf"]
+        self.maxIdfFLOAT = indexDICT["maxIdf"]
+        if np is not None:
+            self.indptr = np.asarray(indexDICT["indptr"], dtype=np.int64)
+            self.indices = np.asarray(indexDICT["indices"], dtype=np.int32)
+            self.weights = np.asarray(indexDICT["weights"], dtype=np.float32)
+        else:
+            self.indptr = indexDICT["indptr"]
+            self.indices = indexDICT["indices"]
+            self.weights = indexDICT["weights"]
+        self.documentLIST = indexDICT["documents"]
+
+    def getDocumentLIST(self):
+        if self.documentLIST is None:
+            with self.lock:
+                if self.documentLIST is None:
+                    self.load()
+        return self.documentLIST
+
+    def score(self, inputSTR):
+        """
+        回傳 [(score, docID), ...]，只包含至少有一個 term 相符的文件
+        score 為 BM25 分數除以查詢句可能得到的最高分 (見模組說明)
+        """
+        documentLIST = self.getDocumentLIST()
+        termIDLIST = []
+        maxScoreFLOAT = 0.0
+        for term in tokenize(inputSTR):
+            termID = self.termDICT.get(term)
+            if termID is not None:
+                termIDLIST.append(termID)
+                maxScoreFLOAT += self.idfLIST[termID] * (BM25_K1 + 1)
+            else:
+                maxScoreFLOAT += self.maxIdfFLOAT * (BM25_K1 + 1)
+        if not termIDLIST:
+            return []
+
+        if np is not None:
+            # 所有 term 的 posting 串接後以 bincount 一次加總 (重複的 term 會重複加權，等同 query tf)
+            indptr = self.indptr
+            sliceLIST = [slice(indptr[t], indptr[t+1]) for t in termIDLIST]
+            scoreARRAY = np.bincount(
+                np.concatenate([self.indices[s] for s in sliceLIST]),
+                weights=np.concatenate([self.weights[s] for s in sliceLIST]),
+                minlength=len(documentLIST))
+            docARRAY = np.flatnonzero(scoreARRAY)
+            return list(zip((scoreARRAY[docARRAY] / maxScoreFLOAT).tolist(), docARRAY.tolist()))
+
+        scoreDICT = {}
+        for termID in termIDLIST:
+            for i in range(self.indptr[termID], self.indptr[termID+1]):
+                docID = self.indices[i]
+                scoreDICT[docID] = scoreDICT.get(docID, 0.0) + self.weights[i]
+        return [(scoreFLOAT / maxScoreFLOAT, docID) for docID, scoreFLOAT in scoreDICT.items()]
+
+    def search(self, inputSTR, topK=FAQ_SEARCH_TOP_K, threshold=FAQ_SEARCH_THRESHOLD, filterLIST=[]):
+        """
+        回傳分數超過 threshold 的前 topK 筆 [{"intent", "Q", "A", "score"}, ...]，依分數由高到低排序
+        """
+        startTime = time.perf_counter()
+        documentLIST = self.getDocumentLIST()
+        scoreLIST = [s for s in self.score(inputSTR) if s[0] >= threshold]
+        if filterLIST:
+            scoreLIST = [s for s in scoreLIST if documentLIST[s[1]][0] in filterLIST]
+        scoreLIST.sort(reverse=True)
+
+        resultLIST = []
+        for scoreFLOAT, docID in scoreLIST[:topK]:
+            intentSTR, questionSTR, answerSTR = documentLIST[docID]
+            resultLIST.append({"intent": intentSTR, "Q": questionSTR, "A": answerSTR, "score": round(scoreFLOAT, 3)})
+
+        searchHistogram.observe(time.perf_counter() - startTime)
+        searchCounter.inc(result="hit" if resultLIST else "miss")
+        return resultLIST
+
+
+faqSearch = FaqSearch()
+
+def search(inputSTR, topK=FAQ_SEARCH_TOP_K, threshold=FAQ_SEARCH_THRESHOLD, filterLIST=[]):
+    if not FAQ_SEARCH:
+        return []
+    return faqSearch.search(inputSTR, topK, threshold, filterLIST)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["build"]:
+        indexDICT = build()
+        tmpFile = "{}.{}.tmp".format(INDEX_PATH, os.getpid())
+        with open(tmpFile, "w", encoding="utf-8") as f:
+            json.dump(indexDICT, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmpFile, INDEX_PATH)
+        print("[Success] {} ({} documents, {} terms)".format(INDEX_PATH, len(indexDICT["documents"]), len(indexDICT["terms"])))
+    else:
+        while True:
+            inputSTR = input("Test input: ")
+            if inputSTR == 'q':
+                break
+            print(json.dumps(faqSearch.search(inputSTR, topK=5, threshold=0), ensure_ascii=False, indent=4))
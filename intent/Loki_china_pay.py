@@ -16,6 +16,9 @@
         resultDICT    dict
 """
 
+from intent import userDefinedDICT
+from intent.reply_store import loadReply
+from bot_logging import getLogger
 from random import sample
 import json
 import os
@@ -23,23 +26,19 @@ import os
 DEBUG = True
 CHATBOT_MODE = True
 
-userDefinedDICT = {}
-try:
-    userDefinedDICT = json.load(open(os.path.join(os.path.dirname(__file__), "USER_DEFINED.json"), encoding="utf-8"))
-except Exception as e:
-    print("[ERROR] userDefinedDICT => {}".format(str(e)))
+logger = getLogger(__name__)
 
 responseDICT = {}
 if CHATBOT_MODE:
     try:
-        responseDICT = json.load(open(os.path.join(os.path.dirname(os.path.dirname(__file__)), os.path.join("reply", "reply_china_pay.json")), encoding="utf-8"))
+        responseDICT = loadReply("china_pay")
     except Exception as e:
-        print("[ERROR] responseDICT => {}".format(str(e)))
+        logger.error("[ERROR] responseDICT => %s", str(e))
 
-# 將符合句型的參數列表印出。這是 debug 或是開發用的。
+# 將符合句型的參數列表印出。這是 debug 或是開發用的。(log 等級為 DEBUG 時才會輸出，例如 log_levels=intent=DEBUG)
 def debugInfo(inputSTR, utterance):
     if DEBUG:
-        print("[china_pay] {} ===> {}".format(inputSTR, utterance))
+        logger.debug("[china_pay] %s ===> %s", inputSTR, utterance)
 
 def getResponse(utterance, args):
     resultSTR = ""
@@ -49,157 +48,189 @@ def getResponse(utterance, args):
 
     return resultSTR
 
-def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
-    debugInfo(inputSTR, utterance)
-    for i in range(len(args)):
-        args[i] = args[i].lower().strip(' ')   # 前處理，把argument變小寫並去頭尾空格
-    
-    if utterance == "兩岸支付通收款需要有[支付寶][帳號]嗎":
-        if CHATBOT_MODE:
-            if args[0] == '支付寶' and args[1] in ['帳戶', '帳號']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+# utterance => 處理函式，於 import 時建立，getResult() 直接查表，不必逐一比對 utterance
+utteranceDICT = {}
 
-    if utterance == "兩岸支付通服務[可以]收[人民幣][款項]嗎":
-        if CHATBOT_MODE:
-            if args[1] == '人民幣':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+def utteranceHandler(utteranceSTR):
+    def register(handlerFUNC):
+        utteranceDICT[utteranceSTR] = handlerFUNC
+        return handlerFUNC
+    return register
 
-    if utterance == "兩岸支付通服務[是]否[會]開立[手續費]用的[收據]":
-        if CHATBOT_MODE:
-            if args[2] == '手續費':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("兩岸支付通收款需要有[支付寶][帳號]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '支付寶' and args[1] in ['帳戶', '帳號']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[可以]透過兩岸支付通儲值[我]的[支付寶][帳戶]嗎":
-        if CHATBOT_MODE:
-            if args[2] == '支付寶'and args[3] in ['帳戶', '帳號', '戶頭', '錢包', '餘額']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("兩岸支付通服務[可以]收[人民幣][款項]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] == '人民幣':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[可以]透過兩岸支付通在[淘寶網]開店收款嗎":
-        if CHATBOT_MODE:
-            if '淘寶' in args[1]:
-                resultDICT["response"] = getResponse(utterance, args)
-            else:
-                pass
-        else:
-            pass
+@utteranceHandler("兩岸支付通服務[是]否[會]開立[手續費]用的[收據]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[2] == '手續費':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[可以]透過兩岸支付通提領回[台灣]的[存款帳戶]嗎":
-        if CHATBOT_MODE:
-            if args[1] in ['台灣','臺灣'] and '存款' in args[2]:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("[可以]透過兩岸支付通儲值[我]的[支付寶][帳戶]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[2] == '支付寶'and args[3] in ['帳戶', '帳號', '戶頭', '錢包', '餘額']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[可以]透過兩岸支付通讓[大陸][消費者]在[門市]使用[支付寶]付款嗎":
-        if CHATBOT_MODE:
-            if args[1] in ['大陸', '中國'] and args[4] == '支付寶':
-                resultDICT["response"] = getResponse(utterance, args)
+@utteranceHandler("[可以]透過兩岸支付通在[淘寶網]開店收款嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if '淘寶' in args[1]:
+            resultDICT["response"] = getResponse(utterance, args)
         else:
             pass
+    else:
+        pass
 
-    if utterance == "特店的販售[商品]有哪些要求":
-        if CHATBOT_MODE:
-            if args[0] in ['商品', '物品']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("[可以]透過兩岸支付通提領回[台灣]的[存款帳戶]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] in ['台灣','臺灣'] and '存款' in args[2]:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "特店的販售[商品]有哪些限制":
-        if CHATBOT_MODE:
-            if args[0] in ['商品', '物品']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("[可以]透過兩岸支付通讓[大陸][消費者]在[門市]使用[支付寶]付款嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] in ['大陸', '中國'] and args[4] == '支付寶':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "特店[網站]有哪些要求":
-        if CHATBOT_MODE:
-            if args[0] in ['網站', '網頁', '頁面']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("特店的販售[商品]有哪些要求")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['商品', '物品']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "特店[網站]有哪些限制":
-        if CHATBOT_MODE:
-            if args[0] in ['網站', '網頁', '頁面']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("特店的販售[商品]有哪些限制")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['商品', '物品']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "什麼是兩岸支付通":
-        if CHATBOT_MODE:
+@utteranceHandler("特店[網站]有哪些要求")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['網站', '網頁', '頁面']:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "[大陸][消費者]付款[流程]為何":
-        if CHATBOT_MODE:
-            if args[0] in ['大陸', '中國'] and args[1] in ['消費者', '買家', '客戶'] and args[2] in ['流程', '手續', '過程']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("特店[網站]有哪些限制")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['網站', '網頁', '頁面']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("什麼是兩岸支付通")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("[大陸][消費者]付款[流程]為何")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['大陸', '中國'] and args[1] in ['消費者', '買家', '客戶'] and args[2] in ['流程', '手續', '過程']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "如何退款":
-        if CHATBOT_MODE:
-            if "退" in inputSTR:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("如何退款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if "退" in inputSTR:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "撥款[週期]及撥款[幣別]為何":
-        if CHATBOT_MODE:
-            if args[0] in ['時間', '週期', '頻率', '幣別', '貨幣'] and args[1] in ['時間', '週期', '頻率', '幣別', '貨幣']:
-                resultDICT["response"] = getResponse(utterance, args)
+@utteranceHandler("撥款[週期]及撥款[幣別]為何")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['時間', '週期', '頻率', '幣別', '貨幣'] and args[1] in ['時間', '週期', '頻率', '幣別', '貨幣']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("撥款[幣別]為何")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['時間', '週期', '頻率']:
+            resultDICT["response"] = getResponse("撥款[週期]為何", args)
+        elif args[0] in ['幣別', '貨幣']:
+            resultDICT["response"] = getResponse("撥款[幣別]為何", args)
         else:
             pass
-        
-    if utterance == "撥款[幣別]為何":
-        if CHATBOT_MODE:
-            if args[0] in ['時間', '週期', '頻率']:
-                resultDICT["response"] = getResponse("撥款[週期]為何", args)
-            elif args[0] in ['幣別', '貨幣']:
-                resultDICT["response"] = getResponse("撥款[幣別]為何", args)
+    else:
+        pass
+
+@utteranceHandler("申請兩岸支付通服務需要支付哪些[費用]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['費用']:    
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("申請兩岸支付通服務需要開立[外幣][帳戶]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] in ['帳戶', '帳號', '戶頭']:
+            if args[0] not in ['台幣', '新台幣', '臺幣', '新臺幣']:
+                resultDICT["response"] = getResponse(utterance, args).format(args[0])
             else:
                 pass
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "申請兩岸支付通服務需要支付哪些[費用]":
-        if CHATBOT_MODE:
-            if args[0] in ['費用']:    
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("申請兩岸支付通需要準備哪些[資料]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['資料', '文件']:    
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "申請兩岸支付通服務需要開立[外幣][帳戶]嗎":
-        if CHATBOT_MODE:
-            if args[1] in ['帳戶', '帳號', '戶頭']:
-                if args[0] not in ['台幣', '新台幣', '臺幣', '新臺幣']:
-                    resultDICT["response"] = getResponse(utterance, args).format(args[0])
-                else:
-                    pass
-        else:
-            pass
+@utteranceHandler("需要標示[人民幣][價格]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '人民幣' and '價' in args[1]:    
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "申請兩岸支付通需要準備哪些[資料]":
-        if CHATBOT_MODE:
-            if args[0] in ['資料', '文件']:    
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
+    debugInfo(inputSTR, utterance)
+    for i in range(len(args)):
+        args[i] = args[i].lower().strip(' ')   # 前處理，把argument變小寫並去頭尾空格
 
-    if utterance == "需要標示[人民幣][價格]嗎":
-        if CHATBOT_MODE:
-            if args[0] == '人民幣' and '價' in args[1]:    
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    if utterance in utteranceDICT:
+        utteranceDICT[utterance](inputSTR, utterance, args, resultDICT, refDICT, pattern)
 
     return resultDICT
\ No newline at end of file
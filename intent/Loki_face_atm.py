@@ -16,6 +16,9 @@
         resultDICT    dict
 """
 
+from intent import userDefinedDICT
+from intent.reply_store import loadReply
+from bot_logging import getLogger
 from random import sample
 import json
 import os
@@ -23,23 +26,19 @@ import os
 DEBUG = True
 CHATBOT_MODE = True
 
-userDefinedDICT = {}
-try:
-    userDefinedDICT = json.load(open(os.path.join(os.path.dirname(__file__), "USER_DEFINED.json"), encoding="utf-8"))
-except Exception as e:
-    print("[ERROR] userDefinedDICT => {}".format(str(e)))
+logger = getLogger(__name__)
 
 responseDICT = {}
 if CHATBOT_MODE:
     try:
-        responseDICT = json.load(open(os.path.join(os.path.dirname(os.path.dirname(__file__)), os.path.join("reply", "reply_face_atm.json")), encoding="utf-8"))
+        responseDICT = loadReply("face_atm")
     except Exception as e:
-        print("[ERROR] responseDICT => {}".format(str(e)))
+        logger.error("[ERROR] responseDICT => %s", str(e))
 
-# 將符合句型的參數列表印出。這是 debug 或是開發用的。
+# 將符合句型的參數列表印出。這是 debug 或是開發用的。(log 等級為 DEBUG 時才會輸出，例如 log_levels=intent=DEBUG)
 def debugInfo(inputSTR, utterance):
     if DEBUG:
-        print("[face_atm] {} ===> {}".format(inputSTR, utterance))
+        logger.debug("[face_atm] %s ===> %s", inputSTR, utterance)
 
 def getResponse(utterance, args):
     resultSTR = ""
@@ -49,127 +48,157 @@ def getResponse(utterance, args):
 
     return resultSTR
 
-def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
-    debugInfo(inputSTR, utterance)
-    for i in range(len(args)):
-        args[i] = args[i].lower().strip(' ')   # 前處理，把argument變小寫並去頭尾空格
-    
-    if utterance == "[別人]拿[我]的[照片]來使用刷臉提款怎麼辦":
-        if CHATBOT_MODE:
-            if args[1] == '我' and args[2] in ['照片', '相片']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "[行動]無卡提款之無卡交易密碼和刷臉提款之無卡交易密碼[一樣]嗎":
-        if CHATBOT_MODE:
-            if args[1] in ['一樣', '相同']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "金融卡[不見]了還[可以]使用刷臉提款嗎":
-        if CHATBOT_MODE:
-            if args[0] == '不見':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "刷臉提款時辨識[失敗]怎麼辦":
-        if CHATBOT_MODE:
-            if args[0] == '失敗':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "刷臉提款的[限額]":
-        if CHATBOT_MODE:
-            if args[0] == '限額':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "刷臉辨識時如何操作[可]提升辨識[成功率]":
-        if CHATBOT_MODE:
-            if args[1] == '成功率':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "如何使用刷臉來提款":
-        if CHATBOT_MODE:
+# utterance => 處理函式，於 import 時建立，getResult() 直接查表，不必逐一比對 utterance
+utteranceDICT = {}
+
+def utteranceHandler(utteranceSTR):
+    def register(handlerFUNC):
+        utteranceDICT[utteranceSTR] = handlerFUNC
+        return handlerFUNC
+    return register
+
+@utteranceHandler("[別人]拿[我]的[照片]來使用刷臉提款怎麼辦")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] == '我' and args[2] in ['照片', '相片']:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "如何申請刷臉提款":
-        if CHATBOT_MODE:
+@utteranceHandler("[行動]無卡提款之無卡交易密碼和刷臉提款之無卡交易密碼[一樣]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] in ['一樣', '相同']:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "如何註銷刷臉提款":
-        if CHATBOT_MODE:
+@utteranceHandler("金融卡[不見]了還[可以]使用刷臉提款嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '不見':
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "想更新刷臉[ID]":
-        if CHATBOT_MODE:
-            if args[0] == 'id':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "掛失金融卡需要再[重新]開通刷臉提款服務嗎":
-        if CHATBOT_MODE:
+    else:
+        pass
+
+@utteranceHandler("刷臉提款時辨識[失敗]怎麼辦")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '失敗':
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "更換金融卡需要再[重新]開通刷臉提款服務嗎":
-        if CHATBOT_MODE:
+@utteranceHandler("刷臉提款的[限額]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '限額':
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "補發金融卡需要再[重新]開通刷臉提款服務嗎":
-        if CHATBOT_MODE:
+@utteranceHandler("刷臉辨識時如何操作[可]提升辨識[成功率]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] == '成功率':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("如何使用刷臉來提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("如何申請刷臉提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("如何註銷刷臉提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("想更新刷臉[ID]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == 'id':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("掛失金融卡需要再[重新]開通刷臉提款服務嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("更換金融卡需要再[重新]開通刷臉提款服務嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("補發金融卡需要再[重新]開通刷臉提款服務嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("設定刷臉[ID]有無[特殊][注意事項]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == 'id' and args[2] in ['注意事項', '規定']:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "設定刷臉[ID]有無[特殊][注意事項]":
-        if CHATBOT_MODE:
-            if args[0] == 'id' and args[2] in ['注意事項', '規定']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "開通時使用的金融卡[會]影響刷臉提款時[能]選擇的提領[帳戶]嗎":
-        if CHATBOT_MODE:
-            if args[2] in ['帳戶', '戶頭', '帳號']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "[外國人][能]否使用刷臉提款":
-        if CHATBOT_MODE:
-            if '國' or '民' in args[0]:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "[美國][人][能]否使用刷臉提款":
-        if CHATBOT_MODE:
+    else:
+        pass
+
+@utteranceHandler("開通時使用的金融卡[會]影響刷臉提款時[能]選擇的提領[帳戶]嗎")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[2] in ['帳戶', '戶頭', '帳號']:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "身份證字號重號[能]否使用刷臉提款":
-        if CHATBOT_MODE:
+    else:
+        pass
+
+@utteranceHandler("[外國人][能]否使用刷臉提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if '國' or '民' in args[0]:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
+    else:
+        pass
+
+@utteranceHandler("[美國][人][能]否使用刷臉提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("身份證字號重號[能]否使用刷臉提款")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
+    debugInfo(inputSTR, utterance)
+    for i in range(len(args)):
+        args[i] = args[i].lower().strip(' ')   # 前處理，把argument變小寫並去頭尾空格
+
+    if utterance in utteranceDICT:
+        utteranceDICT[utterance](inputSTR, utterance, args, resultDICT, refDICT, pattern)
+
     return resultDICT
\ No newline at end of file
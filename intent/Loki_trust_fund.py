@@ -16,6 +16,9 @@
         resultDICT    dict
 """
 
+from intent import userDefinedDICT
+from intent.reply_store import loadReply
+from bot_logging import getLogger
 from random import sample
 import json
 import os
@@ -23,23 +26,19 @@ import os
 DEBUG = True
 CHATBOT_MODE = True
 
-userDefinedDICT = {}
-try:
-    userDefinedDICT = json.load(open(os.path.join(os.path.dirname(__file__), "USER_DEFINED.json"), encoding="utf-8"))
-except Exception as e:
-    print("[ERROR] userDefinedDICT => {}".format(str(e)))
+logger = getLogger(__name__)
 
 responseDICT = {}
 if CHATBOT_MODE:
     try:
-        responseDICT = json.load(open(os.path.join(os.path.dirname(os.path.dirname(__file__)), os.path.join("reply", "reply_trust_fund.json")), encoding="utf-8"))
+        responseDICT = loadReply("trust_fund")
     except Exception as e:
-        print("[ERROR] responseDICT => {}".format(str(e)))
+        logger.error("[ERROR] responseDICT => %s", str(e))
 
-# 將符合句型的參數列表印出。這是 debug 或是開發用的。
+# 將符合句型的參數列表印出。這是 debug 或是開發用的。(log 等級為 DEBUG 時才會輸出，例如 log_levels=intent=DEBUG)
 def debugInfo(inputSTR, utterance):
     if DEBUG:
-        print("[trust_fund] {} ===> {}".format(inputSTR, utterance))
+        logger.debug("[trust_fund] %s ===> %s", inputSTR, utterance)
 
 def getResponse(utterance, args):
     resultSTR = ""
@@ -49,143 +48,174 @@ def getResponse(utterance, args):
 
     return resultSTR
 
-def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
-    debugInfo(inputSTR, utterance)
+# utterance => 處理函式，於 import 時建立，getResult() 直接查表，不必逐一比對 utterance
+utteranceDICT = {}
+
+def utteranceHandler(utteranceSTR):
+    def register(handlerFUNC):
+        utteranceDICT[utteranceSTR] = handlerFUNC
+        return handlerFUNC
+    return register
+
+@utteranceHandler("[公司][應]於何時辦理[其]發行股票之簽證")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("[有價]證券信託的[定義]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '有價':
+            if args[1] in ['特色', '特點']:
+                resultDICT["response"] = getResponse('[有價]證券信託的[特色]', args)
+            elif args[1] in ['定義']:
+                resultDICT["response"] = getResponse(utterance, args)
+            else:
+                pass
+    else:
+        pass
+
+@utteranceHandler("[財產]交付信託[業者]有什麼保障")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[1] == '業者':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("何謂[信託]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['信託', '全權委託保管機構', '基金保管機構', '自益信託', '他益信託']:
+            resultDICT["response"] = getResponse("何謂[{}]".format(args[0]), args)
+    else:
+        pass
+
+@utteranceHandler("何謂[自益信託][他益信託]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] and args[1] in ['自益信託', '他益信託']:
+            resultDICT["response"] = "關於{}和{}，說明如下~\n\n" + getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("何謂信託借券")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+@utteranceHandler("來臺從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[2]:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[公司][應]於何時辦理[其]發行股票之簽證":
-        if CHATBOT_MODE:
+@utteranceHandler("[台]從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '台' and args[1] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[3]:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "[有價]證券信託的[定義]":
-        if CHATBOT_MODE:
-            if args[0] == '有價':
-                if args[1] in ['特色', '特點']:
-                    resultDICT["response"] = getResponse('[有價]證券信託的[特色]', args)
-                elif args[1] in ['定義']:
-                    resultDICT["response"] = getResponse(utterance, args)
-                else:
-                    pass
-        else:
-            pass
-        
-    if utterance == "[財產]交付信託[業者]有什麼保障":
-        if CHATBOT_MODE:
-            if args[1] == '業者':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "何謂[信託]":
-        if CHATBOT_MODE:
-            if args[0] in ['信託', '全權委託保管機構', '基金保管機構', '自益信託', '他益信託']:
-                resultDICT["response"] = getResponse("何謂[{}]".format(args[0]), args)
-        else:
-            pass
-        
-    if utterance == "何謂[自益信託][他益信託]":
-        if CHATBOT_MODE:
-            if args[0] and args[1] in ['自益信託', '他益信託']:
-                resultDICT["response"] = "關於{}和{}，說明如下~\n\n" + getResponse(utterance, args)
-        else:
-            pass
-
-    if utterance == "何謂信託借券":
-        if CHATBOT_MODE:
+    else:
+        pass
+
+@utteranceHandler("[台灣]從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['台灣', '臺灣'] and args[1] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[3]:
             resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+    else:
+        pass
 
-    if utterance == "來臺從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限":
-        if CHATBOT_MODE:
-            if args[0] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[2]:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "[台]從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限":
-        if CHATBOT_MODE:
-            if args[0] == '台' and args[1] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[3]:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "[台灣]從事[證券]投資或[期貨]交易之[大陸]地區投資人以何為限":
-        if CHATBOT_MODE:
-            if args[0] in ['台灣', '臺灣'] and args[1] in ['證券', '期貨', '股票'] and '中國' or '大陸' in args[3]:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
-        
-    if utterance == "儲蓄信託最大[特色]":
-        if CHATBOT_MODE:
-            if args[0] in ['特色', '特點']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("儲蓄信託最大[特色]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['特色', '特點']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "員工持股/儲蓄信託之[優點]":
-        if CHATBOT_MODE:
-            if args[0] in ['優點', '好處', '優勢', '利多']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("員工持股/儲蓄信託之[優點]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['優點', '好處', '優勢', '利多']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "員工持股/儲蓄信託最大[特色]":
-        if CHATBOT_MODE:
-            if args[0] in ['特色', '特點']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("員工持股/儲蓄信託最大[特色]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['特色', '特點']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "員工持股最大[特色]":
-        if CHATBOT_MODE:
-            if args[0] in ['特色', '特點']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("員工持股最大[特色]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['特色', '特點']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "如欲辦理股票簽證[業務][該]如何辦理":
-        if CHATBOT_MODE:
-            if args[0] == '業務':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("如欲辦理股票簽證[業務][該]如何辦理")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '業務':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "[目前][可]辦理哪些保管[業務]":
-        if CHATBOT_MODE:
-            if args[2] == '業務':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("[目前][可]辦理哪些保管[業務]")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[2] == '業務':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "信託[業務]包含哪些":
-        if CHATBOT_MODE:
-            if args[0] == '業務':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("信託[業務]包含哪些")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] == '業務':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "為何[外資]或[陸資]欲進行[國內]投資需指定保管[機構]為代理人":
-        if CHATBOT_MODE:
-            if args[0] in ['外資', '陸資', '中資'] and args[1] in ['外資', '陸資', '中資'] and args[2] == '國內':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("為何[外資]或[陸資]欲進行[國內]投資需指定保管[機構]為代理人")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['外資', '陸資', '中資'] and args[1] in ['外資', '陸資', '中資'] and args[2] == '國內':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "為何[外資]欲進行[國內]投資需指定保管[機構]為代理人":
-        if CHATBOT_MODE:
-            if args[0] in ['外資', '陸資', '中資'] and args[1] == '國內':
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("為何[外資]欲進行[國內]投資需指定保管[機構]為代理人")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['外資', '陸資', '中資'] and args[1] == '國內':
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
 
-    if utterance == "符合什麼[條件]之[公司]需辦理[其]股票簽證":
-        if CHATBOT_MODE:
-            if args[0] in ['條件', '標準'] and args[1] in ['公司', '企業']:
-                resultDICT["response"] = getResponse(utterance, args)
-        else:
-            pass
+@utteranceHandler("符合什麼[條件]之[公司]需辦理[其]股票簽證")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        if args[0] in ['條件', '標準'] and args[1] in ['公司', '企業']:
+            resultDICT["response"] = getResponse(utterance, args)
+    else:
+        pass
+
+def getResult(inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
+    debugInfo(inputSTR, utterance)
+
+    if utterance in utteranceDICT:
+        utteranceDICT[utterance](inputSTR, utterance, args, resultDICT, refDICT, pattern)
 
     return resultDICT
\ No newline at end of file
@@ -27,7 +27,9 @@ USER_DEFINED_FILE = "USER_DEFINED.json"
 intentFilePAT = re.compile("^Loki_.+(?<!_updated)\.py$") #排除 1.0 產生的 _updted.py 檔案
 intentFileNamePAT = re.compile("^Loki_(.+)\.py$")
 chatbotModePAT = re.compile("^CHATBOT_MODE = (True|False)")
-utterancePAT = re.compile("if utterance == \".+\":$")
+utterancePAT = re.compile("if utterance == \"(.+)\":$")
+handlerPAT = re.compile("^@utteranceHandler\\(\"(.+)\"\\)")
+getResultPAT = re.compile("^def getResult\\(")
 userDefinedPAT = re.compile("userDefinedDICT = (\{.*\})$")
 endResultPAT = re.compile("^    return resultDICT$")
 
@@ -49,13 +51,18 @@ def updateUtterance(newIntentPath):
                 sourceLIST = sourceLIST[:-1]
 
             # 取出舊 intent 中的句型
+            # 舊 intent 可能是 if utterance == "..." 或 @utteranceHandler("...") 寫法
             intentLIST = []
             chatbotBOOL = False
+            handlerBOOL = False
             for source in sourceLIST:
                 if chatbotModePAT.search(source):
                     chatbotBOOL = True
                 for g in utterancePAT.finditer(source):
-                    intentLIST.append(g.group())
+                    intentLIST.append(g.group(1))
+                for g in handlerPAT.finditer(source):
+                    intentLIST.append(g.group(1))
+                    handlerBOOL = True
 
             # 取出新 intent 中的句型
             newIntentLIST = []
@@ -63,12 +70,41 @@ def updateUtterance(newIntentPath):
                 lineLIST = f.readlines()
                 for line in lineLIST:
                     for g in utterancePAT.finditer(line):
-                        newIntentLIST.append(g.group())
+                        newIntentLIST.append(g.group(1))
+                    for g in handlerPAT.finditer(line):
+                        newIntentLIST.append(g.group(1))
 
             # 新 intent 中的句型不存在於舊 intent 裡才更新
             updatedBOOL = False
             for newIntent in newIntentLIST:
-                if newIntent not in intentLIST:
+                if newIntent in intentLIST:
+                    continue
+
+                if handlerBOOL:
+                    # @utteranceHandler 寫法：新增在 getResult() 之前
+                    indexINT = [i for i, source in enumerate(sourceLIST) if getResultPAT.search(source)][-1]
+                    if chatbotBOOL:
+                        sourceLIST.insert(indexINT, """@utteranceHandler("{}")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    if CHATBOT_MODE:
+        resultDICT["response"] = getResponse(utterance, args)
+    else:
+        # write your code here
+        pass
+
+""".format(newIntent))
+                    else:
+                        sourceLIST.insert(indexINT, """@utteranceHandler("{}")
+def _(inputSTR, utterance, args, resultDICT, refDICT, pattern):
+    # write your code here
+    pass
+
+""".format(newIntent))
+
+                    updatedBOOL = True
+                    print("=> 新增 {}".format(newIntent))
+
+                else:
                     indexLIST = [i for i, source in enumerate(sourceLIST) if utterancePAT.search(source)]
                     if indexLIST:
                         indexINT = indexLIST[-1]
@@ -77,7 +113,7 @@ def updateUtterance(newIntentPath):
                         indexINT = indexLIST[-1]
 
                     if chatbotBOOL:
-                        sourceLIST.insert(indexINT, """    {}
+                        sourceLIST.insert(indexINT, """    if utterance == "{}":
         if CHATBOT_MODE:
             resultDICT["response"] = getResponse(utterance, args)
         else:
@@ -86,7 +122,7 @@ def updateUtterance(newIntentPath):
 
 """.format(newIntent))
                     else:
-                        sourceLIST.insert(indexINT, """    {}
+                        sourceLIST.insert(indexINT, """    if utterance == "{}":
         # write your code here
         pass
 
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    intent 模組共用的資源
+
+    USER_DEFINED.json 只在第一個意圖模組被 import 時讀取一次，所有 Loki_*.py 共用同一份 userDefinedDICT
+"""
+
+import json
+import os
+
+from bot_logging import getLogger
+
+logger = getLogger(__name__)
+
+userDefinedDICT = {}
+try:
+    userDefinedDICT = json.load(open(os.path.join(os.path.dirname(__file__), "USER_DEFINED.json"), encoding="utf-8"))
+except Exception as e:
+    logger.error("[ERROR] userDefinedDICT => %s", str(e))
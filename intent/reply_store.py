@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+名稱： Reply Store
+說明： 將 reply/reply_*.json 編譯成單一的二進位檔 reply/reply.bin，
+      各 worker 以 mmap 唯讀開啟，所有 worker 共用同一份 page cache，
+      回覆字串只在被抽中時才從 mmap 切片解碼，不必在每個 worker 的 heap 中保留整份 dict。
+範例： python3 intent/reply_store.py       # 重新編譯 reply/reply.bin
+
+檔案格式 (little-endian)：
+    header   "RPLY" + version (u32) + keyCount (u32)
+    index    keyCount 筆 (keyOffset u32, keyLen u32, entryStart u32, entryCount u32)，依 key 的 UTF-8 bytes 排序
+    entries  每個回覆字串一筆 (offset u32, length u32)
+    blob     key 與回覆字串的 UTF-8 內容
+    * key 為 "{intent}\t{utterance}"
+"""
+
+from collections.abc import Mapping, Sequence
+from glob import glob
+from pathlib import Path
+from threading import Lock
+import json
+import mmap
+import os
+import struct
+import sys
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_PATH not in sys.path:
+    # 以 python3 intent/reply_store.py 執行時 repo 根目錄不在 sys.path 中
+    sys.path.append(BASE_PATH)
+
+from bot_logging import getLogger
+
+REPLY_PATH = os.path.join(BASE_PATH, "reply")
+REPLY_STORE_FILE = os.path.join(REPLY_PATH, "reply.bin")
+
+MAGIC = b"RPLY"
+VERSION = 1
+HEADER_STRUCT = struct.Struct("<4sII")
+INDEX_STRUCT = struct.Struct("<IIII")
+ENTRY_STRUCT = struct.Struct("<II")
+
+logger = getLogger(__name__)
+
+
+def build(replyPath=REPLY_PATH, storeFile=REPLY_STORE_FILE):
+    """
+    讀取 replyPath 下所有 reply_*.json 並寫出 storeFile，回傳 key 數量
+    """
+    replyDICT = {}
+    for replyFile in sorted(glob(os.path.join(replyPath, "reply_*.json"))):
+        intentSTR = Path(replyFile).stem[6:]
+        with open(replyFile, encoding="utf-8") as f:
+            for utteranceSTR, responseLIST in json.load(f).items():
+                replyDICT["{}\t{}".format(intentSTR, utteranceSTR).encode("utf-8")] = [r.encode("utf-8") for r in responseLIST]
+
+    keyLIST = sorted(replyDICT)
+    entryINT = sum(len(replyDICT[k]) for k in keyLIST)
+    blobOffsetINT = HEADER_STRUCT.size + INDEX_STRUCT.size * len(keyLIST) + ENTRY_STRUCT.size * entryINT
+
+    indexLIST = []
+    entryLIST = []
+    blobLIST = []
+    offsetINT = blobOffsetINT
+    for key in keyLIST:
+        keyOffsetINT = offsetINT
+        blobLIST.append(key)
+        offsetINT += len(key)
+        indexLIST.append(INDEX_STRUCT.pack(keyOffsetINT, len(key), len(entryLIST), len(replyDICT[key])))
+        for responseBYTES in replyDICT[key]:
+            entryLIST.append(ENTRY_STRUCT.pack(offsetINT, len(responseBYTES)))
+            blobLIST.append(responseBYTES)
+            offsetINT += len(responseBYTES)
+
+    # 先寫到暫存檔再取代，避免執行中的 worker 讀到寫一半的檔案
+    tmpFile = "{}.{}.tmp".format(storeFile, os.getpid())
+    with open(tmpFile, "wb") as f:
+        f.write(HEADER_STRUCT.pack(MAGIC, VERSION, len(keyLIST)))
+        f.write(b"".join(indexLIST))
+        f.write(b"".join(entryLIST))
+        f.write(b"".join(blobLIST))
+    os.replace(tmpFile, storeFile)
+    return len(keyLIST)
+
+
+class ReplyList(Sequence):
+    """
+    單一 utterance 的回覆列表，取值時才從 mmap 切片解碼
+    """
+    def __init__(self, store, entryStartINT, entryCountINT):
+        self.store = store
+        self.entryStartINT = entryStartINT
+        self.entryCountINT = entryCountINT
+
+    def __len__(self):
+        return self.entryCountINT
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.entryCountINT))]
+        if index < 0:
+            index += self.entryCountINT
+        if not 0 <= index < self.entryCountINT:
+            raise IndexError("reply index out of range")
+        offsetINT, lengthINT = ENTRY_STRUCT.unpack_from(self.store.buffer, self.store.entryOffsetINT + (self.entryStartINT + index) * ENTRY_STRUCT.size)
+        return str(self.store.buffer[offsetINT:offsetINT+lengthINT], "utf-8")
+
+
+class ReplyView(Mapping):
+    """
+    單一 intent 的 {utterance: ReplyList}，可直接取代原本 json.load() 的 responseDICT
+    """
+    def __init__(self, store, intentSTR):
+        self.store = store
+        self.prefixBYTES = "{}\t".format(intentSTR).encode("utf-8")
+
+    def __getitem__(self, utteranceSTR):
+        replyLIST = self.store.find(self.prefixBYTES + utteranceSTR.encode("utf-8"))
+        if replyLIST is None:
+            raise KeyError(utteranceSTR)
+        return replyLIST
+
+    def __contains__(self, utteranceSTR):
+        return isinstance(utteranceSTR, str) and self.store.find(self.prefixBYTES + utteranceSTR.encode("utf-8")) is not None
+
+    def __iter__(self):
+        for i in range(self.store.keyCountINT):
+            keyBYTES = self.store.getKey(i).tobytes()
+            if keyBYTES.startswith(self.prefixBYTES):
+                yield keyBYTES[len(self.prefixBYTES):].decode("utf-8")
+
+    def __len__(self):
+        return sum(1 for k in self)
+
+
+class ReplyStore():
+    def __init__(self, storeFile=REPLY_STORE_FILE):
+        with open(storeFile, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mmap)
+        magicBYTES, versionINT, self.keyCountINT = HEADER_STRUCT.unpack_from(self.buffer, 0)
+        if magicBYTES != MAGIC or versionINT != VERSION:
+            raise ValueError("{} is not a reply store (version {})".format(storeFile, VERSION))
+        self.indexOffsetINT = HEADER_STRUCT.size
+        self.entryOffsetINT = self.indexOffsetINT + INDEX_STRUCT.size * self.keyCountINT
+
+    def getKey(self, index):
+        keyOffsetINT, keyLenINT, entryStartINT, entryCountINT = INDEX_STRUCT.unpack_from(self.buffer, self.indexOffsetINT + index * INDEX_STRUCT.size)
+        return self.buffer[keyOffsetINT:keyOffsetINT+keyLenINT]
+
+    def find(self, keyBYTES):
+        # 依排序後的 key 做二分搜尋
+        lowINT = 0
+        highINT = self.keyCountINT
+        while lowINT < highINT:
+            midINT = (lowINT + highINT) // 2
+            midBYTES = self.getKey(midINT).tobytes()
+            if midBYTES < keyBYTES:
+                lowINT = midINT + 1
+            elif midBYTES > keyBYTES:
+                highINT = midINT
+            else:
+                keyOffsetINT, keyLenINT, entryStartINT, entryCountINT = INDEX_STRUCT.unpack_from(self.buffer, self.indexOffsetINT + midINT * INDEX_STRUCT.size)
+                return ReplyList(self, entryStartINT, entryCountINT)
+        return None
+
+    def getIntent(self, intentSTR):
+        return ReplyView(self, intentSTR)
+
+
+replyStore = None
+replyStoreLock = Lock()
+
+def isStale(storeFile=REPLY_STORE_FILE, replyPath=REPLY_PATH):
+    if not os.path.exists(storeFile):
+        return True
+    storeMtime = os.path.getmtime(storeFile)
+    return any(os.path.getmtime(f) > storeMtime for f in glob(os.path.join(replyPath, "reply_*.json")))
+
+def getReplyStore():
+    global replyStore
+    if replyStore is None:
+        with replyStoreLock:
+            if replyStore is None:
+                if isStale():
+                    return None
+                replyStore = ReplyStore()
+    return replyStore
+
+def loadReply(intentSTR):
+    """
+    回傳 intent 的 responseDICT
+    reply.bin 存在且比所有 reply_*.json 新時使用 mmap，否則退回讀取 reply_{intent}.json
+    """
+    try:
+        store = getReplyStore()
+    except Exception as e:
+        logger.error("[ERROR] ReplyStore => %s", str(e))
+        store = None
+
+    if store is not None:
+        return store.getIntent(intentSTR)
+
+    with open(os.path.join(REPLY_PATH, "reply_{}.json".format(intentSTR)), encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    keyINT = build()
+    print("[Success] {} ({} utterances)".format(REPLY_STORE_FILE, keyINT))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    LINE Messaging API 共用的 client 與 webhook 驗證
+
+    原本每個 webhook 都重新建立 LineBotApi(access_token) 與 WebhookHandler(secret)：每次重讀環境變數，
+    SDK 預設的 RequestsHttpClient 以 requests.post() 呼叫 (每次新的 Session 與 TCP + TLS 連線)，
+    WebhookHandler.handle() 也會把已經 json.loads() 過的 body 再 parse 一次 (而且沒有註冊任何 handler)。
+
+    * getLineBotApi()：每個 worker 只建立一次 LineBotApi，以 PooledHttpClient 共用 api.line.me 的連線池 (keep-alive)；
+      每個 thread 各自有一個 requests.Session，但都掛載同一個 HTTPAdapter，與 loki_session.py 相同
+    * parseWebhook()：直接以收到的 bytes 驗證 X-Line-Signature (不先 decode 成字串再 encode 回來)，
+      通過後只 json.loads() 一次；簽章錯誤或沒有設定 channel_secret 時 raise InvalidSignatureError
+
+    設定 (環境變數):
+        access_token        channel access token
+        channel_secret      channel secret
+        line_pool_size      連線池大小 (預設 10)
+        line_timeout        呼叫 LINE API 的 timeout 秒數 (預設 5)
+
+    e.g.
+        json_data = parseWebhook(request.get_data(), request.headers['X-Line-Signature'])
+        getLineBotApi().reply_message(tk, TextSendMessage("..."))
+"""
+
+from linebot import LineBotApi
+from linebot.exceptions import InvalidSignatureError
+from linebot.http_client import RequestsHttpClient, RequestsHttpResponse
+from requests import Session
+from requests.adapters import HTTPAdapter
+from threading import Lock, local
+import base64
+import hashlib
+import hmac
+import json
+import os
+
+ACCESS_TOKEN = os.environ.get("access_token")
+CHANNEL_SECRET = os.environ.get("channel_secret")
+LINE_POOL_SIZE = int(os.environ.get("line_pool_size", 10))
+LINE_TIMEOUT = float(os.environ.get("line_timeout", 5))
+
+secretBYTES = CHANNEL_SECRET.encode("utf-8") if CHANNEL_SECRET else None
+
+apiLock = Lock()
+apiDICT = {}            # pid => LineBotApi，fork 後的子行程不沿用父行程的連線
+
+
+class PooledHttpClient(RequestsHttpClient):
+    """
+    與 RequestsHttpClient 相同，但共用連線池，不再每次呼叫都建立新的連線
+    """
+    def __init__(self, timeout=LINE_TIMEOUT):
+        super().__init__(timeout)
+        # reply token 只能使用一次，這裡不重試 (由呼叫端決定是否改用 push_message)
+        self.adapter = HTTPAdapter(pool_connections=LINE_POOL_SIZE, pool_maxsize=LINE_POOL_SIZE, max_retries=0)
+        self.threadLocal = local()
+
+    def getSession(self):
+        session = getattr(self.threadLocal, "session", None)
+        if session is None:
+            session = Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self.threadLocal.session = session
+        return session
+
+    def request(self, methodSTR, url, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return RequestsHttpResponse(self.getSession().request(methodSTR, url, timeout=timeout, **kwargs))
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        return self.request("GET", url, headers=headers, params=params, stream=stream, timeout=timeout)
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        return self.request("POST", url, headers=headers, data=data, timeout=timeout)
+
+    def delete(self, url, headers=None, data=None, timeout=None):
+        return self.request("DELETE", url, headers=headers, data=data, timeout=timeout)
+
+    def put(self, url, headers=None, data=None, timeout=None):
+        return self.request("PUT", url, headers=headers, data=data, timeout=timeout)
+
+
+def getLineBotApi(accessTokenSTR=ACCESS_TOKEN):
+    """
+    回傳這個 worker 共用的 LineBotApi (第一次呼叫時才建立)
+    """
+    pid = os.getpid()
+    lineBotApi = apiDICT.get(pid)
+    if lineBotApi is None:
+        with apiLock:
+            if pid not in apiDICT:
+                apiDICT.clear()
+                # LineBotApi 以 http_client(timeout=timeout) 建立 client，timeout 必須在這裡傳入 (否則為 SDK 預設的 5 秒)
+                apiDICT[pid] = LineBotApi(accessTokenSTR or "", timeout=LINE_TIMEOUT, http_client=PooledHttpClient)
+            lineBotApi = apiDICT[pid]
+    return lineBotApi
+
+def verifySignature(bodyBYTES, signatureSTR, secret=None):
+    """
+    與 linebot.SignatureValidator.validate() 相同，但直接使用 request 的 bytes
+    """
+    if secret is None:
+        secret = secretBYTES
+    if not secret or not signatureSTR:
+        return False
+    digest = hmac.new(secret, bodyBYTES, hashlib.sha256).digest()
+    return hmac.compare_digest(base64.b64encode(digest), signatureSTR.encode("utf-8"))
+
+def parseWebhook(bodyBYTES, signatureSTR, secret=None):
+    """
+    驗證簽章並回傳 webhook 的內容 (dict)，body 只 parse 一次
+    """
+    if not verifySignature(bodyBYTES, signatureSTR, secret):
+        raise InvalidSignatureError("Invalid signature. signature={}".format(signatureSTR))
+    return json.loads(bodyBYTES)
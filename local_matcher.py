@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    本機意圖比對器
+
+    將 Loki_backup/*.ref 中的 utterance、lexy 及 user_defined 編譯成一棵 trie，
+    在本機比對輸入句，回傳與 BulkAPI result_list 相同格式的結果：
+        {
+            "status": True,
+            "msg": "Success!",
+            "results": [
+                {
+                    "intent": "intentName",
+                    "pattern": "",
+                    "utterance": "matchUtterance",
+                    "argument": ["arg1", "arg2", ... "argN"]
+                }
+            ]
+        }
+    比對不到時回傳 None，由呼叫端再送到 Loki。
+
+    * utterance 的 [參數] 位置以 intent/Loki_*.py 中實際使用的 utterance 為準 (.ref 備份可能比較舊)，
+      .ref 則提供 utterance 清單、參數的 lexy 同義詞 (僅 checked) 與 user_defined 詞典。
+    * 為了避免誤判，整句必須完全符合 utterance：非參數的部分逐字比對，
+      參數只接受原本的詞、勾選的 lexy，以及同一個 user_defined 同義詞組 (as_ 開頭的詞性類別除外) 的詞。
+    * 同一句符合多個意圖的 utterance 時 (例如「如何設定約定轉入帳號」同時屬於 customer_service 與 web_bank)，
+      本機無法判斷使用者要問哪一個，回傳 None 交給 Loki。
+
+    設定 (環境變數):
+        local_matcher       是否啟用本機比對 (預設 true)
+"""
+
+from glob import glob
+from pathlib import Path
+from threading import Lock
+import json
+import os
+import re
+
+from bot_logging import getLogger
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+REF_PATH = os.path.join(BASE_PATH, "Loki_backup")
+INTENT_PATH = os.path.join(BASE_PATH, "intent")
+
+LOCAL_MATCHER = os.environ.get("local_matcher", "true").lower() in ["1", "true", "yes"]
+
+logger = getLogger(__name__)
+
+UTTERANCE_PAT = re.compile("^(?:@utteranceHandler\\(| *if utterance == )\"([^\"]+)\"", re.M)
+SEGMENT_PAT = re.compile(r"\[([^\[\]]+)\]|([^\[\]]+)")
+STRIP_STR = " \t?？!！。.~～"
+
+
+class TrieNode():
+    def __init__(self):
+        self.childDICT = {}         # (text, isArg) => TrieNode
+        self.indexDICT = {}         # 第一個字 => [(text, isArg), ...]
+        self.terminalLIST = []      # [(intent, utterance), ...]
+
+    def getChild(self, textSTR, isArgBOOL):
+        key = (textSTR, isArgBOOL)
+        if key not in self.childDICT:
+            self.childDICT[key] = TrieNode()
+            self.indexDICT.setdefault(textSTR[0], []).append(key)
+        return self.childDICT[key]
+
+
+class LocalMatcher():
+    def __init__(self, refPath=REF_PATH, intentPath=INTENT_PATH):
+        self.refPath = refPath
+        self.intentPath = intentPath
+        self.root = None
+        self.utteranceINT = 0
+        self.lock = Lock()
+
+    def build(self):
+        # 讀取 .ref：utterance 清單、lexy、user_defined
+        refDICT = {}
+        synonymDICT = {}            # 詞 => 同義詞組
+        for refFile in sorted(glob(os.path.join(self.refPath, "*.ref"))):
+            try:
+                with open(refFile, encoding="utf-8") as f:
+                    refDICT[Path(refFile).stem] = json.load(f)
+            except Exception as e:
+                logger.error("[ERROR] LocalMatcher %s => %s", refFile, str(e))
+                continue
+            for categorySTR, wordLIST in refDICT[Path(refFile).stem].get("user_defined", {}).items():
+                if categorySTR.startswith("as_"):
+                    continue
+                wordSET = set(w.lower() for w in wordLIST)
+                for word in wordSET:
+                    synonymDICT.setdefault(word, set()).update(wordSET)
+
+        root = TrieNode()
+        utteranceINT = 0
+        for intentSTR, intentRefDICT in refDICT.items():
+            # intent 模組中的 utterance (含 [參數] 位置)
+            modulePath = os.path.join(self.intentPath, "Loki_{}.py".format(intentSTR))
+            if not os.path.exists(modulePath):
+                continue
+            with open(modulePath, encoding="utf-8") as f:
+                moduleUtteranceLIST = [g.group(1) for g in UTTERANCE_PAT.finditer(f.read())]
+
+            for utteranceSTR in moduleUtteranceLIST:
+                # .ref 中參數的 lexy (只取 checked 的同義詞)
+                lexyDICT = {}
+                refUtteranceDICT = intentRefDICT.get("utterance", {}).get(re.sub(r"[\[\]]", "", utteranceSTR), {})
+                for argDICT in refUtteranceDICT.get("argument", []):
+                    lexyDICT[argDICT["text"].lower()] = [l["text"].lower() for l in argDICT.get("lexy", []) if l["checked"]]
+
+                nodeLIST = [root]
+                for g in SEGMENT_PAT.finditer(utteranceSTR.lower()):
+                    if g.group(1) is not None:
+                        argSTR = g.group(1)
+                        altSET = set([argSTR]) | synonymDICT.get(argSTR, set()) | set(lexyDICT.get(argSTR, []))
+                        nodeLIST = [node.getChild(altSTR, True) for node in nodeLIST for altSTR in sorted(altSET)]
+                    else:
+                        for charSTR in g.group(2):
+                            nodeLIST = [node.getChild(charSTR, False) for node in nodeLIST]
+                for node in nodeLIST:
+                    node.terminalLIST.append((intentSTR, utteranceSTR))
+                utteranceINT += 1
+
+        self.root = root
+        self.utteranceINT = utteranceINT
+
+    def getRoot(self):
+        if self.root is None:
+            with self.lock:
+                if self.root is None:
+                    self.build()
+        return self.root
+
+    def search(self, node, inputSTR, posINT, argLIST, resultLIST):
+        if posINT == len(inputSTR):
+            for intentSTR, utteranceSTR in node.terminalLIST:
+                resultLIST.append((intentSTR, utteranceSTR, list(argLIST)))
+            return
+
+        for key in node.indexDICT.get(inputSTR[posINT], []):
+            textSTR, isArgBOOL = key
+            if inputSTR.startswith(textSTR, posINT):
+                if isArgBOOL:
+                    argLIST.append((posINT, posINT + len(textSTR)))
+                self.search(node.childDICT[key], inputSTR, posINT + len(textSTR), argLIST, resultLIST)
+                if isArgBOOL:
+                    argLIST.pop()
+
+    def match(self, inputSTR, filterLIST=[]):
+        """
+        回傳 BulkAPI result_list 格式的結果，比對不到時回傳 None
+        """
+        root = self.getRoot()
+        sourceSTR = inputSTR.strip(STRIP_STR)
+        lowerSTR = sourceSTR.lower()
+        if not lowerSTR:
+            return None
+        if len(lowerSTR) != len(sourceSTR):
+            sourceSTR = lowerSTR
+
+        matchLIST = []
+        self.search(root, lowerSTR, 0, [], matchLIST)
+
+        resultLIST = []
+        for intentSTR, utteranceSTR, argLIST in matchLIST:
+            if filterLIST and intentSTR not in filterLIST:
+                continue
+            resultLIST.append({
+                "intent": intentSTR,
+                "pattern": "",
+                "utterance": utteranceSTR,
+                "argument": [sourceSTR[startINT:endINT] for startINT, endINT in argLIST]
+            })
+
+        if not resultLIST:
+            return None
+        # 符合多個意圖時不在本機決定
+        if len(set(resultDICT["intent"] for resultDICT in resultLIST)) > 1:
+            return None
+        return {"status": True, "msg": "Success!", "results": resultLIST}
+
+
+localMatcher = LocalMatcher()
+
+def match(inputSTR, filterLIST=[]):
+    if not LOCAL_MATCHER:
+        return None
+    return localMatcher.match(inputSTR, filterLIST)
+
+
+if __name__ == "__main__":
+    localMatcher.getRoot()
+    print("[LocalMatcher] {} utterances".format(localMatcher.utteranceINT))
+    while True:
+        inputSTR = input("Test input: ")
+        if inputSTR == 'q':
+            break
+        print(json.dumps(localMatcher.match(inputSTR), ensure_ascii=False, indent=4))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki BulkAPI 跨請求微批次 (micro-batching)
+
+    每則 LINE 訊息通常只有一、兩句需要送到 Loki，但 BulkAPI 一次可以處理 INPUT_LIMIT 句。
+    同一個 worker 內同時進來的請求，若 filterLIST 相同，會在 loki_batch_window 毫秒內
+    (或湊滿 INPUT_LIMIT 句時) 合併成一次 BulkAPI 呼叫，再依序把 result_list 切回給各個呼叫端。
+
+    * 第一個加入批次的呼叫端 (leader) 負責等待、送出並分配結果，其他呼叫端只等待自己的 Future，
+      不需要額外的背景 thread。
+    * 單次就達到 INPUT_LIMIT 句的呼叫直接送出，不進入批次。
+    * 呼叫失敗時，同一批的所有呼叫端都會收到相同的 {"status": False, "msg": ...}；
+      leader 分配結果時發生其他例外，所有還在等待的呼叫端都會收到同一個例外。
+    * 其他呼叫端最多等待 loki_batch_timeout 秒，逾時回傳 {"status": False, "msg": ...} (與 loki_singleflight 相同)。
+
+    設定 (環境變數):
+        loki_batch_window   等待合併的毫秒數，0 代表關閉 (預設 5)
+        loki_batch_timeout  其他呼叫端等待 leader 的秒數 (預設 15)
+
+    metrics:
+        loki_batch_inputs       每次 BulkAPI 呼叫合併的句數
+        loki_batch_callers      每次 BulkAPI 呼叫合併的呼叫端數
+        loki_batch_timeout_total    等待 leader 逾時的次數
+"""
+
+from concurrent.futures import Future
+from threading import Condition
+import os
+import time
+
+import metrics
+
+LOKI_BATCH_WINDOW = float(os.environ.get("loki_batch_window", 5)) / 1000
+LOKI_BATCH_TIMEOUT = float(os.environ.get("loki_batch_timeout", 15))
+
+batchInputHistogram = metrics.histogram("loki_batch_inputs", "每次 BulkAPI 呼叫合併的句數", bucketLIST=(1, 2, 3, 5, 8, 12, 16, 20))
+batchCallerHistogram = metrics.histogram("loki_batch_callers", "每次 BulkAPI 呼叫合併的呼叫端數", bucketLIST=(1, 2, 3, 5, 8, 12, 16, 20))
+batchTimeoutCounter = metrics.counter("loki_batch_timeout_total", "等待批次 leader 逾時的次數")
+
+
+class Batch():
+    def __init__(self):
+        self.itemLIST = []          # [(inputLIST, Future), ...]
+        self.sizeINT = 0
+        self.closedBOOL = False
+
+
+class LokiBatcher():
+    def __init__(self, callFUNC, windowFLOAT=LOKI_BATCH_WINDOW, limitINT=20, timeoutFLOAT=LOKI_BATCH_TIMEOUT):
+        """
+        input
+            callFUNC        FUNC    實際呼叫 BulkAPI 的函式，以 callFUNC(inputLIST, filterLIST) 呼叫並回傳 response dict
+            windowFLOAT     FLOAT   等待合併的秒數
+            limitINT        INT     每次呼叫最多的句數 (INPUT_LIMIT)
+            timeoutFLOAT    FLOAT   其他呼叫端等待 leader 的秒數
+        """
+        self.callFUNC = callFUNC
+        self.windowFLOAT = windowFLOAT
+        self.limitINT = limitINT
+        self.timeoutFLOAT = timeoutFLOAT
+        self.condition = Condition()
+        self.pendingDICT = {}       # filterTUPLE => 尚在收集中的 Batch
+
+    def closeBatch(self, key, batch):
+        # 呼叫時須持有 self.condition
+        batch.closedBOOL = True
+        if self.pendingDICT.get(key) is batch:
+            del self.pendingDICT[key]
+        self.condition.notify_all()
+
+    def call(self, inputLIST, filterLIST):
+        """
+        與 callFUNC(inputLIST, filterLIST) 相同，但可能與其他呼叫合併成一次 BulkAPI 呼叫
+        """
+        if self.windowFLOAT <= 0 or not inputLIST or len(inputLIST) >= self.limitINT:
+            return self.callFUNC(inputLIST, filterLIST)
+
+        key = tuple(filterLIST)
+        future = Future()
+        with self.condition:
+            batch = self.pendingDICT.get(key)
+            if batch is not None and batch.sizeINT + len(inputLIST) > self.limitINT:
+                # 放不下：目前這批立即送出，自己開新的一批
+                self.closeBatch(key, batch)
+                batch = None
+            leaderBOOL = batch is None
+            if leaderBOOL:
+                batch = Batch()
+                self.pendingDICT[key] = batch
+            batch.itemLIST.append((inputLIST, future))
+            batch.sizeINT += len(inputLIST)
+            if batch.sizeINT >= self.limitINT:
+                self.closeBatch(key, batch)
+
+        if leaderBOOL:
+            self.runBatch(key, batch, filterLIST)
+            return future.result()
+        try:
+            return future.result(timeout=self.timeoutFLOAT)
+        except TimeoutError:
+            batchTimeoutCounter.inc()
+            return {"status": False, "msg": "Loki batch timeout ({}s)".format(self.timeoutFLOAT)}
+
+    def runBatch(self, key, batch, filterLIST):
+        try:
+            # 等到時間窗結束或湊滿 limitINT 句
+            deadline = time.monotonic() + self.windowFLOAT
+            with self.condition:
+                while not batch.closedBOOL:
+                    remainFLOAT = deadline - time.monotonic()
+                    if remainFLOAT <= 0:
+                        self.closeBatch(key, batch)
+                        break
+                    self.condition.wait(remainFLOAT)
+
+            batchInputHistogram.observe(batch.sizeINT)
+            batchCallerHistogram.observe(len(batch.itemLIST))
+            try:
+                result = self.callFUNC([inputSTR for inputLIST, future in batch.itemLIST for inputSTR in inputLIST], filterLIST)
+                if result["status"] and len(result.get("result_list", [])) != batch.sizeINT:
+                    result = {"status": False, "msg": "result_list size mismatch ({} / {})".format(len(result.get("result_list", [])), batch.sizeINT)}
+            except Exception as e:
+                result = {"status": False, "msg": str(e)}
+
+            # 依序把 result_list 切回給各個呼叫端
+            startINT = 0
+            for inputLIST, future in batch.itemLIST:
+                sliceDICT = {k: v for k, v in result.items() if k != "result_list"}
+                if result["status"]:
+                    sliceDICT["result_list"] = result["result_list"][startINT:startINT+len(inputLIST)]
+                startINT += len(inputLIST)
+                future.set_result(sliceDICT)
+        except BaseException as e:
+            # 不能讓其他呼叫端永遠等不到結果：關閉這一批 (不再加入新的呼叫端)，還沒有結果的都設為同一個例外
+            with self.condition:
+                if not batch.closedBOOL:
+                    self.closeBatch(key, batch)
+            for inputLIST, future in batch.itemLIST:
+                if not future.done():
+                    future.set_exception(e)
+            raise
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki BulkAPI 斷路器 (circuit breaker)
+
+    api.droidtown.co 異常 (逾時、連線失敗、5xx/429、回應過慢) 時，每個請求都要等到 timeout 才失敗，
+    gunicorn worker 會被佔滿。斷路器記錄最近 loki_breaker_window 次呼叫的結果：
+
+        closed      正常呼叫；失敗率達到 loki_breaker_failure_rate (且至少有 loki_breaker_min_call 次) 時切到 open
+        open        不再呼叫 Loki，callLoki() 直接回傳 CIRCUIT_OPEN_MSG；經過 loki_breaker_open 秒後切到 half_open
+        half_open   只放行 loki_breaker_probe 個試探請求，成功則回到 closed，失敗則再次 open
+
+    open 期間 requestLoki() 進入降級模式：快取、FAQ、local_matcher 仍然照常回答，
+    其他句子視為比對不到，由 app.py 以 faq_search 檢索或預設的忙碌訊息回覆。
+
+    設定 (環境變數):
+        loki_breaker                是否啟用 (預設 true)
+        loki_breaker_window         計算失敗率的最近呼叫次數 (預設 20)
+        loki_breaker_min_call       window 內至少要有幾次呼叫才判斷 (預設 5)
+        loki_breaker_failure_rate   失敗率門檻 (預設 0.5)
+        loki_breaker_slow           超過此秒數的呼叫也視為失敗 (預設 5)
+        loki_breaker_open           open 狀態維持秒數 (預設 30)
+        loki_breaker_probe          half_open 時同時放行的試探請求數 (預設 1)
+
+    metrics:
+        loki_breaker_state                  0 = closed, 1 = half_open, 2 = open (多個 worker 時取最大值)
+        loki_breaker_failure_rate           window 內的失敗率 (多個 worker 時取最大值)
+        loki_breaker_transitions_total      狀態切換次數 (依切換後的狀態)
+        loki_breaker_rejected_total         open 期間沒有送出的呼叫次數
+"""
+
+from collections import deque
+from threading import Lock
+import os
+import time
+
+from bot_logging import getLogger
+import metrics
+
+LOKI_BREAKER = os.environ.get("loki_breaker", "true").lower() in ["1", "true", "yes"]
+LOKI_BREAKER_WINDOW = int(os.environ.get("loki_breaker_window", 20))
+LOKI_BREAKER_MIN_CALL = int(os.environ.get("loki_breaker_min_call", 5))
+LOKI_BREAKER_FAILURE_RATE = float(os.environ.get("loki_breaker_failure_rate", 0.5))
+LOKI_BREAKER_SLOW = float(os.environ.get("loki_breaker_slow", 5))
+LOKI_BREAKER_OPEN = float(os.environ.get("loki_breaker_open", 30))
+LOKI_BREAKER_PROBE = int(os.environ.get("loki_breaker_probe", 1))
+
+CIRCUIT_OPEN_MSG = "Loki circuit open."
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+STATE_DICT = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+logger = getLogger(__name__)
+
+stateGauge = metrics.gauge("loki_breaker_state", "Loki 斷路器狀態 (0 = closed, 1 = half_open, 2 = open)", aggregateSTR="max")
+failureRateGauge = metrics.gauge("loki_breaker_failure_rate", "Loki 斷路器 window 內的失敗率", aggregateSTR="max")
+transitionCounter = metrics.counter("loki_breaker_transitions_total", "Loki 斷路器狀態切換次數", ["state"])
+rejectedCounter = metrics.counter("loki_breaker_rejected_total", "Loki 斷路器 open 期間沒有送出的呼叫次數")
+
+
+class CircuitBreaker():
+    def __init__(self, windowINT=LOKI_BREAKER_WINDOW, minCallINT=LOKI_BREAKER_MIN_CALL, failureRateFLOAT=LOKI_BREAKER_FAILURE_RATE,
+                 slowFLOAT=LOKI_BREAKER_SLOW, openFLOAT=LOKI_BREAKER_OPEN, probeINT=LOKI_BREAKER_PROBE, enableBOOL=LOKI_BREAKER):
+        self.windowINT = windowINT
+        self.minCallINT = minCallINT
+        self.failureRateFLOAT = failureRateFLOAT
+        self.slowFLOAT = slowFLOAT
+        self.openFLOAT = openFLOAT
+        self.probeINT = probeINT
+        self.enableBOOL = enableBOOL
+        self.state = CLOSED
+        self.openUntil = 0.0
+        self.probingINT = 0
+        self.resultDEQUE = deque(maxlen=windowINT)     # True = 成功
+        self.lock = Lock()
+        stateGauge.set(STATE_DICT[CLOSED])
+
+    def setState(self, state):
+        # 呼叫時須持有 self.lock
+        if state == self.state:
+            return
+        self.state = state
+        if state == OPEN:
+            self.openUntil = time.time() + self.openFLOAT
+        if state != HALF_OPEN:
+            self.probingINT = 0
+        if state == CLOSED:
+            self.resultDEQUE.clear()
+            failureRateGauge.set(0)
+        stateGauge.set(STATE_DICT[state])
+        transitionCounter.inc(state=state)
+        logger.warning("[Breaker] Loki circuit => %s", state)
+
+    def allow(self):
+        """
+        回傳是否可以呼叫 Loki；回傳 True 時呼叫端之後一定要呼叫 record() 或 release()
+        """
+        if not self.enableBOOL:
+            return True
+
+        with self.lock:
+            if self.state == OPEN and time.time() >= self.openUntil:
+                self.setState(HALF_OPEN)
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self.probingINT < self.probeINT:
+                self.probingINT += 1
+                return True
+        rejectedCounter.inc()
+        return False
+
+    def record(self, successBOOL, elapsedFLOAT=0.0):
+        if not self.enableBOOL:
+            return
+
+        successBOOL = successBOOL and elapsedFLOAT < self.slowFLOAT
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.probingINT = max(0, self.probingINT - 1)
+                self.setState(CLOSED if successBOOL else OPEN)
+                return
+            if self.state == OPEN:
+                # open 之前就已送出的呼叫，結果不影響狀態
+                return
+
+            self.resultDEQUE.append(successBOOL)
+            failureRateFLOAT = self.resultDEQUE.count(False) / len(self.resultDEQUE)
+            failureRateGauge.set(failureRateFLOAT)
+            if len(self.resultDEQUE) >= self.minCallINT and failureRateFLOAT >= self.failureRateFLOAT:
+                self.setState(OPEN)
+
+    def release(self):
+        """
+        allow() 之後沒有得到結果 (例如 asyncio 的 task 被取消) 時呼叫，歸還 half_open 的試探名額
+        """
+        if not self.enableBOOL:
+            return
+
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.probingINT = max(0, self.probingINT - 1)
+
+    def getState(self):
+        with self.lock:
+            if self.state == OPEN and time.time() >= self.openUntil:
+                return HALF_OPEN
+            return self.state
+
+    def isDegraded(self):
+        return self.enableBOOL and self.getState() != CLOSED
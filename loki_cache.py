@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki 語意判斷結果快取 (LRU + TTL)
+
+    以 (正規化後的句子, filterLIST, Loki version) 為 key，快取 BulkAPI result_list 中單一句子的結果，
+    重複的問題不必再送到 Loki，也不會消耗 word_count_balance。
+    version 取自最近一次 Loki 回傳的 version，模型更新後舊的結果自然不會再被取用。
+
+    設定 (環境變數):
+        loki_cache_size     最多快取的句子數，0 代表關閉 (預設 10000)
+        loki_cache_ttl      快取存活秒數 (預設 3600)
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+import os
+import re
+import time
+import unicodedata
+
+import metrics
+
+LOKI_CACHE_SIZE = int(os.environ.get("loki_cache_size", 10000))
+LOKI_CACHE_TTL = float(os.environ.get("loki_cache_ttl", 3600))
+
+spacePAT = re.compile(r"\s+")
+
+cacheCounter = metrics.counter("loki_cache_requests_total", "Loki 結果快取查詢次數", ["cache", "result"])
+cacheSizeGauge = metrics.gauge("loki_cache_size", "Loki 結果快取目前的句子數", ["cache"])
+
+def normalizeInput(inputSTR):
+    """
+    全形轉半形、轉小寫、合併空白，讓只差在大小寫或全半形的句子共用同一個結果
+    """
+    inputSTR = unicodedata.normalize("NFKC", inputSTR).lower()
+    return spacePAT.sub(" ", inputSTR).strip()
+
+
+class LokiCache():
+    def __init__(self, maxSizeINT=LOKI_CACHE_SIZE, ttlFLOAT=LOKI_CACHE_TTL, nameSTR="memory"):
+        self.maxSizeINT = maxSizeINT
+        self.ttlFLOAT = ttlFLOAT
+        self.nameSTR = nameSTR
+        self.version = ""
+        self.hitINT = 0
+        self.missINT = 0
+        self.cacheDICT = OrderedDict()      # key => (expireTime, resultDICT)
+        self.lock = Lock()
+
+    def getKey(self, inputSTR, filterLIST, version=None):
+        if version is None:
+            version = self.version
+        return (normalizeInput(inputSTR), tuple(sorted(filterLIST)), version)
+
+    def get(self, inputSTR, filterLIST):
+        """
+        回傳快取的 result_list 元素 (複本，呼叫端可自由修改)，找不到或已過期時回傳 None
+        """
+        if self.maxSizeINT <= 0:
+            return None
+
+        key = self.getKey(inputSTR, filterLIST)
+        with self.lock:
+            cacheTUPLE = self.cacheDICT.get(key)
+            if cacheTUPLE is not None and cacheTUPLE[0] < time.time():
+                del self.cacheDICT[key]
+                cacheTUPLE = None
+
+            if cacheTUPLE is None:
+                self.missINT += 1
+            else:
+                self.hitINT += 1
+                self.cacheDICT.move_to_end(key)
+
+        cacheCounter.inc(cache=self.nameSTR, result="miss" if cacheTUPLE is None else "hit")
+        if cacheTUPLE is None:
+            return None
+        # 意圖模組會直接修改 argument，因此回傳複本
+        return deepcopy(cacheTUPLE[1])
+
+    def set(self, inputSTR, filterLIST, version, resultDICT):
+        if self.maxSizeINT <= 0:
+            return
+
+        with self.lock:
+            if version != self.version:
+                # Loki 模型更新，舊版本的結果全部作廢
+                self.version = version
+                self.cacheDICT.clear()
+            key = self.getKey(inputSTR, filterLIST, version)
+            self.cacheDICT[key] = (time.time() + self.ttlFLOAT, deepcopy(resultDICT))
+            self.cacheDICT.move_to_end(key)
+            while len(self.cacheDICT) > self.maxSizeINT:
+                self.cacheDICT.popitem(last=False)
+            sizeINT = len(self.cacheDICT)
+        cacheSizeGauge.set(sizeINT, cache=self.nameSTR)
+
+    def clear(self):
+        with self.lock:
+            self.cacheDICT.clear()
+        cacheSizeGauge.set(0, cache=self.nameSTR)
+
+    def getStats(self):
+        with self.lock:
+            return {
+                "size": len(self.cacheDICT),
+                "hit": self.hitINT,
+                "miss": self.missINT,
+                "version": self.version
+            }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki 語意判斷結果的磁碟快取 (sqlite)
+
+    loki_cache.LokiCache 只存在各 worker 的記憶體中，deploy 或 gunicorn 重啟 worker 後就會清空。
+    LokiDiskCache 把相同的結果寫入 sqlite，同一台機器上的所有 worker 共用，重啟後仍然有效。
+    requestLoki() 先查記憶體快取，找不到才查磁碟快取，磁碟命中的結果會再放回記憶體快取。
+
+    * key 為 (正規化後的句子, filterLIST, Loki version)，只取用與 meta 表中目前 version 相同的結果。
+      loki_cache_version 表記錄每個 version 第一次出現的時間，最晚出現的為最新版本：
+      Loki 回傳新的 version 時，比它舊的版本的結果會在下一次寫入時一併刪除；
+      部署途中仍拿到舊 version 的 worker 不會寫入，也不會刪除新版本的結果。
+    * WAL 模式：多個 worker 可以同時讀取，寫入不會擋住讀取。每個 thread 各自使用一個連線。
+    * write-behind：set() 只放進待寫入列表，由背景 thread 每 loki_disk_cache_flush 秒
+      (或累積 WRITE_BATCH 筆時) 以單一 transaction 寫入，命中時更新的存取時間也一起寫入。
+    * 超過 loki_disk_cache_size 筆時，刪除最久沒有被存取的結果。
+
+    設定 (環境變數):
+        loki_disk_cache         sqlite 檔案路徑，空字串代表關閉 (預設 loki_cache.sqlite3)
+        loki_disk_cache_size    最多保存的句子數 (預設 100000)
+        loki_disk_cache_ttl     結果存活秒數 (預設 604800，7 天)
+        loki_disk_cache_flush   背景寫入間隔秒數 (預設 1)
+"""
+
+from threading import Event, Lock, Thread, local
+import atexit
+import json
+import os
+import sqlite3
+import time
+
+from bot_logging import getLogger
+from loki_cache import normalizeInput
+import metrics
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+LOKI_DISK_CACHE = os.environ.get("loki_disk_cache", os.path.join(BASE_PATH, "loki_cache.sqlite3"))
+LOKI_DISK_CACHE_SIZE = int(os.environ.get("loki_disk_cache_size", 100000))
+LOKI_DISK_CACHE_TTL = float(os.environ.get("loki_disk_cache_ttl", 604800))
+LOKI_DISK_CACHE_FLUSH = float(os.environ.get("loki_disk_cache_flush", 1))
+WRITE_BATCH = 200
+
+logger = getLogger(__name__)
+
+cacheCounter = metrics.counter("loki_cache_requests_total", "Loki 結果快取查詢次數", ["cache", "result"])
+cacheSizeGauge = metrics.gauge("loki_cache_size", "Loki 結果快取目前的句子數", ["cache"])
+flushHistogram = metrics.histogram("loki_disk_cache_flush_seconds", "磁碟快取每次背景寫入的時間")
+
+SCHEMA_LIST = [
+    """CREATE TABLE IF NOT EXISTS loki_cache (
+        input       TEXT NOT NULL,
+        filter      TEXT NOT NULL,
+        version     TEXT NOT NULL,
+        result      TEXT NOT NULL,
+        createTime  REAL NOT NULL,
+        accessTime  REAL NOT NULL,
+        PRIMARY KEY (input, filter, version)
+    )""",
+    "CREATE INDEX IF NOT EXISTS loki_cache_access ON loki_cache (accessTime)",
+    "CREATE TABLE IF NOT EXISTS loki_cache_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS loki_cache_version (version TEXT PRIMARY KEY, firstSeen REAL NOT NULL)",
+    # 沒有 loki_cache_version 表時建立的檔案：meta 中的 version 視為最早的版本
+    "INSERT OR IGNORE INTO loki_cache_version (version, firstSeen) SELECT value, 0 FROM loki_cache_meta WHERE key = 'version'",
+]
+
+SELECT_SQL = """
+    SELECT c.version, c.result FROM loki_cache c
+    JOIN loki_cache_meta m ON m.key = 'version' AND m.value = c.version
+    WHERE c.input = ? AND c.filter = ? AND c.createTime > ?
+"""
+
+
+class LokiDiskCache():
+    def __init__(self, pathSTR=LOKI_DISK_CACHE, maxSizeINT=LOKI_DISK_CACHE_SIZE, ttlFLOAT=LOKI_DISK_CACHE_TTL, flushFLOAT=LOKI_DISK_CACHE_FLUSH):
+        self.pathSTR = pathSTR
+        self.maxSizeINT = maxSizeINT
+        self.ttlFLOAT = ttlFLOAT
+        self.flushFLOAT = flushFLOAT
+        self.enableBOOL = bool(pathSTR) and maxSizeINT > 0
+        self.pid = None
+        self.lock = Lock()
+        self.flushLock = Lock()
+        self.event = Event()
+        self.threadLocal = local()
+        self.setLIST = []               # [(input, filter, version, result, time), ...] 待寫入
+        self.touchDICT = {}             # (input, filter, version) => 存取時間，待寫入
+        self.hitINT = 0
+        self.missINT = 0
+
+    def getConnection(self):
+        pid = os.getpid()
+        if getattr(self.threadLocal, "pid", None) != pid:
+            # fork 後的子行程不沿用父行程的連線
+            try:
+                conn = sqlite3.connect(self.pathSTR, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                for sqlSTR in SCHEMA_LIST:
+                    conn.execute(sqlSTR)
+                conn.commit()
+            except sqlite3.Error:
+                # 無法開啟檔案 (例如唯讀的檔案系統) 時關閉磁碟快取，只使用記憶體快取
+                self.enableBOOL = False
+                raise
+            self.threadLocal.conn = conn
+            self.threadLocal.pid = pid
+        return self.threadLocal.conn
+
+    def start(self):
+        # 每個 worker 行程各自啟動一個背景寫入 thread
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.setLIST = []
+            self.touchDICT = {}
+        Thread(target=self.work, daemon=True).start()
+
+    def work(self):
+        while True:
+            self.event.wait(self.flushFLOAT)
+            self.event.clear()
+            self.flush()
+
+    def getKey(self, inputSTR, filterLIST):
+        return (normalizeInput(inputSTR), json.dumps(sorted(filterLIST), ensure_ascii=False))
+
+    def get(self, inputSTR, filterLIST):
+        """
+        回傳 (version, result_list 元素)，找不到、已過期或 version 已更新時回傳 None
+        """
+        if not self.enableBOOL:
+            return None
+
+        inputKEY, filterKEY = self.getKey(inputSTR, filterLIST)
+        try:
+            row = self.getConnection().execute(SELECT_SQL, (inputKEY, filterKEY, time.time() - self.ttlFLOAT)).fetchone()
+        except Exception as e:
+            logger.error("[ERROR] LokiDiskCache => %s", str(e))
+            row = None
+
+        with self.lock:
+            if row is None:
+                self.missINT += 1
+            else:
+                self.hitINT += 1
+                self.touchDICT[(inputKEY, filterKEY, row[0])] = time.time()
+        cacheCounter.inc(cache="disk", result="miss" if row is None else "hit")
+        if row is None:
+            return None
+        self.start()
+        return row[0], json.loads(row[1])
+
+    def set(self, inputSTR, filterLIST, version, resultDICT):
+        if not self.enableBOOL:
+            return
+
+        self.start()
+        inputKEY, filterKEY = self.getKey(inputSTR, filterLIST)
+        with self.lock:
+            self.setLIST.append((inputKEY, filterKEY, version, json.dumps(resultDICT, ensure_ascii=False), time.time()))
+            pendingINT = len(self.setLIST)
+        if pendingINT >= WRITE_BATCH:
+            self.event.set()
+
+    def flush(self):
+        """
+        將待寫入的結果與存取時間以單一 transaction 寫入 sqlite
+        """
+        with self.lock:
+            setLIST, self.setLIST = self.setLIST, []
+            touchDICT, self.touchDICT = self.touchDICT, {}
+        if not setLIST and not touchDICT:
+            return
+
+        startTime = time.perf_counter()
+        try:
+            with self.flushLock:
+                conn = self.getConnection()
+                with conn:
+                    if setLIST:
+                        # 以最後寫入的 version 為準，只有它是最新版本時才寫入；version 更新時刪除較舊版本的結果
+                        version = setLIST[-1][2]
+                        conn.execute("INSERT OR IGNORE INTO loki_cache_version (version, firstSeen) VALUES (?, ?)", (version, time.time()))
+                        newestVersion = conn.execute("SELECT version FROM loki_cache_version ORDER BY firstSeen DESC, version DESC LIMIT 1").fetchone()[0]
+                        if newestVersion == version:
+                            row = conn.execute("SELECT value FROM loki_cache_meta WHERE key = 'version'").fetchone()
+                            if row is None or row[0] != version:
+                                conn.execute(
+                                    "DELETE FROM loki_cache WHERE version IN (SELECT version FROM loki_cache_version WHERE firstSeen < (SELECT firstSeen FROM loki_cache_version WHERE version = ?))",
+                                    (version,))
+                                conn.execute("INSERT OR REPLACE INTO loki_cache_meta (key, value) VALUES ('version', ?)", (version,))
+                            conn.executemany(
+                                "INSERT OR REPLACE INTO loki_cache (input, filter, version, result, createTime, accessTime) VALUES (?, ?, ?, ?, ?, ?)",
+                                [(i, f, v, r, t, t) for i, f, v, r, t in setLIST if v == version])
+                    if touchDICT:
+                        conn.executemany(
+                            "UPDATE loki_cache SET accessTime = ? WHERE input = ? AND filter = ? AND version = ?",
+                            [(t, i, f, v) for (i, f, v), t in touchDICT.items()])
+                    if setLIST:
+                        sizeINT = conn.execute("SELECT COUNT(*) FROM loki_cache").fetchone()[0]
+                        if sizeINT > self.maxSizeINT:
+                            conn.execute(
+                                "DELETE FROM loki_cache WHERE rowid IN (SELECT rowid FROM loki_cache ORDER BY accessTime LIMIT ?)",
+                                (sizeINT - self.maxSizeINT,))
+                            sizeINT = self.maxSizeINT
+                        cacheSizeGauge.set(sizeINT, cache="disk")
+        except Exception as e:
+            logger.error("[ERROR] LokiDiskCache => %s", str(e))
+        flushHistogram.observe(time.perf_counter() - startTime)
+
+    def clear(self):
+        if not self.enableBOOL:
+            return
+        with self.lock:
+            self.setLIST = []
+            self.touchDICT = {}
+        with self.flushLock:
+            conn = self.getConnection()
+            with conn:
+                conn.execute("DELETE FROM loki_cache")
+        cacheSizeGauge.set(0, cache="disk")
+
+    def getStats(self):
+        sizeINT = 0
+        version = ""
+        if self.enableBOOL:
+            conn = self.getConnection()
+            sizeINT = conn.execute("SELECT COUNT(*) FROM loki_cache").fetchone()[0]
+            row = conn.execute("SELECT value FROM loki_cache_meta WHERE key = 'version'").fetchone()
+            if row is not None:
+                version = row[0]
+        with self.lock:
+            return {
+                "size": sizeINT,
+                "hit": self.hitINT,
+                "miss": self.missINT,
+                "pending": len(self.setLIST),
+                "version": version
+            }
+
+
+lokiDiskCache = LokiDiskCache()
+# 結束前把還沒寫入的結果寫進 sqlite
+atexit.register(lokiDiskCache.flush)
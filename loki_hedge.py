@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki BulkAPI 對沖請求 (hedged requests)
+
+    p99 延遲主要來自偶發的慢回應。啟用後，若第一個請求在「最近呼叫延遲的第 loki_hedge_percentile 百分位」
+    (例如 p95) 內還沒有回應，就再送出一個相同的請求，採用先成功回來的結果。
+
+    * 預算上限：對沖次數不超過總呼叫次數的 loki_hedge_budget (例如 0.05 = 5%)
+    * 字數：對沖請求同樣會扣 word_count_balance，送出的字數記在 loki_hedge_words_total；
+      最近一次回傳的 word_count_balance 低於 loki_hedge_min_balance 時不對沖
+    * 最近的延遲不足 MIN_SAMPLE 筆時不對沖 (百分位還不可靠)
+
+    設定 (環境變數):
+        loki_hedge                  是否啟用 (預設 false)
+        loki_hedge_percentile       對沖等待時間取最近延遲的百分位 (預設 95)
+        loki_hedge_min_delay        對沖等待時間下限秒數 (預設 0.05)
+        loki_hedge_budget           對沖次數佔總呼叫次數的上限 (預設 0.05)
+        loki_hedge_min_balance      word_count_balance 低於此值時不對沖 (預設 10000)
+        loki_hedge_worker           送出請求的 thread 數 (預設 32)
+
+    metrics:
+        loki_hedge_total{result}        sent：送出對沖；won：對沖先回來；
+                                        skipped_budget / skipped_balance：超過預算或字數不足而沒有對沖
+        loki_hedge_words_total          對沖請求送出的字數
+        loki_hedge_delay_seconds        目前的對沖等待時間
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
+from contextvars import copy_context
+from threading import Lock
+import math
+import os
+import time
+
+import metrics
+
+LOKI_HEDGE = os.environ.get("loki_hedge", "false").lower() in ["1", "true", "yes"]
+LOKI_HEDGE_PERCENTILE = float(os.environ.get("loki_hedge_percentile", 95))
+LOKI_HEDGE_MIN_DELAY = float(os.environ.get("loki_hedge_min_delay", 0.05))
+LOKI_HEDGE_BUDGET = float(os.environ.get("loki_hedge_budget", 0.05))
+LOKI_HEDGE_MIN_BALANCE = int(os.environ.get("loki_hedge_min_balance", 10000))
+LOKI_HEDGE_WORKER = int(os.environ.get("loki_hedge_worker", 32))
+LATENCY_WINDOW = 200
+MIN_SAMPLE = 20
+
+hedgeCounter = metrics.counter("loki_hedge_total", "Loki 對沖請求次數", ["result"])
+hedgeWordCounter = metrics.counter("loki_hedge_words_total", "Loki 對沖請求送出的字數")
+hedgeDelayGauge = metrics.gauge("loki_hedge_delay_seconds", "Loki 對沖等待時間")
+
+
+class Hedger():
+    def __init__(self, callFUNC, percentileFLOAT=LOKI_HEDGE_PERCENTILE, minDelayFLOAT=LOKI_HEDGE_MIN_DELAY,
+                 budgetFLOAT=LOKI_HEDGE_BUDGET, minBalanceINT=LOKI_HEDGE_MIN_BALANCE, workerINT=LOKI_HEDGE_WORKER, enableBOOL=LOKI_HEDGE):
+        """
+        input
+            callFUNC        FUNC    實際呼叫 BulkAPI 的函式，以 callFUNC(inputLIST, filterLIST) 呼叫並回傳 response dict
+        """
+        self.callFUNC = callFUNC
+        self.percentileFLOAT = percentileFLOAT
+        self.minDelayFLOAT = minDelayFLOAT
+        self.budgetFLOAT = budgetFLOAT
+        self.minBalanceINT = minBalanceINT
+        self.workerINT = workerINT
+        self.enableBOOL = enableBOOL
+        self.latencyDEQUE = deque(maxlen=LATENCY_WINDOW)
+        self.callINT = 0
+        self.hedgeINT = 0
+        self.balanceINT = -1            # 最近一次回傳的 word_count_balance，-1 代表未知
+        self.lock = Lock()
+        self.executorDICT = {}          # pid => ThreadPoolExecutor，fork 後的子行程不沿用父行程的 thread
+
+    def getExecutor(self):
+        pid = os.getpid()
+        with self.lock:
+            if pid not in self.executorDICT:
+                self.executorDICT.clear()
+                self.executorDICT[pid] = ThreadPoolExecutor(max_workers=self.workerINT, thread_name_prefix="loki-hedge")
+            return self.executorDICT[pid]
+
+    def getDelay(self):
+        """
+        回傳對沖等待秒數，樣本不足時回傳 None
+        """
+        with self.lock:
+            if len(self.latencyDEQUE) < MIN_SAMPLE:
+                return None
+            sortedLIST = sorted(self.latencyDEQUE)
+        index = min(len(sortedLIST) - 1, int(math.ceil(self.percentileFLOAT / 100 * len(sortedLIST))) - 1)
+        delayFLOAT = max(self.minDelayFLOAT, sortedLIST[index])
+        hedgeDelayGauge.set(delayFLOAT)
+        return delayFLOAT
+
+    def timedCall(self, inputLIST, filterLIST):
+        startTime = time.perf_counter()
+        result = self.callFUNC(inputLIST, filterLIST)
+        if result.get("status"):
+            # 只記錄成功的延遲，快速失敗 (例如斷路器 open) 不應拉低百分位
+            with self.lock:
+                self.latencyDEQUE.append(time.perf_counter() - startTime)
+                if "word_count_balance" in result:
+                    self.balanceINT = result["word_count_balance"]
+        return result
+
+    def takeBudget(self, inputLIST):
+        with self.lock:
+            if 0 <= self.balanceINT < self.minBalanceINT:
+                resultSTR = "skipped_balance"
+            elif self.hedgeINT + 1 > self.budgetFLOAT * self.callINT:
+                resultSTR = "skipped_budget"
+            else:
+                self.hedgeINT += 1
+                resultSTR = "sent"
+        hedgeCounter.inc(result=resultSTR)
+        if resultSTR != "sent":
+            return False
+        hedgeWordCounter.inc(sum(len(inputSTR) for inputSTR in inputLIST))
+        return True
+
+    def call(self, inputLIST, filterLIST):
+        """
+        與 callFUNC(inputLIST, filterLIST) 相同，但第一個請求太慢時會再送出一個相同的請求
+        """
+        if not self.enableBOOL:
+            return self.callFUNC(inputLIST, filterLIST)
+
+        with self.lock:
+            self.callINT += 1
+        delayFLOAT = self.getDelay()
+        if delayFLOAT is None:
+            return self.timedCall(inputLIST, filterLIST)
+
+        executor = self.getExecutor()
+        # 以呼叫端的 context 執行，callFUNC 中的 span (loki.bulkapi) 才會接在同一個 trace 下
+        primaryFuture = executor.submit(copy_context().run, self.timedCall, inputLIST, filterLIST)
+        try:
+            return primaryFuture.result(timeout=delayFLOAT)
+        except TimeoutError:
+            pass
+
+        if not self.takeBudget(inputLIST):
+            return primaryFuture.result()
+
+        hedgeFuture = executor.submit(copy_context().run, self.timedCall, inputLIST, filterLIST)
+        doneSET, pendingSET = wait([primaryFuture, hedgeFuture], return_when=FIRST_COMPLETED)
+        firstFuture = primaryFuture if primaryFuture in doneSET else hedgeFuture
+        result = firstFuture.result()
+        if not result.get("status") and pendingSET:
+            # 先回來的失敗了，改等另一個
+            firstFuture = pendingSET.pop()
+            result = firstFuture.result()
+        if firstFuture is hedgeFuture:
+            hedgeCounter.inc(result="won")
+        return result
+
+    def getStats(self):
+        with self.lock:
+            return {
+                "call": self.callINT,
+                "hedge": self.hedgeINT,
+                "balance": self.balanceINT,
+                "sample": len(self.latencyDEQUE)
+            }
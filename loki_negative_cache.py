@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki 比對不到意圖 ("No matching Intent.") 的負面快取
+
+    貼圖轉成的文字、閒聊、錯字等輸入常常比對不到任何意圖，每次都要花一次 BulkAPI 呼叫才得到同樣的結果。
+    NegativeCache 以 Bloom filter 記錄最近比對不到的句子 (正規化後)，requestLoki() 在呼叫 Loki 前先檢查，
+    命中時直接視為 "No matching Intent."，由 app.py 回覆預設的「抱歉，我只是個機器人…」。
+
+    * 以兩代 Bloom filter 輪替實作 TTL：每 ttl / 2 秒 (或目前這代已滿時) 丟棄舊的一代，
+      因此一句話最少保留 ttl / 2 秒，最多 ttl 秒。
+    * Bloom filter 有誤判 (false positive) 的可能，機率由 loki_negative_fp 控制，
+      只會發生在記憶體 / 磁碟快取與 local_matcher 都沒有結果的句子上。
+    * Loki 回傳新的 version (意圖或 utterance 有變動) 時整個清空，也可以直接呼叫 clear()。
+
+    設定 (環境變數):
+        loki_negative_size  每一代最多記錄的句子數，0 代表關閉 (預設 100000)
+        loki_negative_fp    誤判率 (預設 0.001)
+        loki_negative_ttl   存活秒數 (預設 600)
+"""
+
+from hashlib import blake2b
+from threading import Lock
+import math
+import os
+import time
+
+from loki_cache import normalizeInput
+import metrics
+
+LOKI_NEGATIVE_SIZE = int(os.environ.get("loki_negative_size", 100000))
+LOKI_NEGATIVE_FP = float(os.environ.get("loki_negative_fp", 0.001))
+LOKI_NEGATIVE_TTL = float(os.environ.get("loki_negative_ttl", 600))
+NO_MATCH_MSG = "No matching Intent."
+
+cacheCounter = metrics.counter("loki_cache_requests_total", "Loki 結果快取查詢次數", ["cache", "result"])
+cacheSizeGauge = metrics.gauge("loki_cache_size", "Loki 結果快取目前的句子數", ["cache"])
+
+
+class BloomFilter():
+    def __init__(self, capacityINT, fpFLOAT):
+        self.bitINT = max(8, int(math.ceil(-capacityINT * math.log(fpFLOAT) / (math.log(2) ** 2))))
+        self.hashINT = max(1, int(round(self.bitINT / capacityINT * math.log(2))))
+        self.bitArray = bytearray((self.bitINT + 7) // 8)
+        self.sizeINT = 0
+
+    def getIndexLIST(self, keyBYTES):
+        # double hashing：由一個 128 bit 的 hash 產生 hashINT 個位置
+        digestBYTES = blake2b(keyBYTES, digest_size=16).digest()
+        h1 = int.from_bytes(digestBYTES[:8], "little")
+        h2 = int.from_bytes(digestBYTES[8:], "little") | 1
+        return [(h1 + i * h2) % self.bitINT for i in range(self.hashINT)]
+
+    def add(self, keyBYTES):
+        for index in self.getIndexLIST(keyBYTES):
+            self.bitArray[index >> 3] |= 1 << (index & 7)
+        self.sizeINT += 1
+
+    def __contains__(self, keyBYTES):
+        bitArray = self.bitArray
+        for index in self.getIndexLIST(keyBYTES):
+            if not bitArray[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+
+class NegativeCache():
+    def __init__(self, capacityINT=LOKI_NEGATIVE_SIZE, fpFLOAT=LOKI_NEGATIVE_FP, ttlFLOAT=LOKI_NEGATIVE_TTL):
+        self.capacityINT = capacityINT
+        self.fpFLOAT = fpFLOAT
+        self.ttlFLOAT = ttlFLOAT
+        self.version = ""
+        self.hitINT = 0
+        self.missINT = 0
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        # 呼叫時須持有 self.lock (或在 __init__ 中)
+        if self.capacityINT > 0:
+            self.currentFilter = BloomFilter(self.capacityINT, self.fpFLOAT)
+            self.previousFilter = BloomFilter(self.capacityINT, self.fpFLOAT)
+        self.rotateTime = time.time() + self.ttlFLOAT / 2
+
+    def rotate(self):
+        # 呼叫時須持有 self.lock
+        if time.time() >= self.rotateTime or self.currentFilter.sizeINT >= self.capacityINT:
+            self.previousFilter = self.currentFilter
+            self.currentFilter = BloomFilter(self.capacityINT, self.fpFLOAT)
+            self.rotateTime = time.time() + self.ttlFLOAT / 2
+
+    def getKey(self, inputSTR, filterLIST):
+        return "{}\t{}".format(normalizeInput(inputSTR), ",".join(sorted(filterLIST))).encode("utf-8")
+
+    def get(self, inputSTR, filterLIST):
+        """
+        最近比對不到意圖時回傳與 Loki 相同的 {"status": False, "msg": "No matching Intent."}，否則回傳 None
+        """
+        if self.capacityINT <= 0:
+            return None
+
+        key = self.getKey(inputSTR, filterLIST)
+        with self.lock:
+            self.rotate()
+            hitBOOL = key in self.currentFilter or key in self.previousFilter
+            if hitBOOL:
+                self.hitINT += 1
+            else:
+                self.missINT += 1
+
+        cacheCounter.inc(cache="negative", result="hit" if hitBOOL else "miss")
+        if not hitBOOL:
+            return None
+        return {"status": False, "msg": NO_MATCH_MSG}
+
+    def set(self, inputSTR, filterLIST, version):
+        if self.capacityINT <= 0:
+            return
+
+        self.checkVersion(version)
+        key = self.getKey(inputSTR, filterLIST)
+        with self.lock:
+            self.rotate()
+            if key not in self.currentFilter:
+                self.currentFilter.add(key)
+            sizeINT = self.currentFilter.sizeINT + self.previousFilter.sizeINT
+        cacheSizeGauge.set(sizeINT, cache="negative")
+
+    def checkVersion(self, version):
+        """
+        每次收到 Loki 的回應都要呼叫：version 改變代表意圖或 utterance 有變動，
+        之前比對不到的句子可能已經有對應的意圖，因此整個清空
+        """
+        if version == self.version:
+            return
+        with self.lock:
+            if version != self.version:
+                self.version = version
+                self.reset()
+        cacheSizeGauge.set(0, cache="negative")
+
+    def clear(self):
+        with self.lock:
+            self.reset()
+        cacheSizeGauge.set(0, cache="negative")
+
+    def getStats(self):
+        with self.lock:
+            return {
+                "size": self.currentFilter.sizeINT + self.previousFilter.sizeINT if self.capacityINT > 0 else 0,
+                "hit": self.hitINT,
+                "miss": self.missINT,
+                "version": self.version
+            }
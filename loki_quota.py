@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki word_count_balance 配額控管
+
+    每次 BulkAPI 回應都帶有帳號剩餘的字數 (word_count_balance)，字數用完之後所有句子都會失敗。
+    QuotaGovernor 把各 worker 看到的 balance 寫入同一個 sqlite 檔 (同一台機器上的 worker 共用)，
+    以最近 loki_quota_window 秒內的紀錄估算消耗速度 (字/秒) 與預計用完的時間，
+    requestLoki() 在送到 Loki 之前以 check() 決定是否要擋下這個句子：
+
+        normal      照常送出
+        conserve    balance 低於 loki_quota_low，或預計在 loki_quota_horizon 秒內用完：
+                    擋下價值較低的句子 (打招呼、短時間內重複送出的句子、超過 loki_quota_long 字的長句)
+        critical    balance 低於 loki_quota_critical：只使用快取、FAQ、local_matcher 等本機結果，
+                    每個 worker 每 loki_quota_interval 秒只放行一個試探句子 (加值後才能從回應得知新的 balance)
+
+    被擋下的句子結果為 {"status": False, "msg": QUOTA_SHED_MSG}，與比對不到意圖相同，
+    由 app.py 改以 faq_search 本機檢索回覆。
+
+    * balance 變多 (加值) 時，只以加值之後的紀錄估算消耗速度
+    * 寫入與讀取 sqlite 最多每 loki_quota_interval 秒一次，其餘時間使用記憶體中的結果
+    * 還沒有收到任何 balance、或最新的 balance 已經超過 loki_quota_window 秒時視為未知 (normal)
+    * conserve 的 duplicate 判斷只記錄成功送到 Loki 的句子 (markSent())，呼叫失敗的句子可以馬上重試
+
+    設定 (環境變數):
+        loki_quota              sqlite 檔案路徑，空字串代表關閉 (預設 loki_quota.sqlite3)
+        loki_quota_window       估算消耗速度的時間範圍秒數 (預設 3600)
+        loki_quota_interval     寫入 / 讀取共用狀態的間隔秒數 (預設 5)
+        loki_quota_low          進入 conserve 的 balance (預設 50000)
+        loki_quota_critical     進入 critical 的 balance (預設 5000)
+        loki_quota_horizon      預計在此秒數內用完時進入 conserve (預設 86400)
+        loki_quota_long         conserve 時擋下超過此字數的句子 (預設 60)
+        loki_quota_duplicate    conserve 時擋下此秒數內已送出過的句子 (預設 300)
+
+    metrics:
+        loki_quota_balance              最近一次的 word_count_balance
+        loki_quota_burn_rate            每秒消耗的字數
+        loki_quota_runout_seconds       預計用完的秒數 (沒有消耗時為 -1)
+        loki_quota_level                0 = normal, 1 = conserve, 2 = critical
+        loki_quota_shed_total{reason}   被擋下的句子數 (greeting / duplicate / long / critical)
+        loki_quota_probe_total          critical 時放行的試探句子數
+"""
+
+from collections import OrderedDict
+from threading import Lock, local
+import os
+import re
+import sqlite3
+import time
+
+from bot_logging import getLogger
+from loki_cache import normalizeInput
+import metrics
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+LOKI_QUOTA = os.environ.get("loki_quota", os.path.join(BASE_PATH, "loki_quota.sqlite3"))
+LOKI_QUOTA_WINDOW = float(os.environ.get("loki_quota_window", 3600))
+LOKI_QUOTA_INTERVAL = float(os.environ.get("loki_quota_interval", 5))
+LOKI_QUOTA_LOW = int(os.environ.get("loki_quota_low", 50000))
+LOKI_QUOTA_CRITICAL = int(os.environ.get("loki_quota_critical", 5000))
+LOKI_QUOTA_HORIZON = float(os.environ.get("loki_quota_horizon", 86400))
+LOKI_QUOTA_LONG = int(os.environ.get("loki_quota_long", 60))
+LOKI_QUOTA_DUPLICATE = float(os.environ.get("loki_quota_duplicate", 300))
+DUPLICATE_SIZE = 10000
+
+QUOTA_SHED_MSG = "Loki quota conserve."
+NORMAL = "normal"
+CONSERVE = "conserve"
+CRITICAL = "critical"
+LEVEL_DICT = {NORMAL: 0, CONSERVE: 1, CRITICAL: 2}
+
+# 打招呼、道謝等不需要 Loki 判斷意圖的句子 (正規化後整句比對)
+greetingPAT = re.compile(r"^(hi|hello|hey|哈囉|嗨|你好|您好|妳好|早安|午安|晚安|安安|謝謝|感謝|謝啦|掰掰|拜拜|再見|ok|好的?|嗯+|恩+|哈+|[\W_]*)[\W_]*$")
+
+logger = getLogger(__name__)
+
+balanceGauge = metrics.gauge("loki_quota_balance", "Loki 最近一次的 word_count_balance")
+burnRateGauge = metrics.gauge("loki_quota_burn_rate", "Loki 每秒消耗的字數")
+runoutGauge = metrics.gauge("loki_quota_runout_seconds", "Loki 字數預計用完的秒數 (-1 代表沒有消耗)")
+levelGauge = metrics.gauge("loki_quota_level", "Loki 配額控管等級 (0 = normal, 1 = conserve, 2 = critical)")
+shedCounter = metrics.counter("loki_quota_shed_total", "Loki 配額不足而沒有送出的句子數", ["reason"])
+probeCounter = metrics.counter("loki_quota_probe_total", "Loki 配額 critical 時放行的試探句子數")
+
+SCHEMA_LIST = [
+    "CREATE TABLE IF NOT EXISTS loki_quota (time REAL NOT NULL, balance INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS loki_quota_time ON loki_quota (time)",
+]
+
+
+def getBurnRate(sampleLIST):
+    """
+    sampleLIST 為依時間排序的 [(time, balance), ...]，回傳每秒消耗的字數
+    balance 變多 (加值) 時從加值之後重新計算
+    """
+    startINT = 0
+    for i in range(1, len(sampleLIST)):
+        if sampleLIST[i][1] > sampleLIST[i-1][1]:
+            startINT = i
+    sampleLIST = sampleLIST[startINT:]
+    if len(sampleLIST) < 2 or sampleLIST[-1][0] <= sampleLIST[0][0]:
+        return 0.0
+    return max(0.0, (sampleLIST[0][1] - sampleLIST[-1][1]) / (sampleLIST[-1][0] - sampleLIST[0][0]))
+
+
+class QuotaGovernor():
+    def __init__(self, pathSTR=LOKI_QUOTA, windowFLOAT=LOKI_QUOTA_WINDOW, intervalFLOAT=LOKI_QUOTA_INTERVAL,
+                 lowINT=LOKI_QUOTA_LOW, criticalINT=LOKI_QUOTA_CRITICAL, horizonFLOAT=LOKI_QUOTA_HORIZON,
+                 longINT=LOKI_QUOTA_LONG, duplicateFLOAT=LOKI_QUOTA_DUPLICATE):
+        self.pathSTR = pathSTR
+        self.windowFLOAT = windowFLOAT
+        self.intervalFLOAT = intervalFLOAT
+        self.lowINT = lowINT
+        self.criticalINT = criticalINT
+        self.horizonFLOAT = horizonFLOAT
+        self.longINT = longINT
+        self.duplicateFLOAT = duplicateFLOAT
+        self.enableBOOL = bool(pathSTR)
+        self.balanceINT = None          # 最近一次的 word_count_balance，None 代表未知
+        self.balanceTime = 0.0
+        self.burnRateFLOAT = 0.0
+        self.level = NORMAL
+        self.writeTime = 0.0
+        self.readTime = 0.0
+        self.probeTime = 0.0            # critical 時最近一次放行試探句子的時間
+        self.sentDICT = OrderedDict()   # 正規化後的句子 => 最近一次送到 Loki 的時間
+        self.lock = Lock()
+        self.threadLocal = local()
+
+    def getConnection(self):
+        # sqlite 連線不能跨 thread / fork 使用，每個 thread 各自建立
+        connection = getattr(self.threadLocal, "connection", None)
+        if connection is None or self.threadLocal.pid != os.getpid():
+            connection = sqlite3.connect(self.pathSTR, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            for sqlSTR in SCHEMA_LIST:
+                connection.execute(sqlSTR)
+            self.threadLocal.connection = connection
+            self.threadLocal.pid = os.getpid()
+        return connection
+
+    def record(self, balanceINT):
+        """
+        每次收到 BulkAPI 的回應時以 word_count_balance 呼叫
+        """
+        balanceGauge.set(balanceINT)       # 關閉配額控管時 /metrics 仍要有最近一次的 balance
+        if not self.enableBOOL:
+            return
+
+        nowTime = time.time()
+        with self.lock:
+            self.balanceINT = balanceINT
+            self.balanceTime = nowTime
+            writeBOOL = nowTime - self.writeTime >= self.intervalFLOAT
+            if writeBOOL:
+                self.writeTime = nowTime
+        if writeBOOL:
+            try:
+                connection = self.getConnection()
+                with connection:
+                    connection.execute("BEGIN")
+                    connection.execute("INSERT INTO loki_quota (time, balance) VALUES (?, ?)", (nowTime, balanceINT))
+                    connection.execute("DELETE FROM loki_quota WHERE time < ?", (nowTime - self.windowFLOAT,))
+            except Exception as e:
+                logger.error("[ERROR] QuotaGovernor.record => %s", str(e))
+            self.refresh(forceBOOL=True)
+        else:
+            self.updateLevel()
+
+    def refresh(self, forceBOOL=False):
+        """
+        從共用的 sqlite 讀取所有 worker 的紀錄，重新估算消耗速度
+        """
+        nowTime = time.time()
+        with self.lock:
+            if not forceBOOL and nowTime - self.readTime < self.intervalFLOAT:
+                return
+            self.readTime = nowTime
+        try:
+            sampleLIST = self.getConnection().execute(
+                "SELECT time, balance FROM loki_quota WHERE time >= ? ORDER BY time", (nowTime - self.windowFLOAT,)).fetchall()
+        except Exception as e:
+            logger.error("[ERROR] QuotaGovernor.refresh => %s", str(e))
+            return
+
+        with self.lock:
+            if sampleLIST and sampleLIST[-1][0] > self.balanceTime:
+                # 其他 worker 有更新的 balance
+                self.balanceTime, self.balanceINT = sampleLIST[-1]
+            self.burnRateFLOAT = getBurnRate(sampleLIST)
+        burnRateGauge.set(self.burnRateFLOAT)
+        self.updateLevel()
+
+    def getRunout(self):
+        """
+        回傳預計用完的秒數，沒有消耗或 balance 未知時回傳 -1
+        """
+        with self.lock:
+            if self.balanceINT is None or self.burnRateFLOAT <= 0:
+                return -1
+            return max(0, self.balanceINT) / self.burnRateFLOAT
+
+    def updateLevel(self):
+        with self.lock:
+            if self.balanceINT is not None and time.time() - self.balanceTime > self.windowFLOAT:
+                # 太久沒有新的 balance (例如 critical 期間都沒有呼叫 Loki)，不再沿用舊的值
+                self.balanceINT = None
+                self.burnRateFLOAT = 0.0
+        runoutFLOAT = self.getRunout()
+        with self.lock:
+            if self.balanceINT is None:
+                level = NORMAL
+            elif self.balanceINT < self.criticalINT:
+                level = CRITICAL
+            elif self.balanceINT < self.lowINT or 0 <= runoutFLOAT < self.horizonFLOAT:
+                level = CONSERVE
+            else:
+                level = NORMAL
+            changedBOOL = level != self.level
+            self.level = level
+        runoutGauge.set(runoutFLOAT)
+        levelGauge.set(LEVEL_DICT[level])
+        if changedBOOL:
+            logger.warning("[Quota] Loki word_count_balance %s => %s", self.balanceINT, level)
+
+    def getLevel(self):
+        if self.enableBOOL:
+            self.refresh()
+        return self.level
+
+    def isCritical(self):
+        return self.enableBOOL and self.level == CRITICAL
+
+    def check(self, inputSTR):
+        """
+        回傳擋下這個句子的原因 (greeting / duplicate / long / critical)，可以送到 Loki 時回傳 None
+        """
+        if not self.enableBOOL:
+            return None
+
+        level = self.getLevel()
+        key = normalizeInput(inputSTR)
+        reasonSTR = None
+        if level == CRITICAL:
+            nowTime = time.time()
+            with self.lock:
+                probeBOOL = nowTime - self.probeTime >= self.intervalFLOAT
+                if probeBOOL:
+                    self.probeTime = nowTime
+            if probeBOOL:
+                probeCounter.inc()
+            else:
+                reasonSTR = "critical"
+        elif level == CONSERVE:
+            if greetingPAT.match(key):
+                reasonSTR = "greeting"
+            elif len(key) > self.longINT:
+                reasonSTR = "long"
+            else:
+                with self.lock:
+                    sentTime = self.sentDICT.get(key)
+                if sentTime is not None and time.time() - sentTime < self.duplicateFLOAT:
+                    reasonSTR = "duplicate"
+
+        if reasonSTR is not None:
+            shedCounter.inc(reason=reasonSTR)
+        return reasonSTR
+
+    def markSent(self, inputSTR):
+        """
+        句子成功送到 Loki (已扣字數) 後呼叫，conserve 時 loki_quota_duplicate 秒內不再送出相同的句子
+        """
+        if not self.enableBOOL:
+            return
+
+        key = normalizeInput(inputSTR)
+        with self.lock:
+            self.sentDICT[key] = time.time()
+            self.sentDICT.move_to_end(key)
+            if len(self.sentDICT) > DUPLICATE_SIZE:
+                self.sentDICT.popitem(last=False)
+
+    def getStats(self):
+        runoutFLOAT = self.getRunout()
+        with self.lock:
+            return {
+                "level": self.level,
+                "balance": self.balanceINT,
+                "burnRate": self.burnRateFLOAT,
+                "runout": runoutFLOAT
+            }
+
+
+lokiQuota = QuotaGovernor()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    Loki API 共用的 HTTP 連線池
+
+    所有對 api.droidtown.co 的呼叫共用同一個 urllib3 連線池 (keep-alive)，
+    避免每次 post() 都重新建立 TCP + TLS 連線。
+    每個 thread 各自有一個 requests.Session (cookie 等狀態不共用)，但都掛載同一個 HTTPAdapter，
+    因此連線池是整個 worker 共用且 thread-safe。
+
+    設定 (環境變數):
+        loki_pool_size          連線池大小 (預設 10)
+        loki_connect_timeout    連線 timeout 秒數 (預設 3.05)
+        loki_read_timeout       讀取 timeout 秒數 (預設 10)
+        loki_retry              連線失敗或 429/503 時重試次數 (預設 2)
+        loki_backoff            重試 backoff 係數，第 n 次重試等待 backoff * 2^(n-1) 秒 (預設 0.3)
+        loki_backoff_max        每次重試等待時間上限秒數 (預設 2)
+
+    BulkAPI 的 POST 會扣 word_count_balance，不是 idempotent：
+    只有連線失敗 (請求還沒送出) 與 429 / 503 (伺服器拒絕處理) 才重試；500 / 502 / 504 與讀取逾時時
+    Loki 可能已經處理並扣了字數，不重送。Retry-After header 不採用 (過大的值會讓 request thread 卡在 urllib3 中)，
+    等待時間一律由 loki_backoff / loki_backoff_max 決定。
+
+    asyncio 版本 (execLoki_async() 使用) 以 aiohttp 實作：每個 event loop 各自有一個 ClientSession，
+    連線數上限、timeout 與重試 (連線失敗或 429/503，讀取逾時不重送) 的設定與同步版本相同。
+    aiohttp 只在第一次呼叫 post_async() 時才 import。
+
+    e.g.
+        from loki_session import post
+        result = post(LOKI_URL, json=payload)
+
+        statusCode, result = await post_async(LOKI_URL, json=payload)
+"""
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from threading import Lock, local
+from urllib3.util.retry import Retry
+from weakref import WeakKeyDictionary
+import asyncio
+import os
+
+LOKI_POOL_SIZE = int(os.environ.get("loki_pool_size", 10))
+LOKI_CONNECT_TIMEOUT = float(os.environ.get("loki_connect_timeout", 3.05))
+LOKI_READ_TIMEOUT = float(os.environ.get("loki_read_timeout", 10))
+LOKI_RETRY = int(os.environ.get("loki_retry", 2))
+LOKI_BACKOFF = float(os.environ.get("loki_backoff", 0.3))
+LOKI_BACKOFF_MAX = float(os.environ.get("loki_backoff_max", 2))
+
+adapterLock = Lock()
+adapterDICT = {}        # pid => HTTPAdapter，fork 後的子行程不沿用父行程的連線
+threadLocal = local()
+asyncSessionDICT = WeakKeyDictionary()     # event loop => aiohttp.ClientSession
+RETRY_STATUS_LIST = [429, 503]     # 伺服器沒有處理請求的 status code (不會扣字數)
+
+def getAdapter():
+    pid = os.getpid()
+    with adapterLock:
+        if pid not in adapterDICT:
+            adapterDICT.clear()
+            retry = Retry(
+                total=LOKI_RETRY,
+                connect=LOKI_RETRY,
+                read=0,                                  # 已送出的請求讀取逾時不重送，避免重複扣字數
+                status=LOKI_RETRY,
+                backoff_factor=LOKI_BACKOFF,
+                backoff_max=LOKI_BACKOFF_MAX,
+                status_forcelist=RETRY_STATUS_LIST,
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=False,
+                raise_on_status=False
+            )
+            adapterDICT[pid] = HTTPAdapter(pool_connections=LOKI_POOL_SIZE, pool_maxsize=LOKI_POOL_SIZE, max_retries=retry)
+        return adapterDICT[pid]
+
+def getSession():
+    adapter = getAdapter()
+    session = getattr(threadLocal, "session", None)
+    if session is None or getattr(threadLocal, "adapter", None) is not adapter:
+        session = Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        threadLocal.session = session
+        threadLocal.adapter = adapter
+    return session
+
+def post(url, timeout=None, **kwargs):
+    """
+    與 requests.post() 用法相同，但使用共用連線池並預設帶上 timeout
+    """
+    if timeout is None:
+        timeout = (LOKI_CONNECT_TIMEOUT, LOKI_READ_TIMEOUT)
+    return getSession().post(url, timeout=timeout, **kwargs)
+
+def getAsyncSession():
+    # aiohttp 的 ClientSession 只能在建立它的 event loop 中使用
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = asyncSessionDICT.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=LOKI_POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(sock_connect=LOKI_CONNECT_TIMEOUT, sock_read=LOKI_READ_TIMEOUT)
+        )
+        asyncSessionDICT[loop] = session
+    return session
+
+async def closeAsyncSession():
+    """
+    在 event loop 結束前呼叫，關閉這個 loop 的 ClientSession
+    """
+    session = asyncSessionDICT.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+async def post_async(url, json=None):
+    """
+    post() 的 asyncio 版本，回傳 (status code, response json)；status code 不是 200 時 response json 為 None
+    """
+    import aiohttp
+
+    session = getAsyncSession()
+    for retryINT in range(LOKI_RETRY + 1):
+        if retryINT > 0:
+            await asyncio.sleep(min(LOKI_BACKOFF_MAX, LOKI_BACKOFF * 2 ** (retryINT - 1)))
+        try:
+            async with session.post(url, json=json) as response:
+                if response.status in RETRY_STATUS_LIST and retryINT < LOKI_RETRY:
+                    continue
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await response.json(content_type=None)
+        except aiohttp.ClientConnectorError:
+            # 與同步版本相同：只有連線失敗才重試，已送出的請求不重送，避免重複扣字數
+            if retryINT >= LOKI_RETRY:
+                raise
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    相同問題的 Loki 查詢合併 (single-flight)
+
+    熱門問題 (例如信用卡系統異常時) 常在同一秒內被大量使用者詢問，
+    同一個 key 同時只會有一個呼叫端 (leader) 真正送到 Loki，其他呼叫端 (follower) 等待同一個 Future。
+    leader 一定要呼叫 done()，否則 follower 只能等到各自的 timeout。
+
+    設定 (環境變數):
+        loki_singleflight_timeout   follower 等待 leader 結果的秒數 (預設 15)
+
+    metrics:
+        loki_singleflight_total{result}     leader：實際送出的句數
+                                            saved：等待 leader 結果、省下的 Loki 呼叫
+                                            error：leader 呼叫失敗，follower 收到相同的錯誤
+                                            timeout：follower 等待逾時
+
+    e.g.
+        future, leaderBOOL = lokiFlight.join(key)
+        if leaderBOOL:
+            try:
+                result = callLoki(...)
+            finally:
+                lokiFlight.done(key, future, result)
+        else:
+            result = lokiFlight.wait(future)            # asyncio 中使用 await lokiFlight.wait_async(future)
+"""
+
+from concurrent.futures import Future, TimeoutError
+from threading import Lock
+import asyncio
+import os
+
+import metrics
+
+LOKI_SINGLEFLIGHT_TIMEOUT = float(os.environ.get("loki_singleflight_timeout", 15))
+
+flightCounter = metrics.counter("loki_singleflight_total", "相同問題合併查詢的次數", ["result"])
+
+
+class SingleFlight():
+    def __init__(self, timeoutFLOAT=LOKI_SINGLEFLIGHT_TIMEOUT):
+        self.timeoutFLOAT = timeoutFLOAT
+        self.flightDICT = {}        # key => 進行中的 Future
+        self.lock = Lock()
+
+    def join(self, key):
+        """
+        回傳 (future, leaderBOOL)，leaderBOOL 為 True 時呼叫端須負責查詢並呼叫 done()
+        """
+        with self.lock:
+            future = self.flightDICT.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self.flightDICT[key] = future
+        flightCounter.inc(result="leader")
+        return future, True
+
+    def done(self, key, future, result):
+        with self.lock:
+            if self.flightDICT.get(key) is future:
+                del self.flightDICT[key]
+        if not future.done():
+            future.set_result(result)
+
+    def wait(self, future, timeoutFLOAT=None):
+        """
+        等待 leader 的結果 ({"status": ..., "msg": ...})，逾時回傳 {"status": False, "msg": ...}
+        """
+        if timeoutFLOAT is None:
+            timeoutFLOAT = self.timeoutFLOAT
+        try:
+            result = future.result(timeout=timeoutFLOAT)
+        except TimeoutError:
+            flightCounter.inc(result="timeout")
+            return {"status": False, "msg": "Loki request timeout ({}s)".format(timeoutFLOAT)}
+        flightCounter.inc(result="saved" if result["status"] else "error")
+        return result
+
+    async def wait_async(self, future, timeoutFLOAT=None):
+        """
+        wait() 的 asyncio 版本，等待時不會佔住 event loop
+        """
+        if timeoutFLOAT is None:
+            timeoutFLOAT = self.timeoutFLOAT
+        try:
+            # shield：逾時或被取消時不能連帶取消 leader 的 Future (其他 follower 還在等)
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeoutFLOAT)
+        except asyncio.TimeoutError:
+            flightCounter.inc(result="timeout")
+            return {"status": False, "msg": "Loki request timeout ({}s)".format(timeoutFLOAT)}
+        flightCounter.inc(result="saved" if result["status"] else "error")
+        return result
+
+    def getSize(self):
+        with self.lock:
+            return len(self.flightDICT)
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    簡易 metrics 收集模組 (Counter / Gauge / Histogram)
+
+    所有 metric 都註冊在 registryDICT，同名 metric 重複宣告會取得同一個物件，
+    各模組可以直接在 import 時宣告自己要用的 metric。
+
+    gunicorn 的每個 worker 各自累計，Exporter 的背景 thread 每 metrics_interval 秒把該 worker 的 snapshot
+    寫到 metrics_dir/<pid>-<啟動時間>.json (寫入暫存檔後 rename，讀取端不會讀到寫一半的檔案)；/metrics 讀取所有 worker 的檔案合併：
+
+    * counter / histogram：所有 worker 相加 (已結束的 worker 仍保留，數值不會倒退)
+    * gauge：只看還在執行的 worker，依宣告時的 aggregateSTR 合併
+      sum (例如處理中的請求數)、max、min、last (最後一次 set 的值，例如 word_count_balance)
+
+    已結束的 worker (pid 不存在、同一個 pid 有較新的檔案、或超過 10 個 metrics_interval 沒有更新) 的檔案
+    會在 /metrics 被讀取時合併進 metrics_dir/retired.json 後刪除 (以 flock 避免多個 worker 同時合併)：
+    檔名包含啟動時間，pid 被新的 worker 重複使用時不會覆蓋舊 worker 的數值，counter 不會倒退。
+
+    記錄時只有原本的 lock + dict 更新，合併與格式化都在 /metrics 被讀取時才進行。
+    metrics_dir 不會自動清除，部署時 (例如 gunicorn 的 on_starting) 可以清空以免納入上一次執行的 worker。
+
+    設定 (環境變數):
+        metrics_dir         各 worker snapshot 的目錄，空字串代表不輸出、只回報目前的 worker (預設 metrics_data)
+        metrics_interval    寫出 snapshot 的間隔秒數 (預設 5)
+
+    e.g.
+        callCounter = metrics.counter("loki_call_total", "Loki 呼叫次數", ["status"])
+        callCounter.inc(status="ok")
+
+        latencyHistogram = metrics.histogram("loki_call_seconds", "Loki 呼叫延遲")
+        latencyHistogram.observe(0.12)
+        latencyHistogram.getQuantile(0.99)
+
+        inflightGauge = metrics.gauge("inflight_requests", "處理中的請求數", aggregateSTR="sum")
+
+        metrics.startExporter()                 # 每個 worker 都要呼叫 (重複呼叫沒有影響)
+        textSTR = metrics.render(metrics.collect())
+"""
+
+from threading import Lock, Thread
+import atexit
+import bisect
+import json
+import math
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:         # Windows 沒有 fcntl，不合併已結束的 worker (檔案保留，數值仍會相加)
+    fcntl = None
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+METRICS_DIR = os.environ.get("metrics_dir", os.path.join(BASE_PATH, "metrics_data"))
+METRICS_INTERVAL = float(os.environ.get("metrics_interval", 5))
+RETIRED_FILE = "retired.json"
+LOCK_FILE = "retired.lock"
+
+# 預設的延遲 bucket (秒)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+registryDICT = {}
+registryLock = Lock()
+
+
+class Metric():
+    typeSTR = ""
+
+    def __init__(self, name, doc, labelLIST=[]):
+        self.name = name
+        self.doc = doc
+        self.labelLIST = list(labelLIST)
+        self.lock = Lock()
+        self.valueDICT = {}
+
+    def getLabelKey(self, labelDICT):
+        # hot path：沒有 label 時不建立 tuple，list comprehension 比 generator 快
+        if not self.labelLIST:
+            return ()
+        return tuple([str(labelDICT.get(k, "")) for k in self.labelLIST])
+
+    def getValue(self, **labels):
+        with self.lock:
+            return self.valueDICT.get(self.getLabelKey(labels), 0)
+
+    def getSnapshot(self):
+        with self.lock:
+            return {
+                "type": self.typeSTR,
+                "doc": self.doc,
+                "labels": self.labelLIST,
+                "values": [[list(k), v] for k, v in self.valueDICT.items()]
+            }
+
+
+class Counter(Metric):
+    typeSTR = "counter"
+
+    def inc(self, value=1, **labels):
+        key = self.getLabelKey(labels)
+        with self.lock:
+            self.valueDICT[key] = self.valueDICT.get(key, 0) + value
+
+
+class Gauge(Metric):
+    typeSTR = "gauge"
+
+    def __init__(self, name, doc, labelLIST=[], aggregateSTR="last"):
+        super().__init__(name, doc, labelLIST)
+        self.aggregateSTR = aggregateSTR
+        self.timeDICT = {}              # 最後一次更新的時間，合併 last 時使用
+
+    def set(self, value, **labels):
+        key = self.getLabelKey(labels)
+        with self.lock:
+            self.valueDICT[key] = value
+            self.timeDICT[key] = time.time()
+
+    def inc(self, value=1, **labels):
+        key = self.getLabelKey(labels)
+        with self.lock:
+            self.valueDICT[key] = self.valueDICT.get(key, 0) + value
+            self.timeDICT[key] = time.time()
+
+    def dec(self, value=1, **labels):
+        self.inc(-value, **labels)
+
+    def getSnapshot(self):
+        snapshotDICT = super().getSnapshot()
+        with self.lock:
+            snapshotDICT["aggregate"] = self.aggregateSTR
+            snapshotDICT["times"] = [[list(k), v] for k, v in self.timeDICT.items()]
+        return snapshotDICT
+
+
+class Histogram(Metric):
+    typeSTR = "histogram"
+
+    def __init__(self, name, doc, labelLIST=[], bucketLIST=DEFAULT_BUCKETS):
+        super().__init__(name, doc, labelLIST)
+        self.bucketLIST = sorted(bucketLIST)
+
+    def observe(self, value, **labels):
+        key = self.getLabelKey(labels)
+        with self.lock:
+            if key not in self.valueDICT:
+                # 最後一格為 +Inf
+                self.valueDICT[key] = {"buckets": [0] * (len(self.bucketLIST) + 1), "sum": 0.0, "count": 0}
+            valueDICT = self.valueDICT[key]
+            valueDICT["buckets"][bisect.bisect_left(self.bucketLIST, value)] += 1
+            valueDICT["sum"] += value
+            valueDICT["count"] += 1
+
+    def getValue(self, **labels):
+        with self.lock:
+            valueDICT = self.valueDICT.get(self.getLabelKey(labels))
+            if valueDICT is None:
+                return {"buckets": [0] * (len(self.bucketLIST) + 1), "sum": 0.0, "count": 0}
+            return {"buckets": list(valueDICT["buckets"]), "sum": valueDICT["sum"], "count": valueDICT["count"]}
+
+    def getQuantile(self, quantile, **labels):
+        """
+        依 bucket 做線性內插估計分位數 (同 Prometheus histogram_quantile)
+        沒有資料時回傳 NaN
+        """
+        valueDICT = self.getValue(**labels)
+        return getBucketQuantile(self.bucketLIST, valueDICT["buckets"], quantile)
+
+    def getSnapshot(self):
+        with self.lock:
+            snapshotDICT = {
+                "type": self.typeSTR,
+                "doc": self.doc,
+                "labels": self.labelLIST,
+                "bucketList": self.bucketLIST,
+                # 複製一份，寫出 / 合併時不會與 observe() 互相影響
+                "values": [[list(k), {"buckets": list(v["buckets"]), "sum": v["sum"], "count": v["count"]}] for k, v in self.valueDICT.items()]
+            }
+        return snapshotDICT
+
+
+def getBucketQuantile(bucketLIST, countLIST, quantile):
+    totalINT = sum(countLIST)
+    if totalINT == 0:
+        return math.nan
+
+    rankFLOAT = quantile * totalINT
+    cumulativeINT = 0
+    for i, countINT in enumerate(countLIST):
+        if cumulativeINT + countINT >= rankFLOAT and countINT > 0:
+            if i == len(bucketLIST):
+                # 落在 +Inf，只能回傳最大的 bucket 上限
+                return bucketLIST[-1]
+            lowerFLOAT = bucketLIST[i-1] if i > 0 else 0.0
+            return lowerFLOAT + (bucketLIST[i] - lowerFLOAT) * (rankFLOAT - cumulativeINT) / countINT
+        cumulativeINT += countINT
+    return bucketLIST[-1]
+
+
+def register(metricCLASS, name, doc, labelLIST, **kwargs):
+    with registryLock:
+        if name not in registryDICT:
+            registryDICT[name] = metricCLASS(name, doc, labelLIST, **kwargs)
+        return registryDICT[name]
+
+def counter(name, doc, labelLIST=[]):
+    return register(Counter, name, doc, labelLIST)
+
+def gauge(name, doc, labelLIST=[], aggregateSTR="last"):
+    """
+    aggregateSTR 為跨 worker 合併的方式：sum / max / min / last
+    """
+    return register(Gauge, name, doc, labelLIST, aggregateSTR=aggregateSTR)
+
+def histogram(name, doc, labelLIST=[], bucketLIST=DEFAULT_BUCKETS):
+    return register(Histogram, name, doc, labelLIST, bucketLIST=bucketLIST)
+
+def getSnapshot():
+    with registryLock:
+        metricLIST = list(registryDICT.values())
+    return {m.name: m.getSnapshot() for m in metricLIST}
+
+
+def isAlive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def mergeSnapshot(workerLIST):
+    """
+    合併多個 worker 的 snapshot
+    workerLIST 為 [(是否還在執行, getSnapshot() 的結果), ...]，回傳與 getSnapshot() 相同格式的結果
+    """
+    mergedDICT = {}
+    for aliveBOOL, snapshotDICT in workerLIST:
+        for name, metricDICT in snapshotDICT.items():
+            typeSTR = metricDICT["type"]
+            if typeSTR == "gauge" and not aliveBOOL:
+                continue
+            if name not in mergedDICT:
+                mergedDICT[name] = {k: v for k, v in metricDICT.items() if k not in ["values", "times"]}
+                mergedDICT[name]["values"] = {}
+            valueDICT = mergedDICT[name]["values"]
+
+            if typeSTR == "counter":
+                for labelLIST, value in metricDICT["values"]:
+                    key = tuple(labelLIST)
+                    valueDICT[key] = valueDICT.get(key, 0) + value
+            elif typeSTR == "histogram":
+                if metricDICT["bucketList"] != mergedDICT[name]["bucketList"]:
+                    # bucket 不同 (部署途中新舊版本並存) 無法相加
+                    continue
+                for labelLIST, value in metricDICT["values"]:
+                    key = tuple(labelLIST)
+                    if key not in valueDICT:
+                        valueDICT[key] = {"buckets": [0] * len(value["buckets"]), "sum": 0.0, "count": 0}
+                    for i, countINT in enumerate(value["buckets"]):
+                        valueDICT[key]["buckets"][i] += countINT
+                    valueDICT[key]["sum"] += value["sum"]
+                    valueDICT[key]["count"] += value["count"]
+            elif typeSTR == "gauge":
+                aggregateSTR = metricDICT.get("aggregate", "last")
+                timeDICT = {tuple(labelLIST): t for labelLIST, t in metricDICT.get("times", [])}
+                for labelLIST, value in metricDICT["values"]:
+                    key = tuple(labelLIST)
+                    updateTime = timeDICT.get(key, 0.0)
+                    if key not in valueDICT:
+                        valueDICT[key] = (value, updateTime)
+                    elif aggregateSTR == "sum":
+                        valueDICT[key] = (valueDICT[key][0] + value, max(valueDICT[key][1], updateTime))
+                    elif aggregateSTR == "max":
+                        valueDICT[key] = max(valueDICT[key], (value, updateTime))
+                    elif aggregateSTR == "min":
+                        valueDICT[key] = min(valueDICT[key], (value, updateTime))
+                    elif updateTime >= valueDICT[key][1]:
+                        valueDICT[key] = (value, updateTime)
+
+    for metricDICT in mergedDICT.values():
+        if metricDICT["type"] == "gauge":
+            metricDICT["values"] = [[list(k), v[0]] for k, v in metricDICT["values"].items()]
+        else:
+            metricDICT["values"] = [[list(k), v] for k, v in metricDICT["values"].items()]
+    return mergedDICT
+
+
+class Exporter():
+    """
+    每個 worker 一個背景 thread，定期把 getSnapshot() 寫到 dirSTR/<pid>-<啟動時間>.json
+    """
+    def __init__(self, dirSTR=METRICS_DIR, intervalFLOAT=METRICS_INTERVAL):
+        self.dirSTR = dirSTR
+        self.intervalFLOAT = intervalFLOAT
+        self.staleFLOAT = max(60.0, intervalFLOAT * 10)
+        self.exporterPID = None
+        self.startTime = time.time()
+        self.lock = Lock()
+
+    def getPath(self):
+        return os.path.join(self.dirSTR, "{}-{}.json".format(os.getpid(), int(self.startTime * 1000)))
+
+    def start(self):
+        # gunicorn --preload 時 fork 前建立的 thread 不會被帶到子行程，因此以 pid 判斷是否需要重新啟動
+        if not self.dirSTR or self.exporterPID == os.getpid():
+            return
+        with self.lock:
+            if self.exporterPID == os.getpid():
+                return
+            firstBOOL = self.exporterPID is None
+            self.exporterPID = os.getpid()
+            self.startTime = time.time()
+            try:
+                os.makedirs(self.dirSTR, exist_ok=True)
+            except OSError:
+                self.dirSTR = ""
+                return
+            Thread(target=self.run, args=(self.exporterPID,), name="metrics-exporter", daemon=True).start()
+            if firstBOOL:
+                # 結束前寫出最後的數值 (fork 出的子行程也會執行，寫到各自的 pid)
+                atexit.register(self.write)
+
+    def run(self, pid):
+        while self.exporterPID == pid:
+            self.write()
+            time.sleep(self.intervalFLOAT)
+
+    def write(self):
+        if not self.dirSTR:
+            return
+        writeJSON(self.getPath(), {"pid": os.getpid(), "start": self.startTime, "time": time.time(), "metrics": getSnapshot()})
+
+    def readWorkers(self):
+        """
+        讀取其他 worker 的檔案，回傳 {檔名: 檔案內容} (不含 retired.json 與目前的 worker)
+        """
+        ownFileSTR = os.path.basename(self.getPath())
+        workerDICT = {}
+        for fileNameSTR in os.listdir(self.dirSTR):
+            if not fileNameSTR.endswith(".json") or fileNameSTR in [ownFileSTR, RETIRED_FILE]:
+                continue
+            fileDICT = readJSON(os.path.join(self.dirSTR, fileNameSTR))
+            if fileDICT is not None and "pid" in fileDICT and "metrics" in fileDICT:
+                workerDICT[fileNameSTR] = fileDICT
+        return workerDICT
+
+    def isRetired(self, fileDICT, workerDICT):
+        pid = fileDICT["pid"]
+        startTime = fileDICT.get("start", 0)
+        if pid == os.getpid():
+            # 目前的 worker 使用記憶體中的數值，同一個 pid 的檔案只可能是之前的 worker
+            return True
+        if any(d["pid"] == pid and d.get("start", 0) > startTime for d in workerDICT.values()):
+            # pid 已被新的 worker 重複使用
+            return True
+        return not isAlive(pid) or time.time() - fileDICT.get("time", 0) > self.staleFLOAT
+
+    def retire(self, workerDICT, retiredDICT):
+        """
+        將已結束的 worker 合併進 retired.json 後刪除檔案，回傳 (仍在執行的 worker, retired.json 的內容)
+        retired.json 記錄最後一次合併的檔名，合併後還沒刪除就中斷時，下次只刪除不再重複相加
+        """
+        for fileNameSTR in retiredDICT["files"]:
+            if workerDICT.pop(fileNameSTR, None) is not None:
+                removeFile(os.path.join(self.dirSTR, fileNameSTR))
+
+        retiredLIST = [f for f, d in workerDICT.items() if self.isRetired(d, workerDICT)]
+        if not retiredLIST:
+            return workerDICT, retiredDICT
+        snapshotLIST = [(False, retiredDICT["metrics"])] + [(False, workerDICT[f]["metrics"]) for f in retiredLIST]
+        newRetiredDICT = {"files": retiredLIST, "time": time.time(), "metrics": mergeSnapshot(snapshotLIST)}
+        if not writeJSON(os.path.join(self.dirSTR, RETIRED_FILE), newRetiredDICT):
+            return workerDICT, retiredDICT
+        for fileNameSTR in retiredLIST:
+            removeFile(os.path.join(self.dirSTR, fileNameSTR))
+        return {f: d for f, d in workerDICT.items() if f not in retiredLIST}, newRetiredDICT
+
+    def collect(self):
+        """
+        合併所有 worker 的 snapshot；目前的 worker 使用記憶體中最新的數值
+        讀取與合併 retired.json 都在 flock 中進行，不會在其他 worker 合併到一半時重複計算或漏算
+        """
+        workerLIST = [(True, getSnapshot())]
+        if not self.dirSTR or not os.path.isdir(self.dirSTR):
+            return mergeSnapshot(workerLIST)
+
+        try:
+            with open(os.path.join(self.dirSTR, LOCK_FILE), "a") as lockFile:
+                if fcntl is not None:
+                    fcntl.flock(lockFile, fcntl.LOCK_EX)
+                workerDICT = self.readWorkers()
+                retiredDICT = readJSON(os.path.join(self.dirSTR, RETIRED_FILE))
+                if not isinstance(retiredDICT, dict) or "metrics" not in retiredDICT:
+                    retiredDICT = {"files": [], "metrics": {}}
+                if fcntl is not None:
+                    workerDICT, retiredDICT = self.retire(workerDICT, retiredDICT)
+        except OSError:
+            return mergeSnapshot(workerLIST)
+
+        for fileDICT in workerDICT.values():
+            workerLIST.append((not self.isRetired(fileDICT, workerDICT), fileDICT["metrics"]))
+        workerLIST.append((False, retiredDICT["metrics"]))
+        return mergeSnapshot(workerLIST)
+
+
+def readJSON(pathSTR):
+    try:
+        with open(pathSTR, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def writeJSON(pathSTR, valueDICT):
+    # 寫入暫存檔後 rename，讀取端不會讀到寫一半的檔案
+    tmpPathSTR = "{}.{}.tmp".format(pathSTR, os.getpid())
+    try:
+        with open(tmpPathSTR, "w", encoding="utf-8") as f:
+            json.dump(valueDICT, f, ensure_ascii=False)
+        os.replace(tmpPathSTR, pathSTR)
+        return True
+    except (OSError, TypeError, ValueError):
+        removeFile(tmpPathSTR)
+        return False
+
+def removeFile(pathSTR):
+    try:
+        os.remove(pathSTR)
+    except OSError:
+        pass
+
+
+def escapeLabel(valueSTR):
+    return str(valueSTR).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def formatValue(value):
+    if type(value) == bool:
+        value = int(value)
+    if type(value) == int:
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+def formatLabels(labelLIST, valueLIST, extraLIST=[]):
+    pairLIST = ['{}="{}"'.format(k, escapeLabel(v)) for k, v in list(zip(labelLIST, valueLIST)) + extraLIST]
+    return "{" + ",".join(pairLIST) + "}" if pairLIST else ""
+
+def render(snapshotDICT):
+    """
+    將 getSnapshot() / collect() 的結果轉成 Prometheus text exposition format (0.0.4)
+    """
+    lineLIST = []
+    for name in sorted(snapshotDICT):
+        metricDICT = snapshotDICT[name]
+        labelLIST = metricDICT["labels"]
+        lineLIST.append("# HELP {} {}".format(name, metricDICT["doc"].replace("\\", "\\\\").replace("\n", "\\n")))
+        lineLIST.append("# TYPE {} {}".format(name, metricDICT["type"]))
+        for valueLIST, value in sorted(metricDICT["values"], key=lambda v: v[0]):
+            if value is None:
+                continue
+            if metricDICT["type"] != "histogram":
+                lineLIST.append("{}{} {}".format(name, formatLabels(labelLIST, valueLIST), formatValue(value)))
+                continue
+            cumulativeINT = 0
+            for bucket, countINT in zip(list(metricDICT["bucketList"]) + [math.inf], value["buckets"]):
+                cumulativeINT += countINT
+                lineLIST.append("{}_bucket{} {}".format(name, formatLabels(labelLIST, valueLIST, [("le", formatValue(float(bucket)))]), cumulativeINT))
+            lineLIST.append("{}_sum{} {}".format(name, formatLabels(labelLIST, valueLIST), formatValue(value["sum"])))
+            lineLIST.append("{}_count{} {}".format(name, formatLabels(labelLIST, valueLIST), value["count"]))
+    return "\n".join(lineLIST) + "\n"
+
+exporter = Exporter()
+
+def startExporter():
+    exporter.start()
+
+def collect():
+    return exporter.collect()
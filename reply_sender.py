@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    LINE 回覆的非同步發送佇列
+
+    原本在處理 webhook 的 thread 中直接呼叫 reply_message()，LINE API 變慢時 webhook worker 會一起被卡住，
+    失敗時也只在 except 中改用 push_message() 送一次。ReplySender 把要回覆的訊息放進有上限的佇列，
+    由背景的 sender thread 經由 line_client 的共用連線池送出：
+
+    * replyToken 還在有效時間內時以 reply_message() 回覆；超過 reply_token_ttl 秒、
+      或 LINE 回應 replyToken 無效 (已過期 / 已使用) 時，自動改用 push_message() 送給 userId
+      (沒有 userId 時，例如群組中未同意的成員，只能以 replyToken 回覆)
+    * 連線失敗、429、5xx 時重試，第 n 次重試前等待 0 ~ min(reply_backoff_max, reply_backoff * 2^(n-1)) 秒之間的隨機時間 (full jitter)
+    * 讀取逾時不重試 (LINE 可能已經收到，重送會讓使用者收到兩次)；
+      也不使用 push_message() 的 retry_key，SDK 會把它留在共用 client 的 headers 中，之後所有的 push 都會被當成重複請求
+    * 佇列已滿時直接在呼叫端同步送出，不會丟掉訊息
+    * 結束時 (atexit) 最多等待 reply_drain 秒，把佇列中剩下的回覆送完
+
+    設定 (環境變數):
+        reply_worker            sender thread 數 (預設 8，不應超過 line_pool_size)
+        reply_queue_size        佇列上限 (預設 1000)
+        reply_token_ttl         replyToken 有效時間，超過此秒數改用 push_message 回覆 (預設 50)
+        reply_retry             重試次數 (預設 3)
+        reply_backoff           重試等待時間的基數秒數 (預設 0.2)
+        reply_backoff_max       重試等待時間上限秒數 (預設 5)
+        reply_drain             結束時等待佇列送完的秒數 (預設 5)
+
+    metrics:
+        reply_queue_depth                   佇列中等待送出的回覆數 (所有 worker 相加)
+        reply_queue_wait_seconds            從放入佇列到 sender thread 開始送出的時間
+        reply_send_seconds{method}          每次呼叫 reply_message / push_message 的時間
+        reply_delivery_seconds{method}      從收到 webhook 到送達的時間
+        reply_delivery_total{result}        reply / push：送達的方式；failed：重試後仍失敗
+        reply_retry_total{method}           重試次數
+        reply_fallback_total{reason}        改用 push 的次數 (expired：超過 reply_token_ttl；invalid_token：LINE 回應 replyToken 無效)
+        reply_queue_rejected_total          佇列已滿，改為同步送出的次數
+
+    e.g.
+        replySender = ReplySender()
+        replySender.send(tk, userId, TextSendMessage("..."), receivedTime)
+"""
+
+from contextvars import copy_context
+from queue import Queue, Full
+from threading import Lock, Thread
+import atexit
+import os
+import random
+import time
+
+from linebot.exceptions import LineBotApiError
+from requests.exceptions import ConnectionError, ReadTimeout
+
+from bot_logging import getLogger
+from line_client import getLineBotApi
+from tracing import span
+import metrics
+
+REPLY_WORKER = int(os.environ.get("reply_worker", 8))
+REPLY_QUEUE_SIZE = int(os.environ.get("reply_queue_size", 1000))
+REPLY_TOKEN_TTL = float(os.environ.get("reply_token_ttl", 50))
+REPLY_RETRY = int(os.environ.get("reply_retry", 3))
+REPLY_BACKOFF = float(os.environ.get("reply_backoff", 0.2))
+REPLY_BACKOFF_MAX = float(os.environ.get("reply_backoff_max", 5))
+REPLY_DRAIN = float(os.environ.get("reply_drain", 5))
+
+RETRY_STATUS_LIST = [429, 500, 502, 503, 504]
+REPLY = "reply"
+PUSH = "push"
+
+logger = getLogger(__name__)
+
+queueDepthGauge = metrics.gauge("reply_queue_depth", "佇列中等待送出的回覆數", aggregateSTR="sum")
+queueWaitHistogram = metrics.histogram("reply_queue_wait_seconds", "從放入佇列到開始送出回覆的時間")
+sendHistogram = metrics.histogram("reply_send_seconds", "每次呼叫 LINE reply / push API 的時間", ["method"])
+deliveryHistogram = metrics.histogram("reply_delivery_seconds", "從收到 webhook 到回覆送達的時間", ["method"])
+deliveryCounter = metrics.counter("reply_delivery_total", "回覆的結果", ["result"])
+retryCounter = metrics.counter("reply_retry_total", "LINE reply / push API 重試次數", ["method"])
+fallbackCounter = metrics.counter("reply_fallback_total", "replyToken 不能使用而改用 push 的次數", ["reason"])
+rejectedCounter = metrics.counter("reply_queue_rejected_total", "回覆佇列已滿改為同步送出的次數")
+
+
+def isRetryable(e):
+    if isinstance(e, LineBotApiError):
+        return e.status_code in RETRY_STATUS_LIST
+    # 讀取逾時時 LINE 可能已經收到，不重送
+    return isinstance(e, ConnectionError) and not isinstance(e, ReadTimeout)
+
+def isInvalidToken(e):
+    # replyToken 過期或已經使用過時，LINE 回應 400 "Invalid reply token"
+    return isinstance(e, LineBotApiError) and e.status_code == 400 and "reply token" in str(e).lower()
+
+
+class ReplySender():
+    def __init__(self, lineBotApiFUNC=getLineBotApi, workerINT=REPLY_WORKER, queueSizeINT=REPLY_QUEUE_SIZE, tokenTTLFLOAT=REPLY_TOKEN_TTL,
+                 retryINT=REPLY_RETRY, backoffFLOAT=REPLY_BACKOFF, backoffMaxFLOAT=REPLY_BACKOFF_MAX, drainFLOAT=REPLY_DRAIN):
+        """
+        input
+            lineBotApiFUNC  FUNC    回傳 LineBotApi 的函式 (預設為 line_client.getLineBotApi，每個 worker 共用連線池)
+            workerINT       INT     sender thread 數量
+            queueSizeINT    INT     佇列上限
+        """
+        self.lineBotApiFUNC = lineBotApiFUNC
+        self.workerINT = workerINT
+        self.tokenTTLFLOAT = tokenTTLFLOAT
+        self.retryINT = retryINT
+        self.backoffFLOAT = backoffFLOAT
+        self.backoffMaxFLOAT = backoffMaxFLOAT
+        self.drainFLOAT = drainFLOAT
+        self.replyQueue = Queue(maxsize=queueSizeINT)
+        self.workerLIST = []
+        self.workerPID = None
+        self.lock = Lock()
+
+    def start(self):
+        # gunicorn --preload 時 fork 前建立的 thread 不會被帶到子行程，因此以 pid 判斷是否需要重新啟動
+        if self.workerPID == os.getpid():
+            return
+        with self.lock:
+            if self.workerPID == os.getpid():
+                return
+            firstBOOL = self.workerPID is None
+            self.workerPID = os.getpid()
+            self.workerLIST = []
+            for i in range(self.workerINT):
+                worker = Thread(target=self.work, name="reply-sender-{}".format(i), daemon=True)
+                worker.start()
+                self.workerLIST.append(worker)
+            if firstBOOL:
+                atexit.register(self.drain)
+
+    def send(self, tk, userId, message, receivedTime=None):
+        """
+        將回覆放入佇列，成功回傳 True；tk 為 None 時直接以 push_message 送給 userId
+        佇列已滿時直接在呼叫端同步送出並回傳 False
+        """
+        if receivedTime is None:
+            receivedTime = time.time()
+
+        self.start()
+        # 以呼叫端的 context 送出，line.reply / line.push 的 span 會接在同一個 trace 下
+        delivery = (copy_context(), tk, userId, message, receivedTime, time.time())
+        try:
+            self.replyQueue.put_nowait(delivery)
+            queueDepthGauge.set(self.replyQueue.qsize())
+            return True
+        except Full:
+            rejectedCounter.inc()
+            self.process(delivery)
+            return False
+
+    def getDepth(self):
+        return self.replyQueue.qsize()
+
+    def getBackoff(self, attemptINT):
+        return random.uniform(0, min(self.backoffMaxFLOAT, self.backoffFLOAT * 2 ** (attemptINT - 1)))
+
+    def call(self, method, tk, userId, message):
+        lineBotApi = self.lineBotApiFUNC()
+        startTime = time.time()
+        try:
+            with span("line." + method):
+                if method == REPLY:
+                    lineBotApi.reply_message(tk, message)
+                else:
+                    lineBotApi.push_message(userId, message)
+        finally:
+            sendHistogram.observe(time.time() - startTime, method=method)
+
+    def deliver(self, tk, userId, message, receivedTime):
+        """
+        送出一則回覆 (含重試與改用 push)，回傳實際使用的方式 (reply / push)，失敗時 raise 最後一次的例外
+        """
+        method = REPLY
+        if tk is None:
+            method = PUSH
+        elif userId and time.time() - receivedTime >= self.tokenTTLFLOAT:
+            method = PUSH
+            fallbackCounter.inc(reason="expired")
+
+        attemptINT = 0
+        while True:
+            try:
+                self.call(method, tk, userId, message)
+                return method
+            except Exception as e:
+                if method == REPLY and isInvalidToken(e) and userId:
+                    # replyToken 不能使用，改用 push 重新送出 (不算重試次數)
+                    method = PUSH
+                    fallbackCounter.inc(reason="invalid_token")
+                    continue
+                if attemptINT >= self.retryINT or not isRetryable(e):
+                    raise
+                attemptINT += 1
+                retryCounter.inc(method=method)
+                time.sleep(self.getBackoff(attemptINT))
+                if method == REPLY and userId and time.time() - receivedTime >= self.tokenTTLFLOAT:
+                    method = PUSH
+                    fallbackCounter.inc(reason="expired")
+
+    def process(self, delivery):
+        context, tk, userId, message, receivedTime, queuedTime = delivery
+        try:
+            method = context.run(self.deliver, tk, userId, message, receivedTime)
+        except Exception as e:
+            deliveryCounter.inc(result="failed")
+            logger.error("[ERROR] ReplySender => %s", str(e))
+            return
+        deliveryCounter.inc(result=method)
+        deliveryHistogram.observe(time.time() - receivedTime, method=method)
+
+    def work(self):
+        while True:
+            delivery = self.replyQueue.get()
+            queueDepthGauge.set(self.replyQueue.qsize())
+            queueWaitHistogram.observe(time.time() - delivery[5])
+            self.process(delivery)
+            self.replyQueue.task_done()
+
+    def drain(self, timeoutFLOAT=None):
+        """
+        等待佇列中的回覆送完 (結束前使用)，回傳是否已全部送完
+        """
+        if self.workerPID != os.getpid():
+            return self.replyQueue.unfinished_tasks == 0
+        deadline = time.time() + (self.drainFLOAT if timeoutFLOAT is None else timeoutFLOAT)
+        while self.replyQueue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+        return self.replyQueue.unfinished_tasks == 0
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    測試共用設定
+
+    各模組在 import 時就讀取環境變數，這裡先關閉會寫入 repo 目錄的功能 (sqlite 配額 / 磁碟快取、metrics snapshot、trace 檔)，
+    需要時各測試自行以 tmp_path 建立物件。
+"""
+
+import os
+import sys
+
+os.environ.setdefault("loki_quota", "")
+os.environ.setdefault("loki_disk_cache", "")
+os.environ.setdefault("metrics_dir", "")
+os.environ.setdefault("trace_file", "")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
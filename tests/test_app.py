@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import app
+
+
+def getEvent(tk, message=None, typeSTR="message"):
+    event = {"type": typeSTR, "replyToken": tk, "source": {"type": "user", "userId": "U" + tk}}
+    if message is not None:
+        event["message"] = message
+    return event
+
+# 同一個 webhook 內混合文字 (含重複的句子)、打招呼、貼圖、圖片與 follow event
+EVENT_LIST = [
+    getEvent("tk0", {"type": "text", "text": "如何開卡"}),
+    getEvent("tk1", {"type": "sticker"}),
+    getEvent("tk2", {"type": "text", "text": "hi"}),
+    getEvent("tk3", typeSTR="follow"),
+    getEvent("tk4", {"type": "text", "text": "如何開卡"}),
+    getEvent("tk5", {"type": "text", "text": "信用卡遺失怎麼辦"}),
+    getEvent("tk6", {"type": "image"}),
+]
+
+def setup(monkeypatch, batchFUNC):
+    sentLIST = []
+    callLIST = []
+    monkeypatch.setattr(app.replySender, "send", lambda tk, userId, message, receivedTime: sentLIST.append((tk, message)))
+
+    def execLokiBatch(contentLIST, **kwargs):
+        callLIST.append(list(contentLIST))
+        return batchFUNC(contentLIST)
+    monkeypatch.setattr(app, "execLokiBatch", execLokiBatch)
+    return sentLIST, callLIST
+
+def getText(message):
+    if type(message) == list:
+        return [m.text for m in message]
+    return [message.text]
+
+def test_multiEvent(monkeypatch):
+    sentLIST, callLIST = setup(monkeypatch, lambda contentLIST: [{"response": ["A:" + c]} for c in contentLIST])
+    app.processMessage({"events": EVENT_LIST}, 0)
+
+    # 需要 Loki 的句子 (含重複的) 合併成一次呼叫
+    assert callLIST == [["如何開卡", "如何開卡", "信用卡遺失怎麼辦"]]
+    # 每個訊息 event 各回覆一次，且依 event 的順序 (follow 不回覆)
+    assert [tk for tk, message in sentLIST] == ["tk0", "tk1", "tk2", "tk4", "tk5", "tk6"]
+    replyDICT = {tk: getText(message) for tk, message in sentLIST}
+    assert replyDICT["tk0"][0] == "A:如何開卡"
+    assert replyDICT["tk4"][0] == "A:如何開卡"
+    assert replyDICT["tk5"][0] == "A:信用卡遺失怎麼辦"
+    assert replyDICT["tk1"][0].startswith("不是文字")
+    assert replyDICT["tk6"][0].startswith("不是文字")
+    assert replyDICT["tk2"][0].startswith("hi!")
+
+def test_batchError(monkeypatch):
+    def fail(contentLIST):
+        raise Exception("loki down")
+    sentLIST, callLIST = setup(monkeypatch, fail)
+    app.processMessage({"events": EVENT_LIST}, 0)
+
+    # execLokiBatch 失敗時 Loki 的句子回覆錯誤訊息，其他 event 照常回覆，順序不變
+    assert [tk for tk, message in sentLIST] == ["tk0", "tk1", "tk2", "tk4", "tk5", "tk6"]
+    replyDICT = {tk: getText(message) for tk, message in sentLIST}
+    for tk in ["tk0", "tk4", "tk5"]:
+        assert replyDICT[tk][0].startswith("抱歉發生一些問題")
+    assert replyDICT["tk2"][0].startswith("hi!")
+
+def test_badEvent(monkeypatch):
+    sentLIST, callLIST = setup(monkeypatch, lambda contentLIST: [{"response": ["A:" + c]} for c in contentLIST])
+    # 缺少 message 的 event 回覆錯誤訊息，不影響後面的 event
+    app.processMessage({"events": [getEvent("tkX"), EVENT_LIST[0]]}, 0)
+    assert [tk for tk, message in sentLIST] == ["tkX", "tk0"]
+    assert getText(sentLIST[0][1])[0].startswith("抱歉發生一些問題")
+    assert getText(sentLIST[1][1])[0] == "A:如何開卡"
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from threading import Event
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+import bot_logging
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ListHandler(logging.Handler):
+    # 記錄寫出的紀錄，blockEvent 設定時每筆都等到 blockEvent.set() 才寫出 (模擬卡住的 stderr)
+    def __init__(self, blockEvent=None):
+        super().__init__()
+        self.blockEvent = blockEvent
+        self.recordLIST = []
+
+    def emit(self, record):
+        if self.blockEvent is not None:
+            self.blockEvent.wait(5)
+        self.recordLIST.append(record)
+
+def getLogger(nameSTR, handler):
+    logger = logging.getLogger(nameSTR)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+    return logger
+
+def test_nonBlocking():
+    # 寫出卡住時呼叫端不會等待，佇列已滿的紀錄直接丟棄並計數
+    blockEvent = Event()
+    outputHandler = ListHandler(blockEvent)
+    handler = bot_logging.NonBlockingQueueHandler(5, outputHandler)
+    logger = getLogger("test.bot_logging.block", handler)
+    droppedFLOAT = bot_logging.recordCounter.getValue(result="dropped")
+
+    startTime = time.time()
+    for i in range(200):
+        logger.warning("line %d", i)
+    assert time.time() - startTime < 0.5
+    assert bot_logging.recordCounter.getValue(result="dropped") - droppedFLOAT >= 200 - 6
+
+    blockEvent.set()
+    handler.stop()
+    assert 5 <= len(outputHandler.recordLIST) <= 6
+    assert outputHandler.recordLIST[0].msg == "line 0"
+
+def test_stopTimeout(monkeypatch):
+    # 輸出一直卡住時 stop() 最多等 LOG_STOP_TIMEOUT 秒，不會丟出例外或卡住結束
+    monkeypatch.setattr(bot_logging, "LOG_STOP_TIMEOUT", 0.1)
+    blockEvent = Event()
+    handler = bot_logging.NonBlockingQueueHandler(2, ListHandler(blockEvent))
+    logger = getLogger("test.bot_logging.timeout", handler)
+    for i in range(10):
+        logger.warning("line %d", i)
+    startTime = time.time()
+    handler.stop()
+    assert time.time() - startTime < 1
+    blockEvent.set()
+
+def test_stopFlush():
+    # stop() 寫出佇列中剩下的紀錄
+    outputHandler = ListHandler()
+    handler = bot_logging.NonBlockingQueueHandler(1000, outputHandler)
+    logger = getLogger("test.bot_logging.flush", handler)
+    for i in range(300):
+        logger.info("line %d", i)
+    handler.stop()
+    assert [record.msg for record in outputHandler.recordLIST] == ["line {}".format(i) for i in range(300)]
+    assert handler.listenerPID is None
+
+def test_flushAtExit():
+    # 行程結束時 (atexit) 佇列中的紀錄都會寫出
+    codeSTR = "\n".join([
+        "from bot_logging import getLogger",
+        "logger = getLogger('test.exit')",
+        "for i in range(500):",
+        "    logger.warning('line %d', i, extra={'event': i})",
+    ])
+    envDICT = dict(os.environ, log_format="json", log_level="WARNING")
+    process = subprocess.run([sys.executable, "-c", codeSTR], cwd=BASE_PATH, env=envDICT, capture_output=True, text=True, timeout=30)
+    assert process.returncode == 0
+    logLIST = [json.loads(lineSTR) for lineSTR in process.stderr.splitlines()]
+    assert [logDICT["msg"] for logDICT in logLIST] == ["line {}".format(i) for i in range(500)]
+    assert logLIST[-1]["event"] == 499
+    assert logLIST[0]["logger"] == "test.exit"
+    assert logLIST[0]["level"] == "WARNING"
+
+def test_exitFullQueue():
+    # 結束時佇列已滿也不會出錯，佇列中的紀錄照樣寫出
+    codeSTR = "\n".join([
+        "from bot_logging import getLogger",
+        "logger = getLogger('test.exit')",
+        "for i in range(5000):",
+        "    logger.warning('line %d', i)",
+    ])
+    envDICT = dict(os.environ, log_format="text", log_level="WARNING", log_queue_size="10")
+    process = subprocess.run([sys.executable, "-c", codeSTR], cwd=BASE_PATH, env=envDICT, capture_output=True, text=True, timeout=30)
+    assert process.returncode == 0
+    assert "Traceback" not in process.stderr
+    assert 10 <= len(process.stderr.splitlines()) <= 5000
+
+def test_prepare():
+    # 呼叫端只合併 msg 與 args、exception 轉成文字，JSON 格式化在背景 thread 進行
+    outputHandler = ListHandler()
+    handler = bot_logging.NonBlockingQueueHandler(10, outputHandler)
+    logger = getLogger("test.bot_logging.prepare", handler)
+    try:
+        raise ValueError("bad input")
+    except ValueError:
+        logger.exception("[ERROR] %s => %s", "execLokiBatch", "bad input", extra={"event": 3})
+    handler.stop()
+
+    record = outputHandler.recordLIST[0]
+    assert record.msg == "[ERROR] execLokiBatch => bad input"
+    assert record.args is None and record.exc_info is None
+    logDICT = json.loads(bot_logging.JsonFormatter().format(record))
+    assert logDICT["msg"] == "[ERROR] execLokiBatch => bad input"
+    assert logDICT["event"] == 3
+    assert "ValueError: bad input" in logDICT["exc"]
+
+def test_sample():
+    # WARNING 以下的紀錄依比例取樣，WARNING 以上一律保留
+    sampleFilter = bot_logging.SampleFilter(0)
+    assert not sampleFilter.filter(logging.LogRecord("t", logging.DEBUG, "", 0, "m", None, None))
+    assert not sampleFilter.filter(logging.LogRecord("t", logging.INFO, "", 0, "m", None, None))
+    assert sampleFilter.filter(logging.LogRecord("t", logging.WARNING, "", 0, "m", None, None))
+    assert bot_logging.SampleFilter(1.0).filter(logging.LogRecord("t", logging.DEBUG, "", 0, "m", None, None))
+
+def test_parseLevels():
+    assert bot_logging.parseLevels("intent=debug, esun_qa=INFO,bad") == {"intent": "DEBUG", "esun_qa": "INFO"}
+    assert bot_logging.parseLevels("") == {}
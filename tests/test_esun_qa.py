@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from copy import deepcopy
+from threading import Event, Lock, Thread
+import asyncio
+import time
+
+import pytest
+
+import esun_qa
+from loki_cache import LokiCache
+from loki_disk_cache import LokiDiskCache
+from loki_negative_cache import NegativeCache, NO_MATCH_MSG
+from loki_singleflight import SingleFlight
+import tracing
+
+VERSION = "test-version"
+ERROR_MSG = "500 Connection failed."
+
+
+def getLokiResult(inputLIST):
+    """
+    模擬 BulkAPI 的 response
+    * 包含「錯誤」這一句的批次整批失敗
+    * 「閒聊」開頭的句子比對不到意圖
+    * 其他句子比對到 credit_card 意圖，utterance 就是句子本身 (例如「如何開卡」)
+    """
+    if "錯誤" in inputLIST:
+        return {"status": False, "msg": ERROR_MSG}
+    resultLIST = []
+    for inputSTR in inputLIST:
+        if inputSTR.startswith("閒聊"):
+            resultLIST.append({"status": False, "msg": NO_MATCH_MSG})
+        else:
+            resultLIST.append({"status": True, "msg": "Success!", "results": [
+                {"intent": "credit_card", "pattern": "", "utterance": inputSTR, "argument": [inputSTR]}]})
+    return {"status": True, "msg": "Success!", "version": VERSION, "result_list": resultLIST}
+
+@pytest.fixture
+def loki(monkeypatch):
+    """
+    以 stub 取代 callLoki (經由 lokiHedger)，回傳每次呼叫的 inputLIST
+    各層快取與 executor 換成新的物件，本機比對 (faq_index / local_matcher) 預設不命中
+    """
+    callLIST = []
+
+    def callLoki(inputLIST, filterLIST):
+        callLIST.append(list(inputLIST))
+        return getLokiResult(inputLIST)
+    monkeypatch.setattr(esun_qa.lokiHedger, "callFUNC", callLoki)
+    monkeypatch.setattr(esun_qa, "lokiCache", LokiCache())
+    monkeypatch.setattr(esun_qa, "lokiNegativeCache", NegativeCache())
+    monkeypatch.setattr(esun_qa, "lokiFlight", SingleFlight(timeoutFLOAT=2))
+    monkeypatch.setattr(esun_qa.faq_index, "match", lambda inputSTR, filterLIST: None)
+    monkeypatch.setattr(esun_qa.local_matcher, "match", lambda inputSTR, filterLIST: None)
+    monkeypatch.setattr(esun_qa, "executorDICT", {})
+    yield callLIST
+    # 提前停止後仍在執行的批次要在還原 callLoki 之前結束
+    for executor in esun_qa.executorDICT.values():
+        executor.shutdown(wait=True)
+
+def getResponseLIST(utteranceSTR):
+    return esun_qa.lokiIntentDICT["credit_card"].responseDICT[utteranceSTR]
+
+def test_batchDuplicate(loki):
+    resultLIST = esun_qa.execLokiBatch(["如何開卡", "如何開卡", "閒聊早餐吃什麼", "如何開卡"])
+    # 每則訊息各一個 resultDICT，重複的句子只送一次 Loki
+    assert len(resultLIST) == 4
+    assert loki == [["如何開卡", "閒聊早餐吃什麼"]]
+    for i in [0, 1, 3]:
+        assert len(resultLIST[i]["response"]) == 1
+    assert resultLIST[2] == {}
+    # 意圖模組各自處理一份結果，不會互相影響
+    assert resultLIST[0]["response"] is not resultLIST[1]["response"]
+
+def test_cacheHitMiss(loki):
+    resultDICT = esun_qa.execLoki(["如何開卡", "閒聊早餐吃什麼"])
+    assert loki == [["如何開卡", "閒聊早餐吃什麼"]]
+    assert resultDICT["response"][0] in getResponseLIST("如何開卡")
+    assert esun_qa.lokiCache.getStats()["miss"] == 2
+
+    # 快取命中與比對不到的句子都不再送出，只有新的句子呼叫 Loki，結果依輸入順序合併
+    resultDICT = esun_qa.execLoki(["為什麼已經刷退卻還沒收到退款", "如何開卡", "閒聊早餐吃什麼"])
+    assert loki[1:] == [["為什麼已經刷退卻還沒收到退款"]]
+    assert len(resultDICT["response"]) == 2
+    assert resultDICT["response"][0] in getResponseLIST("為什麼已經刷退卻還沒收到退款")
+    assert resultDICT["response"][1] in getResponseLIST("如何開卡")
+    assert esun_qa.lokiCache.getStats()["hit"] == 1
+
+def test_cacheVersion(loki):
+    esun_qa.execLoki(["如何開卡"])
+    # Loki 模型更新 (version 改變) 後舊的結果不再使用
+    esun_qa.lokiCache.set("如何停用信用卡", [], "new-version", {"status": True, "msg": "Success!", "results": []})
+    esun_qa.execLoki(["如何開卡"])
+    assert loki == [["如何開卡"], ["如何開卡"]]
+
+def test_lookupTiers(loki, monkeypatch, tmp_path):
+    # 每一層各自能回答一句，同時出現在多層的句子以前面的層為準
+    def getResult(tierSTR):
+        return {"status": True, "msg": "Success!", "results": [], "tier": tierSTR}
+    faqDICT = {"q1": getResult("faq"), "q2": getResult("faq")}
+    matcherDICT = {"q4": getResult("matcher"), "q5": getResult("matcher")}
+    monkeypatch.setattr(esun_qa.faq_index, "match", lambda inputSTR, filterLIST: faqDICT.get(inputSTR))
+    monkeypatch.setattr(esun_qa.local_matcher, "match", lambda inputSTR, filterLIST: matcherDICT.get(inputSTR))
+    diskCache = LokiDiskCache(pathSTR=str(tmp_path / "cache.sqlite3"), flushFLOAT=60)
+    monkeypatch.setattr(esun_qa, "lokiDiskCache", diskCache)
+
+    esun_qa.lokiCache.set("q2", [], VERSION, getResult("memory"))
+    esun_qa.lokiCache.set("q3", [], VERSION, getResult("memory"))
+    diskCache.set("q3", [], VERSION, getResult("disk"))
+    diskCache.set("q4", [], VERSION, getResult("disk"))
+    diskCache.flush()
+    esun_qa.lokiNegativeCache.set("q5", [], VERSION)
+    esun_qa.lokiNegativeCache.set("閒聊q6", [], VERSION)
+
+    inputLIST = ["q1", "q2", "q3", "q4", "q5", "閒聊q6", "q7"]
+    resultLIST = esun_qa.lookupLocal(inputLIST, [])
+    assert [r["tier"] if r and "tier" in r else r for r in resultLIST] == [
+        "faq", "faq", "memory", "disk", "matcher", {"status": False, "msg": NO_MATCH_MSG}, None]
+    # 磁碟快取命中的句子放回記憶體快取
+    assert esun_qa.lokiCache.get("q4", [])["tier"] == "disk"
+
+    # 只有本機都沒有結果的句子送到 Loki，結果依輸入順序合併
+    result = esun_qa.requestLoki(inputLIST, [])
+    assert loki == [["q7"]]
+    assert result["status"]
+    assert [r.get("tier") for r in result["result_list"]] == ["faq", "faq", "memory", "disk", "matcher", None, None]
+    assert result["result_list"][6]["results"][0]["utterance"] == "q7"
+
+def test_localOnly(loki):
+    # 全部在本機取得結果時不呼叫 Loki
+    esun_qa.execLoki(["如何開卡", "閒聊早餐吃什麼"])
+    result = esun_qa.requestLoki(["閒聊早餐吃什麼", "如何開卡"], [])
+    assert len(loki) == 1
+    assert result["status"]
+    assert result["result_list"][0] == {"status": False, "msg": NO_MATCH_MSG}
+    assert result["result_list"][1]["results"][0]["utterance"] == "如何開卡"
+
+@pytest.mark.parametrize("raiseBOOL", [False, True])
+def test_flightError(loki, monkeypatch, raiseBOOL):
+    # leader 呼叫 Loki 失敗 (回傳錯誤或丟出例外) 時，等待相同句子的 follower 也要立刻收到錯誤
+    releaseEvent = Event()
+
+    def callLoki(inputLIST, filterLIST):
+        loki.append(list(inputLIST))
+        releaseEvent.wait(2)
+        if raiseBOOL:
+            raise Exception(ERROR_MSG)
+        return {"status": False, "msg": ERROR_MSG}
+    monkeypatch.setattr(esun_qa.lokiHedger, "callFUNC", callLoki)
+
+    resultDICT = {}
+    leader = Thread(target=lambda: resultDICT.update(leader=esun_qa.requestLoki(["如何開卡"], [])), daemon=True)
+    leader.start()
+    while not loki:
+        time.sleep(0.01)
+    follower = Thread(target=lambda: resultDICT.update(follower=esun_qa.requestLoki(["如何開卡"], [])), daemon=True)
+    follower.start()
+    time.sleep(0.1)
+    releaseEvent.set()
+    startTime = time.time()
+    leader.join(2)
+    follower.join(2)
+
+    assert time.time() - startTime < 1
+    assert loki == [["如何開卡"]]
+    assert resultDICT["leader"] == {"status": False, "msg": ERROR_MSG}
+    assert resultDICT["follower"] == {"status": False, "msg": ERROR_MSG}
+    assert esun_qa.lokiFlight.getSize() == 0
+
+def setConcurrency(monkeypatch, concurrencyINT):
+    # getExecutor() 依 LOKI_CONCURRENCY 建立新的 executor
+    monkeypatch.setattr(esun_qa, "LOKI_CONCURRENCY", concurrencyINT)
+    monkeypatch.setattr(esun_qa, "executorDICT", {})
+
+def getSlowLoki(loki, monkeypatch, delayFUNC):
+    # callLoki 的 stub，每次呼叫等待 delayFUNC(inputLIST) 秒，並記錄同時在途的最大呼叫數
+    stateDICT = {"inflight": 0, "max": 0}
+    lock = Lock()
+
+    def callLoki(inputLIST, filterLIST):
+        with lock:
+            loki.append(list(inputLIST))
+            stateDICT["inflight"] += 1
+            stateDICT["max"] = max(stateDICT["max"], stateDICT["inflight"])
+        time.sleep(delayFUNC(inputLIST))
+        with lock:
+            stateDICT["inflight"] -= 1
+        return getLokiResult(inputLIST)
+    monkeypatch.setattr(esun_qa.lokiHedger, "callFUNC", callLoki)
+    return stateDICT
+
+@pytest.mark.parametrize("concurrencyINT", [1, 2, 4])
+def test_iterOrder(loki, monkeypatch, concurrencyINT):
+    setConcurrency(monkeypatch, concurrencyINT)
+    inputLIST = ["s{}".format(i) for i in range(90)]
+    # 前面的批次比較慢，完成的順序與送出的順序相反
+    stateDICT = getSlowLoki(loki, monkeypatch, lambda chunk: 0.05 * (5 - int(chunk[0][1:]) // esun_qa.INPUT_LIMIT) / 5)
+
+    chunkLIST = []
+    for chunk, lokiRst in esun_qa.iterLokiResult(inputLIST, []):
+        assert lokiRst.getStatus()
+        assert [lokiRst.getUtterance(i, 0) for i in range(len(chunk))] == chunk
+        chunkLIST.append(chunk)
+
+    # 依原本的順序逐批回傳，每批最多 INPUT_LIMIT 句，同時在途的批次不超過 LOKI_CONCURRENCY
+    assert chunkLIST == [inputLIST[i:i+esun_qa.INPUT_LIMIT] for i in range(0, 90, esun_qa.INPUT_LIMIT)]
+    assert sorted(loki) == sorted(chunkLIST)
+    assert stateDICT["max"] == min(concurrencyINT, len(chunkLIST))
+
+def test_iterEarlyStop(loki, monkeypatch):
+    setConcurrency(monkeypatch, 2)
+    inputLIST = ["s{}".format(i) for i in range(100)]
+    inputLIST[0] = "如何開卡"
+    inputLIST[25] = "錯誤"
+    getSlowLoki(loki, monkeypatch, lambda chunk: 0.02)
+
+    # 第二批失敗：execLoki 保留第一批的結果並帶上 msg，之後的批次不再送出
+    resultDICT = esun_qa.execLoki(inputLIST)
+    assert resultDICT["msg"] == ERROR_MSG
+    assert len(resultDICT["response"]) == 1
+    time.sleep(0.1)
+    # 取走第一批時才送出第三批，第四、五批不會送出
+    sentLIST = [chunk[0] for chunk in loki]
+    assert "如何開卡" in sentLIST and "s20" in sentLIST
+    assert "s60" not in sentLIST and "s80" not in sentLIST
+    assert len(loki) <= 3
+
+def test_iterTrace(loki, monkeypatch):
+    # 在 executor 中執行的 LokiResult，span 要接在呼叫端的 span 下
+    setConcurrency(monkeypatch, 2)
+    inputLIST = ["s{}".format(i) for i in range(50)]
+    with tracing.span("test.iter.caller") as callerSpan:
+        for chunk, lokiRst in esun_qa.iterLokiResult(inputLIST, []):
+            pass
+
+    callerDICT = [s for s in tracing.getRecentSpanLIST(0) if s["span"] == callerSpan.spanID][0]
+    spanLIST = [s for s in tracing.getRecentSpanLIST(0) if s["name"] == "LokiResult" and s["trace"] == callerDICT["trace"]]
+    assert len(spanLIST) == 3
+    for spanDICT in spanLIST:
+        assert spanDICT["parent"] == callerSpan.spanID
+
+class FakeIntent():
+    # 結果固定的意圖模組 (實際的意圖模組以 random.sample 挑選回覆)
+    def getResult(self, inputSTR, utterance, args, resultDICT, refDICT, pattern=""):
+        resultDICT["response"] = "R:" + inputSTR
+        if "圖" in inputSTR:
+            resultDICT["imgURL"] = ["{}-1.png".format(inputSTR), "{}-2.png".format(inputSTR)]
+        return resultDICT
+
+def baselineRunLoki(inputLIST, refDICT):
+    # 原本 (每批 deepcopy refDICT) 的 runLoki() 合併方式
+    resultDICT = deepcopy(refDICT)
+    lokiRst = esun_qa.LokiResult(inputLIST, [], getLokiResult(inputLIST))
+    if lokiRst.getStatus():
+        for index, key in enumerate(inputLIST):
+            lokiResultDICT = {k: [] for k in refDICT}
+            for resultIndex in range(0, lokiRst.getLokiLen(index)):
+                if lokiRst.getIntent(index, resultIndex) in esun_qa.lokiIntentDICT:
+                    lokiResultDICT = esun_qa.lokiIntentDICT[lokiRst.getIntent(index, resultIndex)].getResult(
+                        key, lokiRst.getUtterance(index, resultIndex), lokiRst.getArgs(index, resultIndex),
+                        lokiResultDICT, refDICT, pattern=lokiRst.getPattern(index, resultIndex))
+            for k in lokiResultDICT:
+                if k not in resultDICT:
+                    resultDICT[k] = []
+                if type(resultDICT[k]) != list:
+                    resultDICT[k] = [resultDICT[k]] if resultDICT[k] else []
+                if type(lokiResultDICT[k]) == list:
+                    resultDICT[k].extend(lokiResultDICT[k])
+                else:
+                    resultDICT[k].append(lokiResultDICT[k])
+    else:
+        resultDICT["msg"] = lokiRst.getMessage()
+    return resultDICT
+
+def baselineExecLoki(inputLIST, refDICT):
+    resultDICT = deepcopy(refDICT)
+    for i in range(0, len(inputLIST), esun_qa.INPUT_LIMIT):
+        resultDICT = baselineRunLoki(inputLIST[i:i+esun_qa.INPUT_LIMIT], resultDICT)
+        if "msg" in resultDICT:
+            break
+    return resultDICT
+
+def getMergeInputLIST(sizeINT, errorINT=None):
+    inputLIST = []
+    for i in range(sizeINT):
+        if i % 7 == 3:
+            inputLIST.append("閒聊{}".format(i))
+        elif i % 5 == 1:
+            inputLIST.append("圖{}".format(i))
+        else:
+            inputLIST.append("句{}".format(i))
+    if errorINT is not None:
+        inputLIST[errorINT] = "錯誤"
+    return inputLIST
+
+REF_LIST = [
+    {},
+    {"response": [], "imgURL": []},
+    {"response": ["前一則"], "imgURL": "first.png", "user": "U1", "empty": ""},
+]
+
+@pytest.mark.parametrize("refDICT", REF_LIST)
+@pytest.mark.parametrize("sizeINT, errorINT", [(1, None), (20, None), (65, None), (65, 30), (65, 0)])
+def test_mergeBaseline(loki, monkeypatch, refDICT, sizeINT, errorINT):
+    # ResultMerger 的合併結果與原本逐批 deepcopy 的方式相同，且不會改到呼叫端的 refDICT
+    monkeypatch.setattr(esun_qa, "lokiIntentDICT", {"credit_card": FakeIntent()})
+    inputLIST = getMergeInputLIST(sizeINT, errorINT)
+    refCopyDICT = deepcopy(refDICT)
+
+    assert esun_qa.execLoki(inputLIST, refDICT=refDICT) == baselineExecLoki(inputLIST, refDICT)
+    assert esun_qa.runLoki(inputLIST[:20], refDICT=refDICT) == baselineRunLoki(inputLIST[:20], refDICT)
+    assert refDICT == refCopyDICT
+
+def test_mergeBatch(loki, monkeypatch):
+    # execLokiBatch() 每則訊息的結果與個別呼叫 execLoki() 相同
+    monkeypatch.setattr(esun_qa, "lokiIntentDICT", {"credit_card": FakeIntent()})
+    refDICT = REF_LIST[2]
+    contentLIST = ["句1。圖2。閒聊3", "句4", "閒聊5", "圖6。圖7"] * 6
+    splitLIST = ["。"]
+    resultLIST = esun_qa.execLokiBatch(contentLIST, splitLIST=splitLIST, refDICT=refDICT)
+    assert resultLIST == [baselineExecLoki(content.split("。"), refDICT) for content in contentLIST]
+    assert resultLIST[0]["response"] == ["前一則", "R:句1", "R:圖2"]
+    assert resultLIST[0]["imgURL"] == ["first.png", "圖2-1.png", "圖2-2.png"]
+    assert refDICT == {"response": ["前一則"], "imgURL": "first.png", "user": "U1", "empty": ""}
+
+def resetCache(monkeypatch):
+    monkeypatch.setattr(esun_qa, "lokiCache", LokiCache())
+    monkeypatch.setattr(esun_qa, "lokiNegativeCache", NegativeCache())
+
+def getTestInputLIST():
+    # testIntent() 使用的測試句
+    return [inputSTR for inputLIST in esun_qa.TEST_INPUT_DICT.values() for inputSTR in inputLIST]
+
+@pytest.mark.parametrize("refDICT", REF_LIST)
+@pytest.mark.parametrize("inputLIST", [
+    getMergeInputLIST(1), getMergeInputLIST(65), getMergeInputLIST(65, 30), getMergeInputLIST(65, 0), getTestInputLIST()])
+def test_asyncEquivalence(loki, monkeypatch, refDICT, inputLIST):
+    # execLoki_async() / runLoki_async() 與同步版本的結果相同，送到 Loki 的句子也相同
+    monkeypatch.setattr(esun_qa, "lokiIntentDICT", {"credit_card": FakeIntent()})
+    asyncCallLIST = []
+
+    async def callLoki_async(inputLIST, filterLIST):
+        asyncCallLIST.append(list(inputLIST))
+        await asyncio.sleep(0)
+        return getLokiResult(inputLIST)
+    monkeypatch.setattr(esun_qa, "callLoki_async", callLoki_async)
+
+    resultDICT = esun_qa.execLoki(inputLIST, refDICT=refDICT)
+    runDICT = esun_qa.runLoki(inputLIST[:20], refDICT=refDICT)
+    resetCache(monkeypatch)
+    assert asyncio.run(esun_qa.execLoki_async(inputLIST, refDICT=refDICT)) == resultDICT
+    assert asyncio.run(esun_qa.runLoki_async(inputLIST[:20], refDICT=refDICT)) == runDICT
+    if "錯誤" in inputLIST:
+        # 失敗的批次之後，未完成的批次可能已經送出 (同步版本也一樣)，只比較失敗前的批次
+        errorINT = inputLIST.index("錯誤") // esun_qa.INPUT_LIMIT
+        assert sorted(loki)[:errorINT] == sorted(asyncCallLIST)[:errorINT]
+    else:
+        assert sorted(loki) == sorted(asyncCallLIST)
+
+def test_asyncSplit(loki, monkeypatch):
+    # 分句與 INPUT_LIMIT 分批的方式相同
+    monkeypatch.setattr(esun_qa, "lokiIntentDICT", {"credit_card": FakeIntent()})
+
+    async def callLoki_async(inputLIST, filterLIST):
+        return getLokiResult(inputLIST)
+    monkeypatch.setattr(esun_qa, "callLoki_async", callLoki_async)
+
+    contentSTR = "。".join(getMergeInputLIST(45))
+    resultDICT = esun_qa.execLoki(contentSTR, splitLIST=["。"])
+    resetCache(monkeypatch)
+    assert asyncio.run(esun_qa.execLoki_async(contentSTR, splitLIST=["。"])) == resultDICT
+    assert len(resultDICT["response"]) == len([s for s in getMergeInputLIST(45) if not s.startswith("閒聊")])
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import json
+
+from faq_index import FaqIndex, FAQ_INTENT
+
+CHATBOT_DICT = {
+    "credit_card": {"document": [
+        {"title": "開卡", "content": {"Q": "如何開卡？", "A": "請致電客服中心\u000b開卡"}},
+        {"title": "沒有答案", "content": {"Q": "沒有答案的問題", "A": ""}},
+    ]},
+    "app": {"document": [
+        {"title": "開通簡訊密碼", "content": {"Q": "如何開通簡訊密碼", "A": "App 中開通"}},
+    ]},
+    "web_bank": {"document": [
+        {"title": "開通簡訊密碼", "content": {"Q": "如何開通簡訊密碼", "A": "網路銀行中開通"}},
+    ]},
+}
+
+
+def getIndex(tmp_path):
+    chatbotPath = tmp_path / "chatbot.json"
+    chatbotPath.write_text(json.dumps(CHATBOT_DICT, ensure_ascii=False), encoding="utf-8")
+    return FaqIndex(chatbotPath=str(chatbotPath))
+
+def test_match(tmp_path):
+    faqIndex = getIndex(tmp_path)
+    resultDICT = faqIndex.match(" 如何開卡 ")
+    assert resultDICT["results"] == [{"intent": FAQ_INTENT, "pattern": "", "utterance": "如何開卡？", "argument": ["credit_card"]}]
+    # 以 title 比對
+    assert faqIndex.match("開卡")["results"][0]["argument"] == ["credit_card"]
+    assert faqIndex.getAnswer("credit_card", "如何開卡？") == "請致電客服中心開卡"
+
+    assert faqIndex.match("如何開卡呢") is None
+    assert faqIndex.match("沒有答案的問題") is None
+    assert faqIndex.getStats()["hit"] == 2
+
+def test_filter(tmp_path):
+    faqIndex = getIndex(tmp_path)
+    assert faqIndex.match("如何開卡", ["app"]) is None
+    assert faqIndex.match("如何開通簡訊密碼", ["web_bank"])["results"][0]["argument"] == ["web_bank"]
+    # 多個意圖都有同一個問題時只回覆第一個
+    assert len(faqIndex.match("如何開通簡訊密碼")["results"]) == 1
+
+def test_missingFile(tmp_path):
+    faqIndex = FaqIndex(chatbotPath=str(tmp_path / "missing.json"))
+    assert faqIndex.match("如何開卡") is None
+    assert faqIndex.getStats()["size"] == 0
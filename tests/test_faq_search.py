@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import pytest
+
+import faq_search
+from faq_search import FaqSearch, FAQ_SEARCH_THRESHOLD
+
+# 問句改寫：(查詢句, 正確答案的 Q 必須包含的字)
+QUESTION_LIST = [
+    ("怎麼申請信用卡", "申請信用卡"), ("請問如何開卡", "開卡"), ("怎麼查詢信用卡帳單", "帳單"), ("我要申請數位帳戶", "申請數位帳戶"),
+    ("數位帳戶有存摺嗎", "存摺"), ("如何申請網路銀行呢", "網路銀行"), ("忘記使用者名稱怎麼辦", "使用者名稱"), ("如何使用無卡提款", "無卡提款"),
+    ("信用卡額度可以調整嗎", "額度"), ("要如何停用信用卡", "停用"), ("紅利點數怎麼用", "紅利"), ("如何補寄電子帳單?", "電子帳單"),
+    ("網路投保可以取消嗎?", "取消"), ("如何申請理賠呢", "理賠"), ("如何設定簡易密碼呢", "簡易密碼"), ("怎麼使用手機號碼轉帳", "手機號碼"),
+    ("個人信貸撥款要多久", "撥款"), ("如何查詢信用卡繳款紀錄", "繳款紀錄"), ("如何變更圖形密碼", "圖形密碼"), ("申請個人信貸需要什麼文件", "文件"),
+]
+# 非問句、領域外，或只有「信用卡」等常見詞相符的句子 (回覆錯誤的答案比預設回覆更糟)
+NON_QUESTION_LIST = [
+    "我想要辦信用卡", "我的信用卡掉了", "今天天氣很好", "你們的客服電話幾號", "外幣匯款手續費多少", "帳戶被凍結了", "我想要辦房貸",
+    "請問要怎麼開卡", "你好", "謝謝你", "信用卡不見了怎麼辦", "我想買基金", "分行幾點關門", "我要轉帳給朋友", "股票怎麼買",
+    "我要投訴", "可以幫我查餘額嗎", "忘記網路銀行密碼", "車貸利率多少",
+]
+
+
+@pytest.fixture(scope="module")
+def faqSearch():
+    return FaqSearch(indexPath="")
+
+def test_hit(faqSearch):
+    resultLIST = faqSearch.search("信用卡遺失怎麼辦")
+    assert [(r["intent"], r["Q"]) for r in resultLIST] == [("credit_card", "信用卡遺失怎麼辦")]
+    assert 0 < resultLIST[0]["score"] <= 1
+
+def test_nearMiss(faqSearch):
+    # 與「信用卡遺失怎麼辦」只有「信用卡」相符，原始 BM25 分數很高 (長句)，正規化後低於門檻
+    assert faqSearch.search("我想要辦信用卡") == []
+    assert faqSearch.search("我想要辦信用卡", threshold=0)[0]["score"] < FAQ_SEARCH_THRESHOLD
+
+def test_threshold(faqSearch):
+    correctINT = 0
+    for inputSTR, keySTR in QUESTION_LIST:
+        resultLIST = faqSearch.search(inputSTR)
+        if resultLIST and keySTR in resultLIST[0]["Q"]:
+            correctINT += 1
+    assert correctINT >= len(QUESTION_LIST) * 0.9
+
+    for inputSTR in NON_QUESTION_LIST:
+        assert faqSearch.search(inputSTR) == [], inputSTR
+
+def test_lengthIndependent(faqSearch):
+    # 加上與問題無關的字不會讓分數變高
+    scoreFLOAT = faqSearch.search("如何申請信用卡", threshold=0)[0]["score"]
+    assert faqSearch.search("你好我想問一下如何申請信用卡", threshold=0)[0]["score"] < scoreFLOAT
+
+def test_filter(faqSearch):
+    assert faqSearch.search("如何申請信用卡", filterLIST=["app"]) == []
+    assert faqSearch.search("如何申請信用卡", filterLIST=["credit_card"])[0]["intent"] == "credit_card"
+
+def test_purePython(faqSearch, monkeypatch):
+    # 沒有 numpy 時結果相同
+    monkeypatch.setattr(faq_search, "np", None)
+    pureSearch = FaqSearch(indexPath="")
+    for inputSTR, keySTR in QUESTION_LIST[:5]:
+        assert pureSearch.search(inputSTR, topK=3) == faqSearch.search(inputSTR, topK=3)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import base64
+import hashlib
+import hmac
+import json
+
+from linebot.exceptions import InvalidSignatureError
+from linebot.models import TextSendMessage
+import pytest
+
+import line_client
+
+
+class FakeResponse():
+    status_code = 200
+    headers = {}
+    text = "{}"
+    content = b"{}"
+
+    def json(self):
+        return {}
+
+    def iter_content(self, chunk_size=1024, decode_unicode=False):
+        return iter([])
+
+
+def test_timeout(monkeypatch):
+    # line_timeout 要傳到每次的 session.request()
+    monkeypatch.setattr(line_client, "LINE_TIMEOUT", 1.5)
+    monkeypatch.setattr(line_client, "apiDICT", {})
+    lineBotApi = line_client.getLineBotApi("token")
+    assert lineBotApi.http_client.timeout == 1.5
+
+    kwargsLIST = []
+    session = lineBotApi.http_client.getSession()
+    monkeypatch.setattr(session, "request", lambda methodSTR, url, **kwargs: (kwargsLIST.append(kwargs), FakeResponse())[1])
+    lineBotApi.push_message("U1", TextSendMessage("您好"))
+    assert kwargsLIST[0]["timeout"] == 1.5
+
+def test_sharedClient(monkeypatch):
+    monkeypatch.setattr(line_client, "apiDICT", {})
+    lineBotApi = line_client.getLineBotApi("token")
+    assert line_client.getLineBotApi("token") is lineBotApi
+    assert lineBotApi.http_client.getSession() is lineBotApi.http_client.getSession()
+
+def test_parseWebhook():
+    secret = b"secret"
+    bodyBYTES = json.dumps({"events": [{"type": "message"}]}).encode("utf-8")
+    signatureSTR = base64.b64encode(hmac.new(secret, bodyBYTES, hashlib.sha256).digest()).decode("utf-8")
+    assert line_client.parseWebhook(bodyBYTES, signatureSTR, secret) == {"events": [{"type": "message"}]}
+
+    with pytest.raises(InvalidSignatureError):
+        line_client.parseWebhook(bodyBYTES + b" ", signatureSTR, secret)
+    with pytest.raises(InvalidSignatureError):
+        line_client.parseWebhook(bodyBYTES, signatureSTR, b"")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import json
+
+from esun_qa import TEST_INPUT_DICT
+from local_matcher import LocalMatcher, localMatcher
+
+REF_DICT = {
+    "utterance": {
+        "信用卡遺失怎麼辦": {"argument": [{"text": "信用卡", "lexy": [{"text": "卡片", "checked": True}, {"text": "存摺", "checked": False}]}]},
+        "如何開卡": {"argument": []},
+    },
+    "user_defined": {"_card": ["信用卡", "Visa卡"], "as_noun": ["信用卡", "金融卡"]}
+}
+MODULE_STR = """
+@utteranceHandler("[信用卡]遺失怎麼辦")
+def lost(): pass
+
+    if utterance == "如何開卡":
+        pass
+"""
+
+
+def getMatcher(tmp_path):
+    (tmp_path / "ref").mkdir()
+    (tmp_path / "intent").mkdir()
+    (tmp_path / "ref" / "credit_card.ref").write_text(json.dumps(REF_DICT, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "intent" / "Loki_credit_card.py").write_text(MODULE_STR, encoding="utf-8")
+    return LocalMatcher(refPath=str(tmp_path / "ref"), intentPath=str(tmp_path / "intent"))
+
+def test_match(tmp_path):
+    matcher = getMatcher(tmp_path)
+    assert matcher.match("如何開卡？")["results"] == [{"intent": "credit_card", "pattern": "", "utterance": "如何開卡", "argument": []}]
+    assert matcher.match("信用卡遺失怎麼辦")["results"][0]["argument"] == ["信用卡"]
+    # 勾選的 lexy 與 user_defined 同義詞 (大小寫不分)
+    assert matcher.match("卡片遺失怎麼辦")["results"][0]["argument"] == ["卡片"]
+    assert matcher.match("visa卡遺失怎麼辦")["results"][0]["argument"] == ["visa卡"]
+    # 未勾選的 lexy、as_ 開頭的詞性類別不算同義詞
+    assert matcher.match("存摺遺失怎麼辦") is None
+    assert matcher.match("金融卡遺失怎麼辦") is None
+    # 整句必須完全符合
+    assert matcher.match("如何開卡呢") is None
+    assert matcher.match("如何開卡", ["app"]) is None
+    assert matcher.utteranceINT == 2
+
+
+def test_corpusSingleIntent():
+    # 測試語料中的每一句最多只比對到一個意圖
+    for intentSTR, inputLIST in TEST_INPUT_DICT.items():
+        for inputSTR in inputLIST:
+            resultDICT = localMatcher.match(inputSTR)
+            if resultDICT is None:
+                continue
+            intentSET = set(r["intent"] for r in resultDICT["results"])
+            assert len(intentSET) == 1, (inputSTR, intentSET)
+
+def test_ambiguousIntent():
+    # customer_service 與 web_bank 都有這個 utterance，交給 Loki
+    assert localMatcher.match("如何設定約定轉入帳號") is None
+    resultDICT = localMatcher.match("如何設定約定轉入帳號", ["web_bank"])
+    assert [r["intent"] for r in resultDICT["results"]] == ["web_bank"]
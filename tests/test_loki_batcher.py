@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from threading import Thread
+import time
+
+import pytest
+
+from loki_batcher import LokiBatcher
+
+
+def runConcurrently(batcher, inputLIST, filterLIST=[]):
+    # 每句各自一個呼叫端，回傳 {句子: 結果或例外}
+    resultDICT = {}
+
+    def call(inputSTR):
+        try:
+            resultDICT[inputSTR] = batcher.call([inputSTR], filterLIST)
+        except Exception as e:
+            resultDICT[inputSTR] = e
+
+    threadLIST = [Thread(target=call, args=(inputSTR,)) for inputSTR in inputLIST]
+    for thread in threadLIST:
+        thread.start()
+    for thread in threadLIST:
+        thread.join(2)
+    return resultDICT
+
+def echoCall(callLIST):
+    def call(inputLIST, filterLIST):
+        callLIST.append(list(inputLIST))
+        return {"status": True, "msg": "Success!", "result_list": [{"input": inputSTR} for inputSTR in inputLIST]}
+    return call
+
+def test_mergeCalls():
+    callLIST = []
+    batcher = LokiBatcher(echoCall(callLIST), windowFLOAT=0.05)
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失", "如何申請信用卡"])
+
+    assert len(callLIST) == 1
+    assert sorted(callLIST[0]) == sorted(resultDICT)
+    for inputSTR, result in resultDICT.items():
+        assert result["result_list"] == [{"input": inputSTR}]
+
+def test_limit():
+    callLIST = []
+    batcher = LokiBatcher(echoCall(callLIST), windowFLOAT=0.05, limitINT=2)
+    # 湊滿 limitINT 句就送出，不等時間窗結束
+    startTime = time.time()
+    resultDICT = runConcurrently(batcher, ["a", "b", "c", "d"])
+    assert sorted(len(inputLIST) for inputLIST in callLIST) == [2, 2]
+    assert all(result["result_list"] == [{"input": inputSTR}] for inputSTR, result in resultDICT.items())
+    assert time.time() - startTime < 1
+
+    # 單次就達到 limitINT 句時直接送出
+    assert batcher.call(["e", "f"], [])["result_list"] == [{"input": "e"}, {"input": "f"}]
+    assert callLIST[-1] == ["e", "f"]
+
+def test_callFailure():
+    batcher = LokiBatcher(lambda inputLIST, filterLIST: {"status": False, "msg": "HTTP 503"}, windowFLOAT=0.05)
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失"])
+    assert list(resultDICT.values()) == [{"status": False, "msg": "HTTP 503"}] * 2
+
+def test_sizeMismatch():
+    batcher = LokiBatcher(lambda inputLIST, filterLIST: {"status": True, "msg": "Success!", "result_list": []}, windowFLOAT=0.05)
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失"])
+    assert all(not result["status"] and "mismatch" in result["msg"] for result in resultDICT.values())
+
+def test_unexpectedError():
+    # 分配結果時發生例外：所有呼叫端都收到例外，不會卡住
+    batcher = LokiBatcher(lambda inputLIST, filterLIST: {"status": True, "result_list": {i: {} for i in range(len(inputLIST))}},
+                          windowFLOAT=0.05, timeoutFLOAT=5)
+    startTime = time.time()
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失", "如何申請信用卡"])
+    assert time.time() - startTime < 1
+    assert all(isinstance(result, TypeError) for result in resultDICT.values())
+    assert batcher.pendingDICT == {}
+
+def test_followerTimeout():
+    def slowCall(inputLIST, filterLIST):
+        time.sleep(0.3)
+        return {"status": True, "msg": "Success!", "result_list": [{}] * len(inputLIST)}
+
+    batcher = LokiBatcher(slowCall, windowFLOAT=0.05, timeoutFLOAT=0.1)
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失", "如何申請信用卡"])
+    statusLIST = sorted(result["status"] for result in resultDICT.values())
+    # leader 一定等到結果，其他呼叫端逾時
+    assert statusLIST == [False, False, True]
+
+@pytest.mark.parametrize("windowFLOAT", [0, -1])
+def test_disabled(windowFLOAT):
+    callLIST = []
+    batcher = LokiBatcher(echoCall(callLIST), windowFLOAT=windowFLOAT)
+    resultDICT = runConcurrently(batcher, ["如何開卡", "信用卡遺失"])
+    assert len(callLIST) == 2
+    assert len(resultDICT) == 2
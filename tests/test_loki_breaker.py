@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import time
+
+from loki_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+
+
+def getBreaker(**kwargs):
+    kwargs.setdefault("openFLOAT", 0.1)
+    return CircuitBreaker(windowINT=10, minCallINT=4, failureRateFLOAT=0.5, slowFLOAT=1, probeINT=1, enableBOOL=True, **kwargs)
+
+def openBreaker(breaker):
+    for successBOOL in [True, False, True, False]:
+        assert breaker.allow()
+        breaker.record(successBOOL)
+
+def test_openHalfOpenClosed():
+    breaker = getBreaker()
+    # 未達 minCallINT 前不會 open
+    for i in range(3):
+        breaker.record(False)
+    assert breaker.getState() == CLOSED
+
+    breaker = getBreaker()
+    openBreaker(breaker)
+    assert breaker.getState() == OPEN
+    assert breaker.isDegraded()
+    assert not breaker.allow()
+
+    # openFLOAT 秒後進入 half_open，只放行 probeINT 個試探
+    time.sleep(0.15)
+    assert breaker.getState() == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record(True)
+    assert breaker.getState() == CLOSED
+    assert not breaker.isDegraded()
+    assert breaker.allow()
+
+def test_probeFailure():
+    breaker = getBreaker()
+    openBreaker(breaker)
+    time.sleep(0.15)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.getState() == OPEN
+    assert not breaker.allow()
+
+def test_slowCall():
+    # 超過 slowFLOAT 秒的成功呼叫視為失敗
+    breaker = getBreaker()
+    for i in range(4):
+        breaker.record(True, 2)
+    assert breaker.getState() == OPEN
+
+def test_release():
+    breaker = getBreaker()
+    openBreaker(breaker)
+    time.sleep(0.15)
+    assert breaker.allow()
+    assert not breaker.allow()
+    # 試探沒有結果 (例如被取消) 時歸還名額
+    breaker.release()
+    assert breaker.allow()
+
+def test_disabled():
+    breaker = CircuitBreaker(minCallINT=1, enableBOOL=False)
+    breaker.record(False)
+    assert breaker.allow()
+    assert not breaker.isDegraded()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import time
+
+from loki_disk_cache import LokiDiskCache
+
+RESULT_DICT = {"status": True, "msg": "Success!", "results": []}
+
+
+def getCache(tmp_path):
+    return LokiDiskCache(pathSTR=str(tmp_path / "cache.sqlite3"), flushFLOAT=60)
+
+def test_getSet(tmp_path):
+    cache = getCache(tmp_path)
+    assert cache.get("如何開卡", ["credit_card"]) is None
+    cache.set("如何開卡", ["credit_card"], "v1", RESULT_DICT)
+    cache.flush()
+    assert cache.get(" 如何開卡", ["credit_card"]) == ("v1", RESULT_DICT)
+    assert cache.get("如何開卡", ["app"]) is None
+
+def test_versionUpdate(tmp_path):
+    cache = getCache(tmp_path)
+    cache.set("如何開卡", [], "v1", RESULT_DICT)
+    cache.flush()
+    time.sleep(0.01)
+    cache.set("信用卡遺失", [], "v2", RESULT_DICT)
+    cache.flush()
+    assert cache.get("如何開卡", []) is None
+    assert cache.get("信用卡遺失", []) == ("v2", RESULT_DICT)
+    assert cache.getStats()["size"] == 1
+
+def test_olderVersionWorker(tmp_path):
+    # 部署途中另一個 worker 仍拿到舊的 version：不能刪除新版本的結果
+    newCache = getCache(tmp_path)
+    oldCache = getCache(tmp_path)
+    oldCache.set("如何開卡", [], "v1", RESULT_DICT)
+    oldCache.flush()
+    time.sleep(0.01)
+    newCache.set("信用卡遺失", [], "v2", RESULT_DICT)
+    newCache.flush()
+
+    oldCache.set("如何申請信用卡", [], "v1", RESULT_DICT)
+    oldCache.flush()
+    assert newCache.get("信用卡遺失", []) == ("v2", RESULT_DICT)
+    assert newCache.getStats()["version"] == "v2"
+    assert newCache.getStats()["size"] == 1
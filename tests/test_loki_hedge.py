@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from threading import Lock
+import time
+
+from loki_hedge import Hedger, MIN_SAMPLE
+import tracing
+
+
+class SlowFirstCall():
+    """
+    第一次呼叫等待 slowFLOAT 秒，之後的呼叫立即回傳
+    """
+    def __init__(self, slowFLOAT, balanceINT=1000000):
+        self.slowFLOAT = slowFLOAT
+        self.balanceINT = balanceINT
+        self.callINT = 0
+        self.lock = Lock()
+
+    def __call__(self, inputLIST, filterLIST):
+        with self.lock:
+            self.callINT += 1
+            callINT = self.callINT
+        if callINT == 1:
+            time.sleep(self.slowFLOAT)
+        return {"status": True, "msg": "Success!", "call": callINT, "word_count_balance": self.balanceINT, "result_list": [{}] * len(inputLIST)}
+
+def getHedger(callFUNC, **kwargs):
+    kwargs.setdefault("budgetFLOAT", 1.0)
+    hedger = Hedger(callFUNC, percentileFLOAT=95, minDelayFLOAT=0.02, minBalanceINT=10000, workerINT=4, enableBOOL=True, **kwargs)
+    # 最近的延遲都是 10ms，對沖等待時間為 minDelayFLOAT
+    hedger.latencyDEQUE.extend([0.01] * MIN_SAMPLE)
+    return hedger
+
+def test_hedgeWins():
+    callFUNC = SlowFirstCall(0.5)
+    hedger = getHedger(callFUNC)
+    startTime = time.time()
+    result = hedger.call(["如何開卡"], [])
+    assert time.time() - startTime < 0.3
+    assert result["call"] == 2
+    assert hedger.getStats()["hedge"] == 1
+
+def test_noSample():
+    # 樣本不足時不對沖
+    callFUNC = SlowFirstCall(0.1)
+    hedger = getHedger(callFUNC)
+    hedger.latencyDEQUE.clear()
+    assert hedger.call(["如何開卡"], [])["call"] == 1
+    assert callFUNC.callINT == 1
+
+def test_budget():
+    callFUNC = SlowFirstCall(0.1)
+    hedger = getHedger(callFUNC, budgetFLOAT=0.0)
+    assert hedger.call(["如何開卡"], [])["call"] == 1
+    assert hedger.getStats()["hedge"] == 0
+
+def test_lowBalance():
+    callFUNC = SlowFirstCall(0.1, balanceINT=100)
+    hedger = getHedger(callFUNC)
+    hedger.call(["信用卡遺失"], [])             # 取得 word_count_balance
+    assert hedger.getStats()["balance"] == 100
+    hedgeINT = hedger.getStats()["hedge"]
+
+    callFUNC.callINT = 0
+    assert hedger.call(["如何開卡"], [])["call"] == 1
+    assert hedger.getStats()["hedge"] == hedgeINT
+
+def test_disabled():
+    callFUNC = SlowFirstCall(0)
+    hedger = Hedger(callFUNC, enableBOOL=False)
+    assert hedger.call(["如何開卡"], [])["call"] == 1
+    assert hedger.getStats()["call"] == 0
+
+def test_traceContext():
+    # primary 與對沖請求都在 executor 中執行，其中的 span 要接在呼叫端的 span 下
+    callFUNC = SlowFirstCall(0.2)
+
+    def tracedCall(inputLIST, filterLIST):
+        with tracing.span("test.hedge.bulkapi"):
+            return callFUNC(inputLIST, filterLIST)
+
+    hedger = getHedger(tracedCall)
+    with tracing.span("test.hedge.caller") as callerSpan:
+        hedger.call(["如何開卡"], [])
+    time.sleep(0.25)                                # 等 primary 也結束
+
+    callerDICT = [s for s in tracing.getRecentSpanLIST(0) if s["span"] == callerSpan.spanID][0]
+    spanLIST = [s for s in tracing.getRecentSpanLIST(0) if s["name"] == "test.hedge.bulkapi"]
+    assert len(spanLIST) == 2
+    for spanDICT in spanLIST:
+        assert spanDICT["parent"] == callerSpan.spanID
+        assert spanDICT["trace"] == callerDICT["trace"]
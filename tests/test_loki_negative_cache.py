@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import time
+
+from loki_negative_cache import BloomFilter, NegativeCache, NO_MATCH_MSG
+
+NO_MATCH_DICT = {"status": False, "msg": NO_MATCH_MSG}
+
+
+def test_noFalseNegative():
+    # Bloom filter 不會漏掉加入過的句子 (輪替一次後仍在上一代中)
+    cache = NegativeCache(capacityINT=5000, fpFLOAT=0.01, ttlFLOAT=600)
+    inputLIST = ["閒聊{}".format(i) for i in range(5000)]
+    for inputSTR in inputLIST:
+        cache.set(inputSTR, [], "v1")
+    assert all(cache.get(inputSTR, []) == NO_MATCH_DICT for inputSTR in inputLIST)
+    cache.set("第 5001 句", [], "v1")            # 這一代已滿，輪替
+    assert all(cache.get(inputSTR, []) == NO_MATCH_DICT for inputSTR in inputLIST)
+    assert cache.get("第 5001 句", []) == NO_MATCH_DICT
+
+def test_falsePositive():
+    # 沒有加入過的句子誤判的比例接近 fpFLOAT
+    bloom = BloomFilter(10000, 0.01)
+    for i in range(10000):
+        bloom.add("閒聊{}".format(i).encode("utf-8"))
+    falseINT = sum(1 for i in range(20000) if "問題{}".format(i).encode("utf-8") in bloom)
+    assert falseINT / 20000 < 0.02
+
+def test_ttlRollover():
+    # 每 ttl / 2 秒輪替一代：一句話最少保留 ttl / 2 秒，最多 ttl 秒
+    cache = NegativeCache(capacityINT=100, fpFLOAT=0.001, ttlFLOAT=0.2)
+    cache.set("閒聊A", [], "v1")
+    time.sleep(0.12)
+    assert cache.get("閒聊A", []) == NO_MATCH_DICT     # 輪替到上一代
+    cache.set("閒聊B", [], "v1")
+    time.sleep(0.12)
+    assert cache.get("閒聊B", []) == NO_MATCH_DICT
+    assert cache.get("閒聊A", []) is None               # 上一代被丟棄
+    time.sleep(0.12)
+    assert cache.get("閒聊B", []) is None
+
+def test_capacityRollover():
+    # 這一代已滿時提前輪替，上一代的句子仍然命中
+    cache = NegativeCache(capacityINT=10, fpFLOAT=0.001, ttlFLOAT=600)
+    for i in range(10):
+        cache.set("閒聊{}".format(i), [], "v1")
+    for i in range(10, 20):
+        cache.set("閒聊{}".format(i), [], "v1")
+    assert all(cache.get("閒聊{}".format(i), []) == NO_MATCH_DICT for i in range(10, 20))
+    cache.set("閒聊20", [], "v1")
+    assert cache.getStats()["size"] == 11
+    assert sum(1 for i in range(10) if cache.get("閒聊{}".format(i), []) is not None) <= 1
+
+def test_version():
+    # Loki version 改變 (意圖或 utterance 有變動) 時整個清空
+    cache = NegativeCache(capacityINT=100, fpFLOAT=0.001, ttlFLOAT=600)
+    cache.set("閒聊", ["credit_card"], "v1")
+    cache.checkVersion("v1")
+    assert cache.get("閒聊", ["credit_card"]) == NO_MATCH_DICT
+    cache.checkVersion("v2")
+    assert cache.get("閒聊", ["credit_card"]) is None
+    cache.set("閒聊", ["credit_card"], "v2")
+    cache.clear()
+    assert cache.get("閒聊", ["credit_card"]) is None
+
+def test_key():
+    cache = NegativeCache(capacityINT=100, fpFLOAT=0.001, ttlFLOAT=600)
+    cache.set(" 閒聊 ", ["app", "credit_card"], "v1")
+    assert cache.get("閒聊", ["credit_card", "app"]) == NO_MATCH_DICT
+    assert cache.get("閒聊", ["app"]) is None
+    assert cache.getStats() == {"size": 1, "hit": 1, "miss": 1, "version": "v1"}
+
+def test_disabled():
+    cache = NegativeCache(capacityINT=0)
+    cache.set("閒聊", [], "v1")
+    assert cache.get("閒聊", []) is None
+    assert cache.getStats()["size"] == 0
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import time
+
+from loki_quota import QuotaGovernor, NORMAL, CONSERVE, CRITICAL
+
+
+def getGovernor(tmp_path, **kwargs):
+    kwargs.setdefault("intervalFLOAT", 0)
+    return QuotaGovernor(pathSTR=str(tmp_path / "quota.sqlite3"), lowINT=50000, criticalINT=5000, horizonFLOAT=0, **kwargs)
+
+def test_levelTransition(tmp_path):
+    governor = getGovernor(tmp_path)
+    assert governor.getLevel() == NORMAL                # 還沒有 balance
+
+    governor.record(100000)
+    assert governor.getLevel() == NORMAL
+    governor.record(30000)
+    assert governor.getLevel() == CONSERVE
+    governor.record(1000)
+    assert governor.getLevel() == CRITICAL
+    assert governor.isCritical()
+
+    # 加值後回到 normal (加值前的紀錄不計入消耗速度)
+    governor.record(1000000)
+    assert governor.getLevel() == NORMAL
+    assert governor.getStats()["burnRate"] == 0
+
+def test_criticalProbe(tmp_path):
+    governor = getGovernor(tmp_path, intervalFLOAT=0.2)
+    governor.record(1000)
+    assert governor.getLevel() == CRITICAL
+
+    # 每個 interval 只放行一個試探句子
+    assert governor.check("如何開卡") is None
+    assert governor.check("信用卡遺失") == "critical"
+    time.sleep(0.25)
+    assert governor.check("信用卡遺失") is None
+    assert governor.check("如何開卡") == "critical"
+
+    # 試探句子的回應帶回加值後的 balance
+    governor.record(1000000)
+    assert governor.getLevel() == NORMAL
+    assert governor.check("如何開卡") is None
+
+def test_staleBalance(tmp_path):
+    governor = getGovernor(tmp_path, windowFLOAT=0.1)
+    governor.record(1000)
+    assert governor.getLevel() == CRITICAL
+
+    # 超過 window 沒有新的 balance 時視為未知
+    time.sleep(0.15)
+    assert governor.getLevel() == NORMAL
+    assert governor.getStats()["balance"] is None
+
+def test_conserveShed(tmp_path):
+    governor = getGovernor(tmp_path, longINT=10, duplicateFLOAT=60)
+    governor.record(30000)
+    assert governor.getLevel() == CONSERVE
+
+    assert governor.check("您好") == "greeting"
+    assert governor.check("信用卡" * 10) == "long"
+
+    # 送出失敗 (沒有 markSent) 的句子可以馬上重試
+    assert governor.check("如何開卡") is None
+    assert governor.check("如何開卡") is None
+    governor.markSent("如何開卡")
+    assert governor.check("如何開卡") == "duplicate"
+
+def test_disabled():
+    governor = QuotaGovernor(pathSTR="")
+    governor.record(0)
+    assert governor.getLevel() == NORMAL
+    assert governor.check("您好") is None
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import asyncio
+import json
+import time
+
+import pytest
+import requests
+
+import loki_session
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # 依 statusLIST 依序回覆 (用完後回覆 200)，delayFLOAT 秒後才回覆
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server.requestLIST.append(self.client_address[1])
+        statusINT = server.statusLIST.pop(0) if server.statusLIST else 200
+        time.sleep(server.delayFLOAT)
+        bodyBYTES = json.dumps({"status": statusINT == 200}).encode("utf-8")
+        try:
+            self.send_response(statusINT)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(bodyBYTES)))
+            self.end_headers()
+            self.wfile.write(bodyBYTES)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server(monkeypatch):
+    # 每個測試使用新的連線池，重試等待時間縮短
+    monkeypatch.setattr(loki_session, "LOKI_BACKOFF", 0.01)
+    monkeypatch.setattr(loki_session, "LOKI_READ_TIMEOUT", 0.2)
+    monkeypatch.setattr(loki_session, "adapterDICT", {})
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    stub.daemon_threads = True
+    stub.requestLIST = []
+    stub.statusLIST = []
+    stub.delayFLOAT = 0
+    stub.url = "http://127.0.0.1:{}/".format(stub.server_address[1])
+    Thread(target=stub.serve_forever, daemon=True).start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+def test_keepAlive(server):
+    # 同一個 thread 的呼叫共用同一條連線
+    for i in range(3):
+        assert loki_session.post(server.url, json={}).json() == {"status": True}
+    assert len(server.requestLIST) == 3
+    assert len(set(server.requestLIST)) == 1
+
+def test_retryStatus(server):
+    # 429 / 503 代表伺服器沒有處理，重試後成功
+    server.statusLIST = [503, 429]
+    assert loki_session.post(server.url, json={}).status_code == 200
+    assert len(server.requestLIST) == 3
+
+@pytest.mark.parametrize("statusINT", [500, 502, 504])
+def test_noRetryStatus(server, statusINT):
+    # Loki 可能已經處理並扣了字數，不重送
+    server.statusLIST = [statusINT]
+    assert loki_session.post(server.url, json={}).status_code == statusINT
+    assert len(server.requestLIST) == 1
+
+def test_noRetryReadTimeout(server):
+    # 請求已經送出，讀取逾時不重送 (read=0，urllib3 直接以 MaxRetryError 結束)
+    server.delayFLOAT = 0.5
+    with pytest.raises(requests.exceptions.RequestException, match="Read timed out"):
+        loki_session.post(server.url, json={})
+    time.sleep(0.6)
+    assert len(server.requestLIST) == 1
+
+def test_asyncRetry(server):
+    server.statusLIST = [503, 500]
+
+    async def run():
+        try:
+            return await loki_session.post_async(server.url, json={})
+        finally:
+            await loki_session.closeAsyncSession()
+    assert asyncio.run(run()) == (500, None)
+    assert len(server.requestLIST) == 2
+
+def test_asyncNoRetryReadTimeout(server):
+    server.delayFLOAT = 0.5
+
+    async def run():
+        try:
+            return await loki_session.post_async(server.url, json={})
+        finally:
+            await loki_session.closeAsyncSession()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+    time.sleep(0.6)
+    assert len(server.requestLIST) == 1
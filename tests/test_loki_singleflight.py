@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from threading import Thread
+import asyncio
+
+from loki_singleflight import SingleFlight
+
+RESULT_DICT = {"status": True, "msg": "Success!", "result_list": []}
+
+
+def test_leaderFollower():
+    flight = SingleFlight()
+    future, leaderBOOL = flight.join("如何開卡")
+    followerFuture, followerBOOL = flight.join("如何開卡")
+    assert leaderBOOL and not followerBOOL
+    assert followerFuture is future
+    assert flight.join("信用卡遺失")[1]
+
+    resultLIST = []
+    follower = Thread(target=lambda: resultLIST.append(flight.wait(followerFuture)))
+    follower.start()
+    flight.done("如何開卡", future, RESULT_DICT)
+    follower.join(1)
+    assert resultLIST == [RESULT_DICT]
+
+    # done() 之後同一個 key 重新由新的 leader 查詢
+    assert flight.join("如何開卡")[1]
+
+def test_followerTimeout():
+    flight = SingleFlight(timeoutFLOAT=0.05)
+    future, leaderBOOL = flight.join("如何開卡")
+    resultDICT = flight.wait(flight.join("如何開卡")[0])
+    assert resultDICT["status"] is False
+    assert "timeout" in resultDICT["msg"]
+
+def test_waitAsync():
+    flight = SingleFlight(timeoutFLOAT=1)
+    future, leaderBOOL = flight.join("如何開卡")
+
+    async def main():
+        waitTask = asyncio.ensure_future(flight.wait_async(future))
+        await asyncio.sleep(0.01)
+        flight.done("如何開卡", future, RESULT_DICT)
+        return await waitTask
+
+    assert asyncio.run(main()) == RESULT_DICT
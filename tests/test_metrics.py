@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import metrics
+
+testCounter = metrics.counter("test_retired_total", "測試用 counter")
+
+
+def getDeadPID():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+def writeWorker(dirPath, pid, startTime, valueINT):
+    snapshotDICT = {"test_retired_total": {"type": "counter", "doc": "", "labels": [], "values": [[[], valueINT]]}}
+    with open(os.path.join(dirPath, "{}-{}.json".format(pid, int(startTime * 1000))), "w", encoding="utf-8") as f:
+        json.dump({"pid": pid, "start": startTime, "time": time.time(), "metrics": snapshotDICT}, f)
+
+def getTotal(exporter):
+    valueLIST = exporter.collect()["test_retired_total"]["values"]
+    return valueLIST[0][1] - testCounter.getValue()
+
+def test_retireDeadWorker(tmp_path):
+    exporter = metrics.Exporter(dirSTR=str(tmp_path))
+    writeWorker(tmp_path, getDeadPID(), 1, 5)
+    writeWorker(tmp_path, os.getppid(), 1, 7)
+
+    assert getTotal(exporter) == 12
+    # 已結束的 worker 合併進 retired.json，再次讀取時數值不變
+    assert sorted(os.listdir(tmp_path)) == sorted(["{}-1000.json".format(os.getppid()), metrics.LOCK_FILE, metrics.RETIRED_FILE])
+    assert getTotal(exporter) == 12
+
+def test_recycledPID(tmp_path):
+    # 同一個 pid 有較新的檔案時，舊的檔案屬於已結束的 worker
+    exporter = metrics.Exporter(dirSTR=str(tmp_path))
+    writeWorker(tmp_path, os.getppid(), 1, 5)
+    writeWorker(tmp_path, os.getppid(), 2, 3)
+    assert getTotal(exporter) == 8
+    assert not os.path.exists(os.path.join(tmp_path, "{}-1000.json".format(os.getppid())))
+    assert getTotal(exporter) == 8
+
+def test_interruptedRetire(tmp_path):
+    # 合併後還沒刪除檔案就中斷：只刪除，不重複相加
+    exporter = metrics.Exporter(dirSTR=str(tmp_path))
+    pid = getDeadPID()
+    writeWorker(tmp_path, pid, 1, 5)
+    fileNameSTR = "{}-1000.json".format(pid)
+    snapshotDICT = {"test_retired_total": {"type": "counter", "doc": "", "labels": [], "values": [[[], 5]]}}
+    with open(os.path.join(tmp_path, metrics.RETIRED_FILE), "w", encoding="utf-8") as f:
+        json.dump({"files": [fileNameSTR], "metrics": snapshotDICT}, f)
+
+    assert getTotal(exporter) == 5
+    assert not os.path.exists(os.path.join(tmp_path, fileNameSTR))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+import os
+import time
+
+from linebot.exceptions import LineBotApiError
+from linebot.models import TextSendMessage
+from linebot.models.error import Error
+import pytest
+
+from reply_sender import ReplySender
+
+MESSAGE = TextSendMessage("您好")
+
+
+def getError(statusCodeINT, messageSTR):
+    return LineBotApiError(statusCodeINT, {}, error=Error(message=messageSTR))
+
+
+class FakeLineBotApi():
+    """
+    依序以 errorLIST 中的例外回應 (None 代表成功)，記錄每次呼叫的 (method, tk / userId)
+    """
+    def __init__(self, errorLIST=[]):
+        self.errorLIST = list(errorLIST)
+        self.callLIST = []
+
+    def respond(self, method, target):
+        self.callLIST.append((method, target))
+        error = self.errorLIST.pop(0) if self.errorLIST else None
+        if error is not None:
+            raise error
+
+    def reply_message(self, tk, message):
+        self.respond("reply", tk)
+
+    def push_message(self, userId, message):
+        self.respond("push", userId)
+
+def getSender(lineBotApi, **kwargs):
+    return ReplySender(lineBotApiFUNC=lambda: lineBotApi, workerINT=1, backoffFLOAT=0.001, **kwargs)
+
+def test_reply():
+    lineBotApi = FakeLineBotApi()
+    assert getSender(lineBotApi).deliver("tk", "U1", MESSAGE, time.time()) == "reply"
+    assert lineBotApi.callLIST == [("reply", "tk")]
+
+def test_invalidTokenFallback():
+    lineBotApi = FakeLineBotApi([getError(400, "Invalid reply token")])
+    assert getSender(lineBotApi).deliver("tk", "U1", MESSAGE, time.time()) == "push"
+    assert lineBotApi.callLIST == [("reply", "tk"), ("push", "U1")]
+
+def test_invalidTokenWithoutUser():
+    # 沒有 userId 時不能改用 push
+    lineBotApi = FakeLineBotApi([getError(400, "Invalid reply token")])
+    with pytest.raises(LineBotApiError):
+        getSender(lineBotApi).deliver("tk", None, MESSAGE, time.time())
+    assert lineBotApi.callLIST == [("reply", "tk")]
+
+def test_expiredToken():
+    lineBotApi = FakeLineBotApi()
+    sender = getSender(lineBotApi, tokenTTLFLOAT=50)
+    assert sender.deliver("tk", "U1", MESSAGE, time.time() - 60) == "push"
+    assert sender.deliver("tk", None, MESSAGE, time.time() - 60) == "reply"
+    assert lineBotApi.callLIST == [("push", "U1"), ("reply", "tk")]
+
+def test_retry():
+    lineBotApi = FakeLineBotApi([getError(500, "Internal Server Error"), getError(429, "Too Many Requests")])
+    assert getSender(lineBotApi, retryINT=3).deliver("tk", "U1", MESSAGE, time.time()) == "reply"
+    assert len(lineBotApi.callLIST) == 3
+
+    # 400 (不是 replyToken 的問題) 不重試
+    lineBotApi = FakeLineBotApi([getError(400, "The request body has 1 error(s)")])
+    with pytest.raises(LineBotApiError):
+        getSender(lineBotApi, retryINT=3).deliver("tk", "U1", MESSAGE, time.time())
+    assert len(lineBotApi.callLIST) == 1
+
+    # 超過重試次數時 raise 最後一次的例外
+    lineBotApi = FakeLineBotApi([getError(503, "Service Unavailable")] * 3)
+    with pytest.raises(LineBotApiError):
+        getSender(lineBotApi, retryINT=2).deliver("tk", "U1", MESSAGE, time.time())
+    assert len(lineBotApi.callLIST) == 3
+
+def test_sendAndDrain():
+    lineBotApi = FakeLineBotApi()
+    sender = getSender(lineBotApi)
+    for i in range(5):
+        assert sender.send("tk{}".format(i), "U1", MESSAGE)
+    assert sender.send(None, "U1", MESSAGE)
+    assert sender.drain(2)
+    assert sorted(lineBotApi.callLIST) == [("push", "U1")] + [("reply", "tk{}".format(i)) for i in range(5)]
+
+def test_queueFull():
+    # 佇列已滿時在呼叫端同步送出
+    lineBotApi = FakeLineBotApi()
+    sender = getSender(lineBotApi, queueSizeINT=1)
+    sender.workerPID = os.getpid()          # 不啟動 sender thread，佇列不會被取出
+    assert sender.send("tk1", "U1", MESSAGE)
+    assert not sender.send("tk2", "U1", MESSAGE)
+    assert lineBotApi.callLIST == [("reply", "tk2")]
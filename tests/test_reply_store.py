@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from glob import glob
+from pathlib import Path
+import json
+import os
+
+import pytest
+
+from intent import reply_store
+
+
+def loadJson(replyPath):
+    replyDICT = {}
+    for replyFile in sorted(glob(os.path.join(replyPath, "reply_*.json"))):
+        with open(replyFile, encoding="utf-8") as f:
+            replyDICT[Path(replyFile).stem[6:]] = json.load(f)
+    return replyDICT
+
+def writeJson(replyPath, intentSTR, responseDICT):
+    with open(os.path.join(replyPath, "reply_{}.json".format(intentSTR)), "w", encoding="utf-8") as f:
+        json.dump(responseDICT, f, ensure_ascii=False)
+
+def test_roundTrip(tmp_path):
+    # 編譯後的 reply.bin 與 reply/reply_*.json 的內容完全相同
+    storeFile = str(tmp_path / "reply.bin")
+    replyDICT = loadJson(reply_store.REPLY_PATH)
+    assert reply_store.build(storeFile=storeFile) == sum(len(v) for v in replyDICT.values())
+
+    store = reply_store.ReplyStore(storeFile)
+    for intentSTR, responseDICT in replyDICT.items():
+        view = store.getIntent(intentSTR)
+        assert len(view) == len(responseDICT)
+        assert sorted(view) == sorted(responseDICT)
+        for utteranceSTR, responseLIST in responseDICT.items():
+            assert utteranceSTR in view
+            assert list(view[utteranceSTR]) == responseLIST
+
+def test_lookup(tmp_path):
+    writeJson(str(tmp_path), "app", {"如何開卡": ["第一則 {}", "第二則"], "空的": []})
+    writeJson(str(tmp_path), "app2", {"如何開卡": ["app2"]})
+    storeFile = str(tmp_path / "reply.bin")
+    reply_store.build(replyPath=str(tmp_path), storeFile=storeFile)
+
+    view = reply_store.ReplyStore(storeFile).getIntent("app")
+    # 名稱為前綴的 intent 不會混在一起
+    assert sorted(view) == ["如何開卡", "空的"]
+    assert list(view["如何開卡"]) == ["第一則 {}", "第二則"]
+    assert view["如何開卡"][-1] == "第二則"
+    assert view["如何開卡"][0:1] == ["第一則 {}"]
+    assert view["如何開卡"][0].format("A") == "第一則 A"
+    assert len(view["空的"]) == 0
+    with pytest.raises(IndexError):
+        view["如何開卡"][2]
+    with pytest.raises(KeyError):
+        view["不存在"]
+    assert "不存在" not in view
+    assert 1 not in view
+    assert view.get("不存在") is None
+
+def test_isStale(tmp_path):
+    writeJson(str(tmp_path), "app", {"如何開卡": ["A"]})
+    storeFile = str(tmp_path / "reply.bin")
+    assert reply_store.isStale(storeFile, str(tmp_path))
+    reply_store.build(replyPath=str(tmp_path), storeFile=storeFile)
+    assert not reply_store.isStale(storeFile, str(tmp_path))
+    # reply_*.json 比 reply.bin 新時不使用 reply.bin
+    storeMtime = os.path.getmtime(storeFile)
+    os.utime(str(tmp_path / "reply_app.json"), (storeMtime + 10, storeMtime + 10))
+    assert reply_store.isStale(storeFile, str(tmp_path))
+
+def test_badFile(tmp_path):
+    storeFile = tmp_path / "reply.bin"
+    storeFile.write_bytes(b"JSON" + bytes(8))
+    with pytest.raises(ValueError):
+        reply_store.ReplyStore(str(storeFile))
+
+def test_loadReply():
+    # 意圖模組的 responseDICT 不論來自 reply.bin 或 json，內容都與 json 相同
+    responseDICT = reply_store.loadReply("credit_card")
+    replyDICT = loadJson(reply_store.REPLY_PATH)["credit_card"]
+    assert sorted(responseDICT) == sorted(replyDICT)
+    assert list(responseDICT["如何開卡"]) == replyDICT["如何開卡"]
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+from threading import Event
+import os
+import time
+
+from webhook_queue import WebhookQueue
+
+
+def test_process():
+    payloadLIST = []
+    webhookQueue = WebhookQueue(lambda payload, receivedTime: payloadLIST.append(payload), workerINT=2)
+    for i in range(10):
+        assert webhookQueue.put({"events": [i]})
+    assert webhookQueue.drain(2)
+    assert sorted(p["events"][0] for p in payloadLIST) == list(range(10))
+
+def test_handlerError():
+    # 處理失敗的 webhook 不影響之後的 webhook
+    payloadLIST = []
+
+    def handler(payload, receivedTime):
+        if payload == "error":
+            raise ValueError(payload)
+        payloadLIST.append(payload)
+
+    webhookQueue = WebhookQueue(handler, workerINT=1)
+    webhookQueue.put("error")
+    webhookQueue.put("ok")
+    assert webhookQueue.drain(2)
+    assert payloadLIST == ["ok"]
+
+def test_queueFull():
+    # 佇列已滿時在呼叫端同步處理
+    payloadLIST = []
+    webhookQueue = WebhookQueue(lambda payload, receivedTime: payloadLIST.append(payload), queueSizeINT=1)
+    webhookQueue.workerPID = os.getpid()     # 不啟動 worker，佇列不會被取出
+    assert webhookQueue.put("queued")
+    assert not webhookQueue.put("sync")
+    assert payloadLIST == ["sync"]
+    assert webhookQueue.getDepth() == 1
+
+def test_drainTimeout():
+    releaseEvent = Event()
+    webhookQueue = WebhookQueue(lambda payload, receivedTime: releaseEvent.wait(2), workerINT=1, drainFLOAT=0.05)
+    webhookQueue.put("slow")
+    startTime = time.time()
+    assert not webhookQueue.drain()
+    assert time.time() - startTime < 1
+    releaseEvent.set()
+    assert webhookQueue.drain(2)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    訊息處理流程的分段計時 (span)
+
+    回覆變慢時，要能分辨時間花在分句、Loki BulkAPI、意圖模組 getResult()、回覆抽樣還是 LINE reply_message。
+    以 span() 包住各個階段，結束時：
+
+    * 記錄到 pipeline_stage_seconds{stage} histogram，getStageStats() / 管理端點 /admin/trace 可查 p50 / p95 / p99
+      (以 metrics.collect() 合併所有 gunicorn worker 的 histogram)
+    * 放入記憶體中的 ring buffer (最近 trace_buffer 筆)，getRecentSpanLIST() 可查 (只有目前 worker 的 span)
+    * 設定 trace_file 時，以 JSONL 寫入該檔 (經由 bot_logging 的佇列，由背景 thread 寫出，不會卡住呼叫端)
+
+    同一個 thread (或 asyncio task) 中巢狀的 span 共用 trace id，並以 parent 記錄上一層 span；
+    送到 ThreadPoolExecutor 的工作以 contextvars.copy_context().run 執行即可延續同一個 trace。
+
+    設定 (環境變數):
+        tracing             是否啟用 (預設 true)
+        trace_buffer        ring buffer 保留的 span 數 (預設 2000)
+        trace_sample        寫入 ring buffer / trace_file 的 trace 比例 (預設 1.0，histogram 一律記錄)
+        trace_file          JSONL 輸出檔案路徑，空字串代表不輸出 (預設空字串)
+
+    metrics:
+        pipeline_stage_seconds{stage}   各階段的耗時
+
+    e.g.
+        with tracing.span("loki.bulkapi", size=len(inputLIST)):
+            result = post(...)
+
+        @tracing.traced("execLoki")
+        def execLoki(...):
+            ...
+"""
+
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from itertools import count
+import json
+import logging
+import os
+import random
+import time
+
+from bot_logging import NonBlockingQueueHandler
+import metrics
+
+TRACING = os.environ.get("tracing", "true").lower() in ["1", "true", "yes"]
+TRACE_BUFFER = int(os.environ.get("trace_buffer", 2000))
+TRACE_SAMPLE = float(os.environ.get("trace_sample", 1.0))
+TRACE_FILE = os.environ.get("trace_file", "")
+QUANTILE_LIST = [0.5, 0.95, 0.99]
+
+# 意圖模組的 getResult() 只要幾十微秒，bucket 需要比預設的更細
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+stageHistogram = metrics.histogram("pipeline_stage_seconds", "訊息處理各階段的耗時", ["stage"], bucketLIST=STAGE_BUCKETS)
+
+# (trace id, span id, 是否取樣)，None 代表目前不在任何 span 中
+currentSpan = ContextVar("currentSpan", default=None)
+idCounter = count(1)                # span id (同一個 worker 內唯一，輸出時附上 pid 區分 worker)
+spanDEQUE = deque(maxlen=TRACE_BUFFER)      # deque.append 本身是 thread-safe
+
+exportLogger = logging.getLogger("tracing.export")
+if TRACE_FILE:
+    exportHandler = NonBlockingQueueHandler(10000, logging.FileHandler(TRACE_FILE, encoding="utf-8"))
+    exportLogger.addHandler(exportHandler)
+    exportLogger.setLevel(logging.INFO)
+    exportLogger.propagate = False
+
+
+class Span():
+    __slots__ = ["name", "attrDICT", "spanID", "parentTUPLE", "token", "startTime", "startPerf"]
+
+    def __init__(self, name, **attrDICT):
+        self.name = name
+        self.attrDICT = attrDICT
+
+    def __enter__(self):
+        if not TRACING:
+            return self
+        self.parentTUPLE = currentSpan.get()
+        self.spanID = next(idCounter)
+        if self.parentTUPLE is None:
+            spanTUPLE = (self.spanID, self.spanID, TRACE_SAMPLE >= 1.0 or random.random() < TRACE_SAMPLE)
+        else:
+            spanTUPLE = (self.parentTUPLE[0], self.spanID, self.parentTUPLE[2])
+        self.token = currentSpan.set(spanTUPLE)
+        self.startTime = time.time()
+        self.startPerf = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if not TRACING:
+            return False
+        elapsedFLOAT = time.perf_counter() - self.startPerf
+        spanTUPLE = currentSpan.get()
+        currentSpan.reset(self.token)
+        stageHistogram.observe(elapsedFLOAT, stage=self.name)
+        if not spanTUPLE[2]:
+            return False
+
+        spanDICT = {
+            "pid": os.getpid(),
+            "trace": spanTUPLE[0],
+            "span": self.spanID,
+            "parent": self.parentTUPLE[1] if self.parentTUPLE else None,
+            "name": self.name,
+            "start": round(self.startTime, 6),
+            "ms": round(elapsedFLOAT * 1000, 3)
+        }
+        if excType is not None:
+            spanDICT["error"] = excType.__name__
+        spanDICT.update(self.attrDICT)
+        spanDEQUE.append(spanDICT)
+        if TRACE_FILE:
+            exportLogger.info(json.dumps(spanDICT, ensure_ascii=False, default=str))
+        return False
+
+    def set(self, **attrDICT):
+        # 在 span 進行中補上屬性 (例如結果的數量)
+        self.attrDICT.update(attrDICT)
+
+
+def span(name, **attrDICT):
+    """
+    with span(name, **attrDICT): 計時一個階段；attrDICT 會一併記錄在 ring buffer / trace_file 中
+    """
+    return Span(name, **attrDICT)
+
+def traced(name):
+    """
+    以 span(name) 包住整個函式的 decorator
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def getStageStats(snapshotDICT=None):
+    """
+    回傳 {stage: {"count", "mean", "p50", "p95", "p99"}}，時間單位為毫秒 (由 histogram bucket 內插估計)
+    snapshotDICT 為 metrics.collect() / metrics.getSnapshot() 的結果，預設為 metrics.collect() (所有 worker 合併)
+    """
+    if snapshotDICT is None:
+        snapshotDICT = metrics.collect()
+    histogramDICT = snapshotDICT.get(stageHistogram.name)
+    if histogramDICT is None:
+        return {}
+
+    statDICT = {}
+    for labelLIST, valueDICT in histogramDICT["values"]:
+        if not valueDICT["count"]:
+            continue
+        stageDICT = {"count": valueDICT["count"], "mean": round(valueDICT["sum"] / valueDICT["count"] * 1000, 3)}
+        for quantile in QUANTILE_LIST:
+            stageDICT["p{:g}".format(quantile * 100)] = round(metrics.getBucketQuantile(histogramDICT["bucketList"], valueDICT["buckets"], quantile) * 1000, 3)
+        statDICT[labelLIST[0]] = stageDICT
+    return dict(sorted(statDICT.items()))
+
+def getRecentSpanLIST(limitINT=100, traceID=None):
+    """
+    回傳 ring buffer 中最近的 span (新的在後)，指定 traceID 時只回傳該 trace 的 span
+    """
+    spanLIST = list(spanDEQUE)
+    if traceID is not None:
+        spanLIST = [s for s in spanLIST if s["trace"] == traceID]
+    return spanLIST[-limitINT:] if limitINT > 0 else spanLIST
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+    LINE webhook 非同步處理佇列
+
+    webhook 驗證簽章後只把收到的內容放進佇列並立即回傳 200，
+    由背景 worker 執行 Loki 語意判斷並回覆訊息，避免 Loki API 變慢時卡住 gunicorn worker。
+    背景 worker 是 daemon thread，結束時 (atexit) 最多等待 drainFLOAT 秒把佇列中剩下的 webhook 處理完，
+    超過時間仍未處理完的 webhook 會被丟棄 (記錄在 log 中)。
+
+    metrics:
+        webhook_queue_depth               佇列中等待處理的數量 (所有 worker 相加)
+        webhook_queue_wait_seconds        從收到 webhook 到 worker 開始處理的時間
+        webhook_end_to_end_seconds        從收到 webhook 到處理完成 (已回覆) 的時間
+        webhook_queue_rejected_total      佇列已滿，改為同步處理的次數
+"""
+
+from queue import Queue, Full
+from threading import Lock, Thread
+import atexit
+import os
+import time
+
+from bot_logging import getLogger
+import metrics
+
+logger = getLogger(__name__)
+
+queueDepthGauge = metrics.gauge("webhook_queue_depth", "佇列中等待處理的 webhook 數量", aggregateSTR="sum")
+queueWaitHistogram = metrics.histogram("webhook_queue_wait_seconds", "從收到 webhook 到 worker 開始處理的時間")
+endToEndHistogram = metrics.histogram("webhook_end_to_end_seconds", "從收到 webhook 到處理完成的時間")
+rejectedCounter = metrics.counter("webhook_queue_rejected_total", "佇列已滿改為同步處理的次數")
+
+
+class WebhookQueue():
+    def __init__(self, handlerFUNC, workerINT=4, queueSizeINT=1000, drainFLOAT=10):
+        """
+        input
+            handlerFUNC     FUNC    處理函式，會以 handlerFUNC(payload, receivedTime) 呼叫
+            workerINT       INT     背景 worker 數量
+            queueSizeINT    INT     佇列上限
+            drainFLOAT      FLOAT   結束時等待佇列處理完的秒數
+        """
+        self.handlerFUNC = handlerFUNC
+        self.workerINT = workerINT
+        self.drainFLOAT = drainFLOAT
+        self.eventQueue = Queue(maxsize=queueSizeINT)
+        self.workerLIST = []
+        self.workerPID = None
+        self.lock = Lock()
+
+    def start(self):
+        # gunicorn --preload 時 fork 前建立的 thread 不會被帶到子行程，因此以 pid 判斷是否需要重新啟動
+        with self.lock:
+            if self.workerPID == os.getpid():
+                return
+            firstBOOL = self.workerPID is None
+            self.workerPID = os.getpid()
+            self.workerLIST = []
+            for i in range(self.workerINT):
+                worker = Thread(target=self.work, name="webhook-worker-{}".format(i), daemon=True)
+                worker.start()
+                self.workerLIST.append(worker)
+            if firstBOOL:
+                atexit.register(self.drain)
+
+    def put(self, payload, receivedTime=None):
+        """
+        將 payload 放入佇列，成功回傳 True
+        佇列已滿時直接在呼叫端同步處理並回傳 False，不會丟掉訊息
+        """
+        if receivedTime is None:
+            receivedTime = time.time()
+
+        self.start()
+        try:
+            self.eventQueue.put_nowait((payload, receivedTime))
+            queueDepthGauge.set(self.eventQueue.qsize())
+            return True
+        except Full:
+            rejectedCounter.inc()
+            self.process(payload, receivedTime)
+            return False
+
+    def getDepth(self):
+        return self.eventQueue.qsize()
+
+    def process(self, payload, receivedTime):
+        try:
+            self.handlerFUNC(payload, receivedTime)
+        except Exception as e:
+            logger.error("[ERROR] WebhookQueue => %s", str(e))
+        endToEndHistogram.observe(time.time() - receivedTime)
+
+    def work(self):
+        while True:
+            payload, receivedTime = self.eventQueue.get()
+            queueDepthGauge.set(self.eventQueue.qsize())
+            queueWaitHistogram.observe(time.time() - receivedTime)
+            self.process(payload, receivedTime)
+            self.eventQueue.task_done()
+
+    def drain(self, timeoutFLOAT=None):
+        """
+        等待佇列中的 webhook 處理完 (結束前使用)，回傳是否已全部處理完
+        """
+        if self.workerPID != os.getpid():
+            return self.eventQueue.unfinished_tasks == 0
+        deadline = time.time() + (self.drainFLOAT if timeoutFLOAT is None else timeoutFLOAT)
+        while self.eventQueue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+        if self.eventQueue.unfinished_tasks:
+            logger.error("[ERROR] WebhookQueue => %d webhook(s) not processed before exit", self.eventQueue.unfinished_tasks)
+            return False
+        return True